@@ -0,0 +1 @@
+# 분석 파이프라인 마이크로 벤치마크 (python -m bench)
\ No newline at end of file
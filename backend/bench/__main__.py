@@ -0,0 +1,89 @@
+# 벤치마크 실행 (backend 디렉터리에서)
+#
+#   python -m bench [--corpus 200] [--seed 20240101] [--repeat 3] [--warmup 1]
+#                   [--filter analysis.] [--alloc-calls 50] [--samples] [--output result.json]
+#
+# 결과는 JSON (meta: 실행 환경과 입력, benchmarks: 이름별 통계)으로 --output 파일이나
+# 표준 출력에 쓰고, 진행 상황은 표준 오류에 쓴다.
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+# 벤치마크 중 요청 로그가 측정에 섞이지 않도록 (직접 설정한 값이 있으면 그대로)
+os.environ.setdefault('SAJU_LOG_LEVEL', 'WARNING')
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from bench.cases import build_benchmarks
+from bench.corpus import DEFAULT_SEED, DEFAULT_SIZE, birth_corpus
+from bench.measure import measure_allocations, summarize, time_calls
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BACKEND_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench', description="분석 파이프라인 마이크로 벤치마크")
+    parser.add_argument('--corpus', type=int, default=DEFAULT_SIZE, help=f"출생 일시 개수 (기본 {DEFAULT_SIZE})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f"입력 시드 (기본 {DEFAULT_SEED})")
+    parser.add_argument('--repeat', type=int, default=3, help="입력 목록 반복 횟수 (기본 3)")
+    parser.add_argument('--warmup', type=int, default=1, help="측정 전 반복 횟수 (기본 1)")
+    parser.add_argument('--filter', action='append', default=[], help="이름에 이 문자열이 들어간 벤치마크만 (여러 번 지정 가능)")
+    parser.add_argument('--alloc-calls', type=int, default=50, help="할당 측정에 쓸 호출 수 (0이면 생략, 기본 50)")
+    parser.add_argument('--samples', action='store_true', help="호출별 시간(ns) 원자료도 기록")
+    parser.add_argument('--output', help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    from logic.serializer import ENCODER_NAME
+
+    births = birth_corpus(args.corpus, args.seed)
+    benchmarks = build_benchmarks(births)
+    if args.filter:
+        benchmarks = [bench for bench in benchmarks if any(text in bench.name for text in args.filter)]
+
+    results = {}
+    for bench in benchmarks:
+        samples = time_calls(bench, args.repeat, args.warmup)
+        result = summarize(samples)
+        if args.alloc_calls > 0:
+            result.update(measure_allocations(bench, args.alloc_calls))
+        if args.samples:
+            result['samples_ns'] = samples
+        results[bench.name] = result
+        print(f"  {bench.name:<40} mean {result['mean_us']:9.2f} us  p50 {result['p50_us']:9.2f}  "
+              f"p99 {result['p99_us']:9.2f}", file=sys.stderr)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'json_encoder': ENCODER_NAME,
+            'corpus_size': len(births),
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+            'alloc_calls': args.alloc_calls
+        },
+        'benchmarks': results
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# 벤치마크 대상 목록
+#
+#   calculator.*  SajuCalculator 팔자 계산 (표시용 dict / 정수 Pillars)
+#   legacy.*      기존 analyzer.py의 팔자 계산
+#   analysis.*    logic.analysis의 분석기 클래스 (파이프라인 노드 입력 그대로)
+#   pipeline.*    분석기가 아닌 공유 노드 (십성 원자료, 파생 특징)
+#   report.*      ReportGenerator.generate_comprehensive_report
+#   engine.*      SajuAnalyzer.analyze 전체 (결과 캐시 없이)
+#   e2e.*         Flask 테스트 클라이언트로 POST /analysis (캐시 비움 / 캐시 적중)
+from .measure import Benchmark
+
+def build_benchmarks(births):
+    """출생 일시 목록으로 모든 벤치마크를 만듦 (분석기 입력은 미리 계산해 둠)"""
+    from logic import analyzer as legacy
+    from logic.saju_analyzer import get_engine
+
+    engine = get_engine()
+    calculator = engine.calculator
+    benchmarks = [
+        Benchmark('calculator.calculate_saju_pillars', lambda birth: calculator.calculate_saju_pillars(*birth), births),
+        Benchmark('calculator.calculate_pillars', lambda birth: calculator.calculate_pillars(*birth), births),
+        Benchmark('legacy.calculate_saju_pillars', lambda birth: legacy.calculate_saju_pillars(*birth), births),
+    ]
+
+    # 차트마다 모든 노드 값을 한 번 계산해 두고 각 노드를 그 입력으로 따로 잰다
+    pipeline = engine.pipeline
+    charts = []
+    for birth in births:
+        values = {'saju_pillars': calculator.calculate_pillars(*birth), 'birth_year': birth[0]}
+        for _ in pipeline.run(values, list(pipeline.nodes)):
+            pass
+        charts.append(values)
+
+    for node, (func, inputs) in pipeline.nodes.items():
+        items = [tuple(values[name] for name in inputs) for values in charts]
+        if node == 'comprehensive_report':
+            # 리포트 노드는 입력 섹션을 dict로 묶어 ReportGenerator에 넘김
+            generate = engine.report_generator.generate_comprehensive_report
+            items = [dict(zip(inputs, args)) for args in items]
+            benchmarks.append(Benchmark('report.ReportGenerator', generate, items))
+            continue
+        owner = getattr(func, '__self__', None)
+        if owner is not None and type(owner).__module__.startswith('logic.analysis.'):
+            name = f"analysis.{type(owner).__name__}"
+        else:
+            name = f"pipeline.{node}"
+        benchmarks.append(Benchmark(name, lambda args, func=func: func(*args), items))
+
+    benchmarks.append(Benchmark(
+        'engine.analyze', lambda birth: engine.analyze(*birth, use_cache=False), births
+    ))
+
+    from main import app
+    client = app.test_client()
+    bodies = [
+        {'year': year, 'month': month, 'day': day, 'hour': hour, 'minute': minute}
+        for year, month, day, hour, minute in births
+    ]
+    post = lambda body: client.post('/analysis', json=body)
+    benchmarks.append(Benchmark('e2e.analysis', post, bodies, setup=lambda _: engine.result_cache.clear()))
+    benchmarks.append(Benchmark('e2e.analysis_cached', post, bodies))
+    return benchmarks
@@ -0,0 +1,182 @@
+# 벤치마크 회귀 검사 (저장된 기준선과 비교)
+#
+#   python -m bench.compare [--baseline bench/baseline.json] [--runs 10] [--threshold 5]
+#                           [--alpha 0.01] [--filter calculator.] [--output compare.json] [--update]
+#
+# python -m bench를 새 프로세스로 --runs번 돌려(기준선과 같은 입력 크기/시드/반복 횟수)
+# 벤치마크마다 실행별 p50을 모으고, 기준선의 실행별 p50과 단측 Mann-Whitney U 검정을
+# 한다. 한 프로세스 안의 호출들은 같은 방향으로 함께 흔들리므로(CPU 클럭, 메모리 배치)
+# 호출 하나가 아니라 실행 하나를 표본으로 삼는다. p값이 --alpha보다 작고 p50 중앙값이
+# --threshold% 넘게 느려진 벤치마크가 하나라도 있으면 종료 코드 1 (기준선을 쓸 수
+# 없거나 실행이 실패하면 2).
+# --update는 비교 대신 이번 측정으로 기준선 파일을 새로 쓴다. 기준선은 측정한 기계에
+# 묶이므로 비교는 기준선을 만든 것과 같은 환경에서 해야 의미가 있다.
+import argparse
+import datetime
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from bench.corpus import DEFAULT_SEED, DEFAULT_SIZE
+from bench.measure import mann_whitney_greater
+
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, 'bench', 'baseline.json')
+# 환경이 다르면 시간 비교가 의미 없으므로 경고할 meta 항목
+ENVIRONMENT_KEYS = ('python', 'implementation', 'platform', 'json_encoder')
+
+def load_baseline(path):
+    """기준선 JSON 읽기 (실행별 p50이 없으면 ValueError)"""
+    with open(path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    benchmarks = baseline.get('benchmarks', {})
+    if not benchmarks or any('run_p50_us' not in result for result in benchmarks.values()):
+        raise ValueError(f"{path}: 실행별 p50(run_p50_us)이 없습니다 (python -m bench.compare --update로 만든 파일이 필요합니다)")
+    return baseline
+
+def run_suite(runs, corpus_size, seed, repeat, warmup, filters):
+    """python -m bench를 runs번 새 프로세스로 돌려 (마지막 실행 meta, 이름별 실행 p50 목록) 반환
+
+    실행이 실패하면 RuntimeError.
+    """
+    command = [sys.executable, '-m', 'bench', '--corpus', str(corpus_size), '--seed', str(seed),
+               '--repeat', str(repeat), '--warmup', str(warmup), '--alloc-calls', '0']
+    for text in filters:
+        command += ['--filter', text]
+
+    meta = {}
+    run_p50 = {}
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'run.json')
+        for run in range(runs):
+            print(f"[{run + 1}/{runs}] python -m bench", file=sys.stderr)
+            completed = subprocess.run(command + ['--output', output], cwd=BACKEND_DIR,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if completed.returncode != 0:
+                raise RuntimeError(f"벤치마크 실행 실패 (종료 코드 {completed.returncode})\n{completed.stderr}")
+            with open(output, encoding='utf-8') as f:
+                report = json.load(f)
+            meta = report['meta']
+            for name, result in report['benchmarks'].items():
+                run_p50.setdefault(name, []).append(result['p50_us'])
+    return meta, run_p50
+
+def compare_benchmark(baseline_runs, candidate_runs, threshold, alpha):
+    """기준선/새 실행별 p50 -> 비교 결과 (verdict: slower, faster, same)"""
+    base = statistics.median(baseline_runs)
+    new = statistics.median(candidate_runs)
+    change = new / base - 1 if base else 0.0
+    p_slower = mann_whitney_greater(baseline_runs, candidate_runs)
+    p_faster = mann_whitney_greater(candidate_runs, baseline_runs)
+    if p_slower < alpha and change > threshold:
+        verdict = 'slower'
+    elif p_faster < alpha and change < -threshold:
+        verdict = 'faster'
+    else:
+        verdict = 'same'
+    return {
+        'verdict': verdict,
+        'baseline_p50_us': base,
+        'p50_us': new,
+        'change': round(change, 4),
+        'p_slower': round(p_slower, 6),
+        'p_faster': round(p_faster, 6)
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench.compare', description="저장된 기준선과 벤치마크 비교")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="기준선 JSON (기본 bench/baseline.json)")
+    parser.add_argument('--runs', type=int, default=10, help="python -m bench 실행 횟수 (기본 10)")
+    parser.add_argument('--threshold', type=float, default=5.0, help="회귀로 볼 p50 증가율(%%, 기본 5)")
+    parser.add_argument('--alpha', type=float, default=0.01, help="유의 수준 (기본 0.01)")
+    parser.add_argument('--filter', action='append', default=[], help="이름에 이 문자열이 들어간 벤치마크만 (여러 번 지정 가능)")
+    parser.add_argument('--corpus', type=int, help=f"--update 때 출생 일시 개수 (기본 기준선 값, 없으면 {DEFAULT_SIZE})")
+    parser.add_argument('--repeat', type=int, help="--update 때 입력 목록 반복 횟수 (기본 기준선 값, 없으면 3)")
+    parser.add_argument('--output', help="비교 결과 JSON 파일")
+    parser.add_argument('--update', action='store_true', help="비교하지 않고 이번 측정으로 기준선을 새로 씀")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    try:
+        baseline = load_baseline(args.baseline)
+    except (OSError, ValueError) as e:
+        if not args.update:
+            print(f"기준선을 읽을 수 없습니다: {e}", file=sys.stderr)
+            return 2
+    base_meta = baseline['meta'] if baseline else {}
+    corpus_size = base_meta.get('corpus_size', DEFAULT_SIZE)
+    seed = base_meta.get('seed', DEFAULT_SEED)
+    repeat = base_meta.get('repeat', 3)
+    warmup = base_meta.get('warmup', 1)
+    if args.update:
+        corpus_size = args.corpus or corpus_size
+        repeat = args.repeat or repeat
+
+    try:
+        meta, run_p50 = run_suite(args.runs, corpus_size, seed, repeat, warmup, args.filter)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    if args.update:
+        meta = {key: value for key, value in meta.items() if key != 'alloc_calls'}
+        meta['timestamp'] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        meta['runs'] = args.runs
+        report = {
+            'meta': meta,
+            'benchmarks': {
+                name: {'p50_us': statistics.median(values), 'run_p50_us': values}
+                for name, values in run_p50.items()
+            }
+        }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+        print(f"기준선을 저장했습니다: {args.baseline}", file=sys.stderr)
+        return 0
+
+    for key in ENVIRONMENT_KEYS:
+        if base_meta.get(key) != meta.get(key):
+            print(f"경고: 기준선과 실행 환경이 다릅니다 ({key}: {base_meta.get(key)} -> {meta.get(key)})", file=sys.stderr)
+
+    results = {}
+    for name, values in run_p50.items():
+        base = baseline['benchmarks'].get(name)
+        if base is None:
+            results[name] = {'verdict': 'new', 'p50_us': statistics.median(values)}
+            print(f"  {name:<40} 기준선에 없음", file=sys.stderr)
+            continue
+        result = compare_benchmark(base['run_p50_us'], values, args.threshold / 100, args.alpha)
+        results[name] = result
+        print(f"  {name:<40} p50 {result['baseline_p50_us']:9.2f} -> {result['p50_us']:9.2f} us  "
+              f"{result['change'] * 100:+6.1f}%  p {min(result['p_slower'], result['p_faster']):.3f}  "
+              f"{result['verdict']}", file=sys.stderr)
+
+    regressions = sorted(name for name, result in results.items() if result['verdict'] == 'slower')
+    if args.output:
+        report = {
+            'meta': {
+                'baseline': args.baseline,
+                'baseline_commit': base_meta.get('commit'),
+                'commit': meta.get('commit'),
+                'runs': args.runs,
+                'threshold': args.threshold,
+                'alpha': args.alpha
+            },
+            'regressions': regressions,
+            'benchmarks': results
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+    if regressions:
+        print(f"느려진 벤치마크 {len(regressions)}개: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    print("유의한 회귀 없음", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
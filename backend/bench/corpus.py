@@ -0,0 +1,67 @@
+# 벤치마크 입력 (고정 시드의 출생 일시 목록)
+#
+# 같은 시드와 크기면 파이썬 버전과 실행 환경에 관계없이 항상 같은 목록이 나온다
+# (random.Random의 정수 시드/randint는 버전 간에 결과가 같다). 앞쪽에는 경계에
+# 가까운 고정 사례를 두고 나머지는 무작위로 채운다.
+#
+# 부하 테스트용 request_mix()는 실제 요청에 가깝게 만든다: 사용자 나이는 30대 초반에
+# 몰려 있고, 분은 절반 정도가 정각이며, 일부 요청은 소수의 인기 출생 정보(같은 사람이
+# 다시 조회하거나 공유된 링크)가 반복된다. 나이는 고정 기준 연도(reference_year)에서
+# 빼므로 같은 시드면 실행하는 해가 달라도 같은 요청 목록이 나온다.
+import calendar
+import random
+
+DEFAULT_SEED = 20240101
+DEFAULT_SIZE = 200
+
+# 테이블 범위 양 끝, 윤일, 야자시(23시대), 입춘/동지 무렵
+FIXED_BIRTHS = (
+    (1900, 1, 1, 0, 0),
+    (2100, 12, 31, 23, 59),
+    (2000, 2, 29, 12, 0),
+    (1990, 5, 15, 23, 30),
+    (1984, 2, 4, 11, 0),
+    (2024, 2, 4, 17, 27),
+    (1999, 12, 22, 7, 0),
+    (1970, 1, 1, 0, 30),
+)
+
+def birth_corpus(size=DEFAULT_SIZE, seed=DEFAULT_SEED):
+    """(연, 월, 일, 시, 분) size개 (1900-2100년, 일은 1-28일)"""
+    rng = random.Random(seed)
+    births = list(FIXED_BIRTHS[:size])
+    while len(births) < size:
+        births.append((rng.randint(1900, 2100), rng.randint(1, 12), rng.randint(1, 28),
+                       rng.randint(0, 23), rng.randint(0, 59)))
+    return births
+
+DEFAULT_HOT_RATIO = 0.3
+DEFAULT_HOT_SIZE = 20
+DEFAULT_REFERENCE_YEAR = 2024
+
+def _user_birth(rng, reference_year):
+    """나이 분포(평균 32세, 표준편차 10, 15-80세)를 따르는 출생 일시 하나"""
+    age = min(max(round(rng.gauss(32, 10)), 15), 80)
+    year = reference_year - age
+    month = rng.randint(1, 12)
+    day = rng.randint(1, calendar.monthrange(year, month)[1])
+    minute = 0 if rng.random() < 0.5 else rng.randint(0, 59)
+    return (year, month, day, rng.randint(0, 23), minute)
+
+def request_mix(count, seed=DEFAULT_SEED, hot_ratio=DEFAULT_HOT_RATIO, hot_size=DEFAULT_HOT_SIZE,
+                reference_year=DEFAULT_REFERENCE_YEAR):
+    """부하 테스트 요청 순서대로의 출생 일시 count개
+
+    hot_ratio 비율은 hot_size개 인기 출생 정보에서 순위에 반비례하는 확률(1/순위)로
+    고르고, 나머지는 매번 새로 만든다. 나이는 reference_year 기준이다.
+    """
+    rng = random.Random(seed)
+    hot = [_user_birth(rng, reference_year) for _ in range(hot_size)]
+    weights = [1 / rank for rank in range(1, hot_size + 1)]
+    births = []
+    for _ in range(count):
+        if hot and rng.random() < hot_ratio:
+            births.append(rng.choices(hot, weights)[0])
+        else:
+            births.append(_user_birth(rng, reference_year))
+    return births
@@ -0,0 +1,257 @@
+# 로컬 부하 테스트 (워커 모델 비교)
+#
+#   python -m bench.load [--configs sync,gthread,async] [--concurrency 1,8,32]
+#                        [--duration 10] [--workers 2] [--threads 4] [--output load.json]
+#
+# 설정마다 서버를 로컬에서 띄우고, 고정 동시 접속 수(closed loop: 접속마다 응답을
+# 받으면 바로 다음 요청)로 POST /analysis를 보내 처리량과 지연 p50/p95/p99를 잰다.
+# 요청 본문은 bench.corpus.request_mix (인기 출생 정보 반복 포함) 순서를 따른다.
+#   sync     gunicorn_config.py 그대로 (sync 워커)
+#   gthread  같은 설정에 --worker-class gthread --threads N
+#   async    같은 설정에 uvicorn 워커로 main:asgi_app (분석은 프로세스 풀)
+#   dev      Flask 개발 서버 (python main.py, gunicorn 없이 도구 점검용)
+# 설치되지 않은 서버(gunicorn, uvicorn)가 필요한 설정은 건너뛴다. 부하 생성기는
+# 한 스레드의 asyncio 클라이언트이므로 client_cpu가 1에 가까우면 생성기가 병목이다.
+import argparse
+import asyncio
+import datetime
+import http.client
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from bench.corpus import DEFAULT_HOT_RATIO, DEFAULT_REFERENCE_YEAR, DEFAULT_SEED, request_mix
+from bench.measure import percentile
+
+HOST = '127.0.0.1'
+DEFAULT_PORT = 18000
+DEFAULT_REQUESTS = 20000
+START_TIMEOUT = 60
+
+def server_command(config, port, workers, threads):
+    """설정 이름 -> (서버 실행 명령, 필요한 모듈) (알 수 없는 이름이면 ValueError)"""
+    gunicorn = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_config.py',
+                '--bind', f"{HOST}:{port}", '--workers', str(workers)]
+    if config == 'sync':
+        return gunicorn + ['main:app'], ('gunicorn',)
+    if config == 'gthread':
+        return gunicorn + ['--worker-class', 'gthread', '--threads', str(threads), 'main:app'], ('gunicorn',)
+    if config == 'async':
+        return gunicorn + ['--worker-class', 'uvicorn.workers.UvicornWorker', 'main:asgi_app'], ('gunicorn', 'uvicorn')
+    if config == 'dev':
+        return [sys.executable, 'main.py'], ()
+    raise ValueError(f"알 수 없는 설정: {config}")
+
+def wait_until_ready(port, process):
+    """/health가 200을 돌려줄 때까지 기다림 (서버가 먼저 종료되면 RuntimeError)"""
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 시작 중 종료되었습니다 (종료 코드 {process.returncode})")
+        try:
+            connection = http.client.HTTPConnection(HOST, port, timeout=2)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{START_TIMEOUT}초 안에 서버가 준비되지 않았습니다")
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=20)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def build_payloads(port, births):
+    """출생 일시 목록 -> 그대로 보낼 HTTP/1.1 요청 바이트"""
+    payloads = []
+    for year, month, day, hour, minute in births:
+        body = json.dumps({'year': year, 'month': month, 'day': day, 'hour': hour, 'minute': minute}).encode()
+        head = (f"POST /analysis HTTP/1.1\r\nHost: {HOST}:{port}\r\nContent-Type: application/json\r\n"
+                f"Accept-Encoding: gzip\r\nContent-Length: {len(body)}\r\n\r\n")
+        payloads.append(head.encode('latin-1') + body)
+    return payloads
+
+async def send_request(reader, writer, payload):
+    """요청 하나를 보내고 (상태 코드, 서버가 연결을 닫는지) 반환 (본문은 Content-Length만큼 읽음)"""
+    writer.write(payload)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("응답 전에 연결이 닫혔습니다")
+    status = int(status_line.split()[1])
+    close = status_line.startswith(b'HTTP/1.0')
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        name = name.strip().lower()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'connection':
+            close = value.strip().lower() == 'close'
+    await reader.readexactly(length)
+    return status, close
+
+class LoadResult:
+    """한 단계(동시 접속 수 하나)의 요청별 지연과 상태"""
+
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}
+
+    def record(self, status, latency):
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status == 200:
+            self.latencies.append(latency)
+
+async def run_client(port, payloads, cursor, deadline, result, request_timeout):
+    """연결 하나로 deadline까지 요청을 연달아 보냄 (서버가 닫으면 다시 연결, 연결 시간도 지연에 포함)"""
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        payload = payloads[next(cursor) % len(payloads)]
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(HOST, port), request_timeout)
+            status, close = await asyncio.wait_for(send_request(reader, writer, payload), request_timeout)
+        except asyncio.TimeoutError:
+            status, close = 'timeout', True
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+            status, close = 'error', True
+        result.record(status, time.perf_counter() - started)
+        if close and writer is not None:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+async def run_level(port, payloads, cursor, concurrency, duration, request_timeout):
+    result = LoadResult()
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        run_client(port, payloads, cursor, deadline, result, request_timeout) for _ in range(concurrency)
+    ))
+    return result
+
+def summarize_level(result, elapsed, client_cpu):
+    latencies = sorted(result.latencies)
+    ok = len(latencies)
+    to_ms = lambda seconds: round(seconds * 1000, 3)
+    summary = {
+        'requests': sum(result.statuses.values()),
+        'ok': ok,
+        'errors': {str(status): count for status, count in result.statuses.items() if status != 200},
+        'rps': round(ok / elapsed, 1),
+        'client_cpu': round(client_cpu / elapsed, 2)
+    }
+    if latencies:
+        summary.update({
+            'mean_ms': to_ms(sum(latencies) / ok),
+            'p50_ms': to_ms(percentile(latencies, 0.50)),
+            'p95_ms': to_ms(percentile(latencies, 0.95)),
+            'p99_ms': to_ms(percentile(latencies, 0.99)),
+            'max_ms': to_ms(latencies[-1])
+        })
+    return summary
+
+def run_config(config, args, payloads):
+    """서버 하나를 띄워 모든 동시 접속 수 단계를 돌리고 단계별 결과 목록 반환"""
+    command, modules = server_command(config, args.port, args.workers, args.threads)
+    missing = [name for name in modules if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"[{config}] 건너뜀: {', '.join(missing)} 미설치", file=sys.stderr)
+        return None
+
+    env = dict(os.environ, PORT=str(args.port))
+    log_path = os.path.join(args.log_dir, f"load-{config}.log")
+    with open(log_path, 'w') as log:
+        process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+        try:
+            wait_until_ready(args.port, process)
+            cursor = iter(range(sys.maxsize))
+            if args.warmup > 0:
+                asyncio.run(run_level(args.port, payloads, cursor, max(args.concurrency), args.warmup, args.request_timeout))
+            levels = []
+            for concurrency in args.concurrency:
+                cpu_started = time.process_time()
+                started = time.perf_counter()
+                result = asyncio.run(run_level(args.port, payloads, cursor, concurrency, args.duration, args.request_timeout))
+                summary = summarize_level(result, time.perf_counter() - started, time.process_time() - cpu_started)
+                summary['concurrency'] = concurrency
+                levels.append(summary)
+                print(f"[{config}] c={concurrency:<4} {summary['rps']:8.1f} req/s  "
+                      f"p50 {summary.get('p50_ms', 0):8.2f}  p95 {summary.get('p95_ms', 0):8.2f}  "
+                      f"p99 {summary.get('p99_ms', 0):8.2f} ms  errors {summary['errors'] or '-'}  "
+                      f"client_cpu {summary['client_cpu']}", file=sys.stderr)
+            return levels
+        finally:
+            stop_server(process)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench.load', description="로컬 부하 테스트 (워커 모델 비교)")
+    parser.add_argument('--configs', default='sync,gthread,async', help="쉼표로 구분한 설정 (sync, gthread, async, dev)")
+    parser.add_argument('--concurrency', default='1,8,32', help="쉼표로 구분한 동시 접속 수 (기본 1,8,32)")
+    parser.add_argument('--duration', type=float, default=10, help="단계별 측정 시간(초, 기본 10)")
+    parser.add_argument('--warmup', type=float, default=3, help="측정 전 최대 동시 접속으로 보내는 시간(초, 기본 3)")
+    parser.add_argument('--workers', type=int, default=2, help="gunicorn 워커 수 (기본 2, gunicorn_config.py와 같음)")
+    parser.add_argument('--threads', type=int, default=4, help="gthread 워커당 스레드 수 (기본 4)")
+    parser.add_argument('--request-timeout', type=float, default=30, help="요청 하나의 제한 시간(초, 기본 30)")
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS, help=f"요청 본문 목록 길이 (기본 {DEFAULT_REQUESTS})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f"요청 목록 시드 (기본 {DEFAULT_SEED})")
+    parser.add_argument('--hot-ratio', type=float, default=DEFAULT_HOT_RATIO, help=f"인기 출생 정보 비율 (기본 {DEFAULT_HOT_RATIO})")
+    parser.add_argument('--reference-year', type=int, default=DEFAULT_REFERENCE_YEAR,
+                        help=f"사용자 나이를 계산하는 기준 연도 (기본 {DEFAULT_REFERENCE_YEAR})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"서버 포트 (기본 {DEFAULT_PORT})")
+    parser.add_argument('--log-dir', default=os.environ.get('TMPDIR', '/tmp'), help="서버 로그 디렉터리")
+    parser.add_argument('--output', help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+    args.concurrency = [int(value) for value in args.concurrency.split(',') if value]
+    configs = [value.strip() for value in args.configs.split(',') if value.strip()]
+    for config in configs:
+        server_command(config, args.port, args.workers, args.threads)
+
+    payloads = build_payloads(args.port, request_mix(args.requests, args.seed, args.hot_ratio,
+                                                         reference_year=args.reference_year))
+    results = {}
+    for config in configs:
+        levels = run_config(config, args, payloads)
+        if levels is not None:
+            results[config] = levels
+
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'cpu_count': os.cpu_count(),
+            'workers': args.workers,
+            'threads': args.threads,
+            'duration': args.duration,
+            'requests': args.requests,
+            'seed': args.seed,
+            'hot_ratio': args.hot_ratio,
+            'reference_year': args.reference_year
+        },
+        'results': results
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
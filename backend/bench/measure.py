@@ -0,0 +1,143 @@
+# 벤치마크 측정 도구
+#
+# 호출 한 번마다 perf_counter_ns로 시간을 재고 평균/p50/p99 등을 낸다. 할당은
+# 시간 측정과 따로 tracemalloc을 켠 상태에서 일부 호출만 돌려 잰다 (tracemalloc이
+# 호출을 느리게 하므로 시간 측정에는 섞지 않는다). 파이썬은 호출 중 할당 횟수를
+# 직접 세는 방법을 제공하지 않으므로 호출당 최대 추가 메모리(peak_bytes)와
+# 호출 뒤 남은 메모리 블록 수 증감(net_blocks, sys.getallocatedblocks)을 보고한다.
+#
+# 회귀 비교(bench.compare)에는 Mann-Whitney U 검정을 쓴다. 실행(프로세스)마다 값이
+# 통째로 흔들리므로 호출 하나가 아니라 실행별 p50을 표본으로 삼고, 표본이 작으면
+# 순위합의 모든 배치를 세는 정확 검정, 크면 정규 근사를 쓴다.
+import gc
+import itertools
+import math
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, NamedTuple, Optional
+
+# 정확 검정으로 셀 배치 수 상한 (넘으면 정규 근사)
+EXACT_TEST_LIMIT = 200000
+
+class Benchmark(NamedTuple):
+    """이름, 입력 하나로 호출할 함수, 입력 목록, 호출 전 준비 함수(시간에서 제외)"""
+    name: str
+    func: Callable
+    items: list
+    setup: Optional[Callable] = None
+
+def time_calls(bench, repeat, warmup):
+    """입력 목록을 warmup번 돌린 뒤 repeat번 돌며 호출마다 걸린 시간(ns) 목록 반환"""
+    func, setup = bench.func, bench.setup
+    for _ in range(warmup):
+        for item in bench.items:
+            if setup is not None:
+                setup(item)
+            func(item)
+
+    samples = []
+    clock = time.perf_counter_ns
+    gc_enabled = gc.isenabled()
+    # 측정 도중 순환 GC가 끼어들어 특정 호출만 튀지 않도록 끄고, 반복 사이에 수거
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for item in bench.items:
+                if setup is not None:
+                    setup(item)
+                started = clock()
+                func(item)
+                samples.append(clock() - started)
+            gc.collect()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+def measure_allocations(bench, calls):
+    """앞쪽 calls개 입력의 호출당 평균 peak_bytes와 net_blocks"""
+    items = bench.items[:calls]
+    if not items:
+        return {'peak_bytes': 0, 'net_blocks': 0}
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    try:
+        for item in items:
+            if bench.setup is not None:
+                bench.setup(item)
+            gc.collect()
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            blocks_before = sys.getallocatedblocks()
+            bench.func(item)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return {
+        'peak_bytes': round(statistics.fmean(peaks)),
+        'net_blocks': round(statistics.fmean(blocks), 1)
+    }
+
+def percentile(sorted_values, fraction):
+    """정렬된 목록의 nearest-rank 백분위수"""
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+def summarize(samples_ns):
+    """호출 시간(ns) 목록 -> 통계 (마이크로초)"""
+    values = sorted(samples_ns)
+    to_us = lambda ns: round(ns / 1000, 3)
+    return {
+        'calls': len(values),
+        'mean_us': to_us(statistics.fmean(values)),
+        'p50_us': to_us(percentile(values, 0.50)),
+        'p99_us': to_us(percentile(values, 0.99)),
+        'min_us': to_us(values[0]),
+        'max_us': to_us(values[-1]),
+        'stdev_us': to_us(statistics.pstdev(values))
+    }
+
+def _average_ranks(values):
+    """입력 순서대로의 순위 (동점은 평균 순위, 1부터)와 동점 보정항 sum(t^3 - t)"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    tie_term = 0
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        ties = end - start + 1
+        tie_term += ties ** 3 - ties
+        start = end + 1
+    return ranks, tie_term
+
+def mann_whitney_greater(baseline, candidate):
+    """candidate가 baseline보다 크다는 단측 Mann-Whitney U 검정의 p값"""
+    n1, n2 = len(baseline), len(candidate)
+    if not n1 or not n2:
+        return 1.0
+    ranks, tie_term = _average_ranks(list(baseline) + list(candidate))
+    observed = sum(ranks[n1:])
+    n = n1 + n2
+    if math.comb(n, n2) <= EXACT_TEST_LIMIT:
+        total = extreme = 0
+        for group in itertools.combinations(ranks, n2):
+            total += 1
+            if sum(group) >= observed - 1e-9:
+                extreme += 1
+        return extreme / total
+
+    u = observed - n2 * (n2 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # 연속성 보정
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
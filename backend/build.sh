@@ -23,10 +23,17 @@ pip install --no-cache-dir flask-cors==4.0.0
 echo "Installing gunicorn==21.2.0..."
 pip install --no-cache-dir gunicorn==21.2.0
 
+echo "Installing uvicorn==0.34.3..."
+pip install --no-cache-dir uvicorn==0.34.3
+
 echo "Installing requests==2.31.0..."
 pip install --no-cache-dir requests==2.31.0
 
 echo "Installing python-multipart==0.0.6..."
 pip install --no-cache-dir python-multipart==0.0.6
 
+# 성능 경로 (numpy, orjson, brotli). 없으면 서버는 뜨지만 느린 대체 구현으로 동작
+echo "Installing requirements-perf.txt..."
+pip install --no-cache-dir -r requirements-perf.txt
+
 echo "✅ 빌드 완료!" 
\ No newline at end of file
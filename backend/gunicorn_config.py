@@ -12,4 +12,36 @@ max_requests_jitter = 50
 preload_app = True
 accesslog = '-'
 errorlog = '-'
-loglevel = 'info'
\ No newline at end of file
+loglevel = 'info'
+
+def on_starting(server):
+    """워커들이 함께 쓸 메트릭 디렉터리 준비 (이전 실행의 값은 지움)"""
+    from logic.metrics import prepare_metrics_dir
+    directory = prepare_metrics_dir(clear=True)
+    server.log.info(f"메트릭 디렉터리: {directory}")
+
+def on_exit(server):
+    """on_starting에서 임시로 만든 메트릭 디렉터리를 지움"""
+    from logic.metrics import remove_metrics_dir
+    remove_metrics_dir()
+
+def when_ready(server):
+    """마스터에서 분석 엔진과 역색인을 미리 생성 (워커는 fork 시 그대로 공유)"""
+    from logic.saju_analyzer import get_engine
+    from logic.chart_index import get_chart_index
+    get_engine()
+    get_chart_index()
+    server.log.info("사주 분석 엔진 준비 완료")
+
+def on_reload(server):
+    """HUP 재시작 시 데이터 파일을 다시 읽어 엔진을 교체하고 역색인도 새 엔진으로 다시 만듦"""
+    from logic.saju_analyzer import rebuild_engine
+    from logic.chart_index import get_chart_index
+    rebuild_engine()
+    get_chart_index()
+    server.log.info("사주 분석 엔진 재생성 완료")
+
+def child_exit(server, worker):
+    """종료된 워커의 메트릭 값을 archive 파일에 합침"""
+    from logic.metrics import archive_process
+    archive_process(worker.pid)
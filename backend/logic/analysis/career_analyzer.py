@@ -1,19 +1,20 @@
 # 직업운 분석 모듈
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
 class CareerAnalyzer:
     """직업운 분석을 담당하는 클래스"""
     
-    def analyze(self, saju_pillars, sipsung_data):
-        """직업운 분석 수행"""
+    def analyze(self, pillars, features):
+        """직업운 분석 수행 (features: 차트 공유 특징 ChartFeatures)"""
         try:
-            # 십성 리스트 생성
-            sipsung_list = list(sipsung_data.values()) if isinstance(sipsung_data, dict) else []
-            
             # 직업 관련 십성 분석
-            gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")  # 관리, 리더십
-            siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")    # 창의성, 전문성
-            jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")    # 재무, 사업
-            inseong_count = sipsung_list.count("편인") + sipsung_list.count("정인")      # 학문, 연구
-            bigyeop_count = sipsung_list.count("비견") + sipsung_list.count("겁재")     # 독립성, 경쟁
+            gwanseong_count = features.groups['관성']  # 관리, 리더십
+            siksang_count = features.groups['식상']    # 창의성, 전문성
+            jaeseong_count = features.groups['재성']   # 재무, 사업
+            inseong_count = features.groups['인성']    # 학문, 연구
+            bigyeop_count = features.groups['비겁']    # 독립성, 경쟁
             
             # 직업 유형 분석
             career_analysis = self._analyze_career_type(
@@ -33,7 +34,7 @@ class CareerAnalyzer:
             advice = self._generate_career_advice(career_analysis)
             
             # 주의할 사람 분석
-            caution_people = self._analyze_caution_people(sipsung_list)
+            caution_people = self._analyze_caution_people(features)
             
             return {
                 'title': career_analysis['type'],
@@ -45,7 +46,7 @@ class CareerAnalyzer:
                 'avatar_url': self._generate_avatar_url(career_analysis['type'])
             }
         except Exception as e:
-            print(f"직업운 분석 중 오류: {str(e)}")
+            logger.error("직업운 분석 중 오류: %s", e)
             return self._get_default_analysis()
     
     def _analyze_career_type(self, gwanseong, siksang, jaeseong, inseong, bigyeop):
@@ -138,13 +139,13 @@ class CareerAnalyzer:
         base_advice = advice_map.get(career_analysis['type'], '끊임없는 자기계발과 성실한 태도가 중요합니다.')
         return f"{base_advice} 특히 팀워크를 중시하고 동료들과의 관계를 원만하게 유지하는 것이 장기적인 성공의 비결입니다."
     
-    def _analyze_caution_people(self, sipsung_list):
+    def _analyze_caution_people(self, features):
         """주의해야 할 사람 유형 분석"""
-        if '겁재' in sipsung_list:
+        if features.has('겁재'):
             return '경쟁심이 강한 동료나 자신의 성과를 가로채려는 사람들을 주의하세요. 중요한 정보는 신중히 관리하는 것이 좋습니다.'
-        elif '상관' in sipsung_list:
+        elif features.has('상관'):
             return '비판적이거나 부정적인 태도를 가진 사람들을 주의하세요. 건설적인 비판과 악의적인 비난을 구분하는 지혜가 필요합니다.'
-        elif sipsung_list.count('편관') > 1:
+        elif features.ten_gods.get('편관', 0) > 1:
             return '권위적이거나 압박감을 주는 상사나 동료를 주의하세요. 자신의 의견을 당당하게 표현하되 예의를 지키는 것이 중요합니다.'
         else:
             return '직장에서 주의해야 할 사람은 당신의 성장을 방해하거나 부정적인 영향을 주는 사람들입니다. 긍정적인 관계에 집중하세요.'
@@ -1,5 +1,8 @@
 # 대운 분석 모듈
 import datetime
+from ..logger import get_logger
+
+logger = get_logger(__name__)
 
 class DaeunAnalyzer:
     """대운 분석을 담당하는 클래스"""
@@ -9,20 +12,17 @@ class DaeunAnalyzer:
     # 지지 순서
     JIJI = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
     
-    def analyze(self, saju_pillars, current_year=None):
+    def analyze(self, pillars, current_year=None):
         """대운 분석 수행"""
         try:
             if current_year is None:
                 current_year = datetime.datetime.now().year
 
-            # 생년 추출 (saju_pillars에서 year 정보 추출, 없으면 임시로 25세 가정)
-            try:
-                birth_year = int(saju_pillars['year']['year'])
-            except Exception:
-                birth_year = current_year - 25
+            # 팔자에는 생년 정보가 없으므로 임시로 25세 가정
+            birth_year = current_year - 25
 
             # 대운 계산
-            daeun_periods = self._calculate_daeun_periods(saju_pillars, birth_year, current_year)
+            daeun_periods = self._calculate_daeun_periods(pillars, birth_year, current_year)
             # 세운 계산
             seun_periods = self._generate_seun_periods(current_year)
             # 변화점 분석
@@ -39,10 +39,10 @@ class DaeunAnalyzer:
                 'future_outlook': future_outlook
             }
         except Exception as e:
-            print(f"대운 분석 중 오류: {str(e)}")
+            logger.error("대운 분석 중 오류: %s", e)
             return self._get_default_analysis()
 
-    def _calculate_daeun_periods(self, saju_pillars, birth_year, current_year):
+    def _calculate_daeun_periods(self, pillars, birth_year, current_year):
         """대운 기간 계산 (예시: 10년 단위로 5개 구간)"""
         periods = []
         for i in range(5):
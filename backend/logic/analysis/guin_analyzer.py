@@ -1,4 +1,9 @@
 # 귀인 분석 모듈
+from ..ganji_tables import STEMS_KOR, BRANCHES_KOR
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
 class GuinAnalyzer:
     """귀인 분석을 담당하는 클래스"""
     
@@ -23,10 +28,10 @@ class GuinAnalyzer:
         "임": "인", "계": "묘"
     }
     
-    def analyze(self, saju_pillars):
+    def analyze(self, pillars):
         """귀인 분석 수행"""
         try:
-            guin_result = self._calculate_guin(saju_pillars)
+            guin_result = self._calculate_guin(pillars)
             periods = self._analyze_by_period(guin_result)
             
             return {
@@ -37,16 +42,12 @@ class GuinAnalyzer:
                 'guin_found': guin_result
             }
         except Exception as e:
-            print(f"귀인 분석 중 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("귀인 분석 중 오류: %s", e)
             return self._get_default_analysis()
     
-    def _calculate_guin(self, saju_pillars):
+    def _calculate_guin(self, pillars):
         """사주 내 귀인 계산"""
-        ilgan = saju_pillars.get('day', {}).get('gan')
-        if not ilgan:
-            return {}
+        ilgan = STEMS_KOR[pillars.day_gan]
 
         guin_found = {}
         positions = ['year', 'month', 'day', 'hour']
@@ -56,7 +57,7 @@ class GuinAnalyzer:
         if ilgan in self.CHEONUL_TABLE:
             cheonul_jiji_list = self.CHEONUL_TABLE[ilgan]
             for pos in positions:
-                jiji = saju_pillars.get(pos, {}).get('ji')
+                jiji = BRANCHES_KOR[pillars.ji(pos)]
                 if jiji in cheonul_jiji_list:
                     if '천을귀인' not in guin_found:
                         guin_found['천을귀인'] = []
@@ -67,7 +68,7 @@ class GuinAnalyzer:
         if ilgan in self.MUNCHANG_TABLE:
             munchang_jiji = self.MUNCHANG_TABLE[ilgan]
             for pos in positions:
-                jiji = saju_pillars.get(pos, {}).get('ji')
+                jiji = BRANCHES_KOR[pillars.ji(pos)]
                 if jiji == munchang_jiji:
                     if '문창귀인' not in guin_found:
                         guin_found['문창귀인'] = []
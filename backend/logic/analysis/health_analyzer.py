@@ -1,20 +1,15 @@
 # 건강운 분석 모듈
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
 class HealthAnalyzer:
     """건강운 분석을 담당하는 클래스"""
-    
-    OHENG_GAN = {
-        "갑": "목", "을": "목", "병": "화", "정": "화", "무": "토", 
-        "기": "토", "경": "금", "신": "금", "임": "수", "계": "수"
-    }
-    OHENG_JIJI = {
-        "자": "수", "축": "토", "인": "목", "묘": "목", "진": "토", "사": "화", 
-        "오": "화", "미": "토", "신": "금", "유": "금", "술": "토", "해": "수"
-    }
 
-    def analyze(self, saju_pillars, sipsung_data):
-        """건강운 분석 수행"""
+    def analyze(self, pillars, features):
+        """건강운 분석 수행 (features: 차트 공유 특징 ChartFeatures)"""
         try:
-            oheng_analysis = self._analyze_oheng_health(saju_pillars)
+            oheng_analysis = self._analyze_oheng_health(features)
             health_style = self._get_health_style(oheng_analysis)
             
             return {
@@ -27,24 +22,12 @@ class HealthAnalyzer:
                 'management_advice': self._generate_management_advice(health_style, oheng_analysis)
             }
         except Exception as e:
-            print(f"건강운 분석 중 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("건강운 분석 중 오류: %s", e)
             return self._get_default_analysis()
 
-    def _analyze_oheng_health(self, saju_pillars):
+    def _analyze_oheng_health(self, features):
         """오행 기반 건강 분석"""
-        oheng_count = {"목": 0, "화": 0, "토": 0, "금": 0, "수": 0}
-        
-        for position in ['year', 'month', 'day', 'hour']:
-            pillar = saju_pillars.get(position, {})
-            gan = pillar.get('gan')
-            jiji = pillar.get('ji')
-            
-            if gan and gan in self.OHENG_GAN:
-                oheng_count[self.OHENG_GAN[gan]] += 1
-            if jiji and jiji in self.OHENG_JIJI:
-                oheng_count[self.OHENG_JIJI[jiji]] += 1
+        oheng_count = features.elements
         
         dominant = max(oheng_count, key=oheng_count.get) if any(oheng_count.values()) else None
         weak = min(oheng_count, key=oheng_count.get) if any(oheng_count.values()) else None
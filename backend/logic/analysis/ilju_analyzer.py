@@ -2,6 +2,12 @@
 import json
 import os
 
+from ..ganji_tables import STEMS_KOR, BRANCHES_KOR
+from ..pillars import Pillars
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
 class IljuAnalyzer:
     """일주 분석을 담당하는 클래스"""
     
@@ -12,18 +18,18 @@ class IljuAnalyzer:
             with open(data_path, 'r', encoding='utf-8') as f:
                 self.ilju_data = json.load(f)
         except FileNotFoundError:
-            print(f"오류: ilju_data.json 파일을 찾을 수 없습니다. 경로: {data_path}")
+            logger.error("ilju_data.json 파일을 찾을 수 없습니다. 경로: %s", data_path)
             self.ilju_data = {}
         except json.JSONDecodeError:
-            print(f"오류: ilju_data.json 파일 파싱 실패.")
+            logger.error("ilju_data.json 파일 파싱 실패")
             self.ilju_data = {}
 
-    def analyze(self, day_pillar):
+    def analyze(self, pillars):
         """일주 분석 수행"""
-        if not isinstance(day_pillar, dict) or 'gan' not in day_pillar or 'ji' not in day_pillar:
+        if not isinstance(pillars, Pillars):
             return self._get_default_analysis("정보 없음")
 
-        ilju_key = f"{day_pillar['gan']}{day_pillar['ji']}"
+        ilju_key = f"{STEMS_KOR[pillars.day_gan]}{BRANCHES_KOR[pillars.day_ji]}"
         ilju_info = self.ilju_data.get(ilju_key)
         
         if not ilju_info:
@@ -1,4 +1,9 @@
 # 십이신살 분석 모듈
+from ..ganji_tables import BRANCHES_KOR
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
 class SibisinsalAnalyzer:
     """십이신살 분석을 담당하는 클래스"""
 
@@ -26,10 +31,10 @@ class SibisinsalAnalyzer:
         '천살': '하늘의 재앙. 예상치 못한 재난이나 불가항력적인 어려움을 겪을 수 있습니다.'
     }
 
-    def analyze(self, saju_pillars):
+    def analyze(self, pillars):
         """십이신살 분석 수행"""
         try:
-            sinsal_result = self._calculate_sibisinsal(saju_pillars)
+            sinsal_result = self._calculate_sibisinsal(pillars)
             periods = self._analyze_by_period(sinsal_result)
             
             return {
@@ -39,9 +44,7 @@ class SibisinsalAnalyzer:
                 'sibisinsal_found': sinsal_result
             }
         except Exception as e:
-            print(f"십이신살 분석 중 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("십이신살 분석 중 오류: %s", e)
             return self._get_default_analysis()
 
     def _get_samhab_group(self, jiji):
@@ -51,13 +54,9 @@ class SibisinsalAnalyzer:
                 return group
         return None
 
-    def _calculate_sibisinsal(self, saju_pillars):
+    def _calculate_sibisinsal(self, pillars):
         """연지를 기준으로 십이신살 계산"""
-        year_ji = saju_pillars.get('year', {}).get('ji')
-        if not year_ji:
-            return {}
-
-        samhab_group = self._get_samhab_group(year_ji)
+        samhab_group = self._get_samhab_group(BRANCHES_KOR[pillars.year_ji])
         if not samhab_group:
             return {}
             
@@ -66,10 +65,7 @@ class SibisinsalAnalyzer:
         position_names = {'year': '연지', 'month': '월지', 'day': '일지', 'hour': '시지'}
 
         for pos, pos_name in position_names.items():
-            jiji = saju_pillars.get(pos, {}).get('ji')
-            if not jiji:
-                continue
-            
+            jiji = BRANCHES_KOR[pillars.ji(pos)]
             for sinsal_info in sinsal_map:
                 sinsal, sinsal_jiji = sinsal_info.split('-')
                 if jiji == sinsal_jiji:
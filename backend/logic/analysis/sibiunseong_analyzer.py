@@ -1,4 +1,13 @@
 # 십이운성 분석 모듈
+from ..ganji_tables import STEMS_KOR, BRANCHES_KOR, TWELVE_STAGES
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+def _flatten_stages(table):
+    """{일간: {지지: 운성}} -> [일간 * 12 + 지지] 운성 인덱스 bytes"""
+    return bytes(TWELVE_STAGES.index(table[stem][branch]) for stem in STEMS_KOR for branch in BRANCHES_KOR)
+
 class SibiunseongAnalyzer:
     """십이운성 분석을 담당하는 클래스"""
     
@@ -14,6 +23,11 @@ class SibiunseongAnalyzer:
         "임": {"신": "장생", "유": "목욕", "술": "관대", "해": "건록", "자": "제왕", "축": "쇠", "인": "병", "묘": "사", "진": "묘", "사": "절", "오": "태", "미": "양"},
         "계": {"묘": "장생", "인": "목욕", "축": "관대", "자": "건록", "해": "제왕", "술": "쇠", "유": "병", "신": "사", "미": "묘", "오": "절", "사": "태", "진": "양"}
     }
+
+    # 위 표를 [일간 * 12 + 지지] -> TWELVE_STAGES 인덱스로 펼친 표. 정/기 일간 행은
+    # ganji_tables.TWELVE_STAGE(양간 순행, 음간 역행 규칙)와 20칸이 달라 공용 표 대신
+    # 이 엔진의 표를 그대로 펼쳐 기존 결과를 유지한다.
+    STAGE_TABLE = _flatten_stages(SIBIUNSEONG_TABLE)
     
     SIBIUNSEONG_INFO = {
         "장생": "새로운 시작, 순수함, 발전 가능성", "목욕": "매력, 인기, 변화, 구설수",
@@ -24,10 +38,10 @@ class SibiunseongAnalyzer:
         "태": "잉태, 희망, 잠재력", "양": "성장, 양육, 교육"
     }
 
-    def analyze(self, saju_pillars):
+    def analyze(self, pillars):
         """십이운성 분석 수행"""
         try:
-            sibiunseong_result = self._calculate_sibiunseong(saju_pillars)
+            sibiunseong_result = self._calculate_sibiunseong(pillars)
             
             return {
                 'title': '십이운성 분석',
@@ -37,28 +51,22 @@ class SibiunseongAnalyzer:
                 'period_analysis': sibiunseong_result
             }
         except Exception as e:
-            print(f"십이운성 분석 중 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("십이운성 분석 중 오류: %s", e)
             return self._get_default_analysis()
 
-    def _calculate_sibiunseong(self, saju_pillars):
+    def _calculate_sibiunseong(self, pillars):
         """일간을 기준으로 각 지지의 십이운성 계산"""
-        day_gan = saju_pillars.get('day', {}).get('gan')
-        if not day_gan:
-            return {}
+        row = pillars.day_gan * 12
             
         result = {}
         position_names = {'year': '연주', 'month': '월주', 'day': '일주', 'hour': '시주'}
         
         for pos, pos_name in position_names.items():
-            jiji = saju_pillars.get(pos, {}).get('ji')
-            if jiji:
-                unseong = self.SIBIUNSEONG_TABLE.get(day_gan, {}).get(jiji, "정보 없음")
-                result[pos_name] = {
-                    'unseong': unseong,
-                    'info': self.SIBIUNSEONG_INFO.get(unseong, "정보 없음")
-                }
+            unseong = TWELVE_STAGES[self.STAGE_TABLE[row + pillars.ji(pos)]]
+            result[pos_name] = {
+                'unseong': unseong,
+                'info': self.SIBIUNSEONG_INFO.get(unseong, "정보 없음")
+            }
         return result
 
     def _generate_analysis_content(self, result):
@@ -1,17 +1,20 @@
 # 십성 분석 모듈
 from ..saju_calculator import SajuCalculator
+from ..logger import get_logger
+
+logger = get_logger(__name__)
 
 class SipsungAnalyzer:
     """십성 분석을 담당하는 클래스"""
     
-    def __init__(self):
-        self.calculator = SajuCalculator()
+    def __init__(self, calculator=None):
+        # 공유 엔진에서는 SajuAnalyzer의 계산기를 넘겨받아 데이터 파일을 다시 읽지 않음
+        self.calculator = calculator if calculator is not None else SajuCalculator()
     
-    def analyze(self, sipsung_data):
-        """십성 분석 수행"""
+    def analyze(self, sipsung_data, features):
+        """십성 분석 수행 (십성 개수는 차트 공유 특징 ChartFeatures에서 가져옴)"""
         try:
-            # 십성 개수 계산
-            sipsung_counts = self._count_sipsung(sipsung_data)
+            sipsung_counts = features.ten_gods
             
             # 십성 분석 내용 생성
             analysis_content = self._generate_analysis_content(sipsung_counts)
@@ -27,17 +30,9 @@ class SipsungAnalyzer:
                 'period_analysis': period_analysis
             }
         except Exception as e:
-            print(f"십성 분석 중 오류: {str(e)}")
+            logger.error("십성 분석 중 오류: %s", e)
             return self._get_default_analysis()
     
-    def _count_sipsung(self, sipsung_data):
-        """십성 개수 집계"""
-        counts = {}
-        for position, sipsung in sipsung_data.items():
-            if sipsung and sipsung != '미확인':
-                counts[sipsung] = counts.get(sipsung, 0) + 1
-        return counts
-    
     def _generate_analysis_content(self, sipsung_counts):
         """십성 분석 내용 생성"""
         content = f"【십성 분석】{chr(10) * 2}"
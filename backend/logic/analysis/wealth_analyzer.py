@@ -1,18 +1,19 @@
 # 재물운 분석 모듈
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
 class WealthAnalyzer:
     """재물운 분석을 담당하는 클래스"""
     
-    def analyze(self, saju_pillars, sipsung_data):
-        """재물운 분석 수행"""
+    def analyze(self, pillars, features):
+        """재물운 분석 수행 (features: 차트 공유 특징 ChartFeatures)"""
         try:
-            # 십성 리스트 생성
-            sipsung_list = list(sipsung_data.values()) if isinstance(sipsung_data, dict) else []
-            
             # 재물 관련 십성 분석
-            jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")  # 재물의 별
-            siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")    # 재물을 만드는 힘
-            gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")  # 명예와 지위
-            inseong_count = sipsung_list.count("편인") + sipsung_list.count("정인")    # 지식과 학문
+            jaeseong_count = features.groups['재성']   # 재물의 별
+            siksang_count = features.groups['식상']    # 재물을 만드는 힘
+            gwanseong_count = features.groups['관성']  # 명예와 지위
+            inseong_count = features.groups['인성']    # 지식과 학문
             
             # 재물운 유형 분석
             wealth_type = self._analyze_wealth_type(jaeseong_count, siksang_count, gwanseong_count)
@@ -24,7 +25,7 @@ class WealthAnalyzer:
             characteristics = self._analyze_characteristics(jaeseong_count, siksang_count, gwanseong_count, inseong_count)
             
             # 사람 분석
-            people_analysis = self._analyze_people(sipsung_list)
+            people_analysis = self._analyze_people(features)
             
             # 사업/투자 조언
             business_advice = self._generate_business_advice(wealth_type, jaeseong_count, siksang_count)
@@ -38,7 +39,7 @@ class WealthAnalyzer:
                 'business_investment_advice': business_advice
             }
         except Exception as e:
-            print(f"재물운 분석 중 오류: {str(e)}")
+            logger.error("재물운 분석 중 오류: %s", e)
             return self._get_default_analysis()
     
     def _analyze_wealth_type(self, jaeseong, siksang, gwanseong):
@@ -100,21 +101,21 @@ class WealthAnalyzer:
         
         return ' '.join(characteristics)
     
-    def _analyze_people(self, sipsung_list):
+    def _analyze_people(self, features):
         """재물운과 관련된 사람 분석"""
         helpful_people = []
         caution_people = []
         
-        if '정재' in sipsung_list or '편재' in sipsung_list:
+        if features.has('정재') or features.has('편재'):
             helpful_people.append('재무 전문가나 투자 조언자가 도움이 됩니다.')
-        if '식신' in sipsung_list:
+        if features.has('식신'):
             helpful_people.append('창의적인 사업 파트너가 성공의 열쇠가 됩니다.')
-        if '정관' in sipsung_list:
+        if features.has('정관'):
             helpful_people.append('신뢰할 수 있는 상사나 멘토가 재물운을 열어줍니다.')
         
-        if '겁재' in sipsung_list:
+        if features.has('겁재'):
             caution_people.append('재물을 빼앗으려는 경쟁자를 조심하세요.')
-        if '상관' in sipsung_list:
+        if features.has('상관'):
             caution_people.append('과도한 비판으로 기회를 놓치게 하는 사람을 피하세요.')
         
         helpful_text = ' '.join(helpful_people) if helpful_people else '정직하고 성실한 사람들이 당신의 재물운을 돕습니다.'
@@ -5,6 +5,24 @@ import requests
 from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
+try:
+    import numpy as np
+except ImportError:  # 배치 계산(calculate_saju_pillars_batch)에서만 필요
+    np = None
+
+from .ganji_tables import (
+    STEM_INDEX, BRANCH_INDEX, STEM_ELEMENT, STEM_POLARITY, BRANCH_ELEMENT, BRANCH_POLARITY,
+    MONTH_STEM, HOUR_STEM, HOUR_BRANCH, TWELVE_STAGES, TWELVE_STAGE
+)
+from .pillars import Pillars
+from .features import ChartFeatures
+from .solar_terms import (
+    TERMS_PER_YEAR, days_from_civil, get_solar_terms, local_to_utc_seconds, KST_OFFSET_SECONDS
+)
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
 # 상수 정의
 CHEONGAN = "甲乙丙丁戊己庚辛壬癸"
 CHEONGAN_KOR = "갑을병정무기경신임계"
@@ -16,18 +34,16 @@ OHENG_JIJI = {"子":"수", "丑":"토", "寅":"목", "卯":"목", "辰":"토", "
 EUMYANG_JIJI = {"子":"+", "丑":"-", "寅":"+", "卯":"-", "辰":"+", "巳":"-", "午":"+", "未":"-", "申":"+", "酉":"-", "戌":"+", "亥":"-"}
 SIPSUNG_OHENG_ORDER = "목화토금수"
 SIPSUNG_MAP = [["비견", "겁재", "식신", "상관", "편재", "정재", "편관", "정관", "편인", "정인"],["겁재", "비견", "상관", "식신", "정재", "편재", "정관", "편관", "정인", "편인"]]
-SIBIUNSEONG_TABLE = {
-    "甲": {"亥": "장생", "子": "목욕", "丑": "관대", "寅": "건록", "卯": "제왕", "辰": "쇠", "巳": "병", "未": "묘", "申": "절", "酉": "태", "戌": "양"},
-    "丙": {"寅": "장생", "卯": "목욕", "辰": "관대", "巳": "건록", "午": "제왕", "未": "쇠", "申": "병", "酉": "사", "戌": "묘", "亥": "절", "子": "태", "丑": "양"},
-    "戊": {"寅": "장생", "卯": "목욕", "辰": "관대", "巳": "건록", "午": "제왕", "未": "쇠", "申": "병", "酉": "사", "戌": "묘", "亥": "절", "子": "태", "丑": "양"},
-    "庚": {"巳": "장생", "午": "목욕", "未": "관대", "申": "건록", "酉": "제왕", "戌": "쇠", "亥": "병", "子": "사", "丑": "묘", "寅": "절", "卯": "태", "辰": "양"},
-    "壬": {"申": "장생", "酉": "목욕", "戌": "관대", "亥": "건록", "子": "제왕", "丑": "쇠", "寅": "병", "卯": "사", "辰": "묘", "巳": "절", "午": "태", "未": "양"},
-    "乙": {"午": "장생", "巳": "목욕", "辰": "관대", "卯": "건록", "寅": "제왕", "丑": "쇠", "子": "병", "亥": "사", "戌": "묘", "酉": "절", "申": "태", "未": "양"},
-    "丁": {"酉": "장생", "申": "목욕", "未": "관대", "午": "건록", "巳": "제왕", "辰": "쇠", "卯": "병", "寅": "사", "丑": "묘", "子": "절", "亥": "태", "戌": "양"},
-    "己": {"酉": "장생", "申": "목욕", "未": "관대", "午": "건록", "巳": "제왕", "辰": "쇠", "卯": "병", "寅": "사", "丑": "묘", "子": "절", "亥": "태", "戌": "양"},
-    "辛": {"子": "장생", "亥": "목욕", "戌": "관대", "酉": "건록", "申": "제왕", "未": "쇠", "午": "병", "巳": "사", "辰": "묘", "卯": "절", "寅": "태", "丑": "양"},
-    "癸": {"卯": "장생", "寅": "목욕", "丑": "관대", "子": "건록", "亥": "제왕", "戌": "쇠", "酉": "병", "申": "사", "未": "묘", "午": "절", "巳": "태", "辰": "양"}
-}
+
+# 십성 조회 테이블: SIPSUNG_MAP 규칙을 [일간 * 10 + 천간], [일간 * 12 + 지지]로 미리 펼쳐 둠
+def _build_sipsung_table(elements, polarities):
+    return tuple(
+        SIPSUNG_MAP[STEM_POLARITY[day]][((elements[target] - STEM_ELEMENT[day]) % 5) * 2 + (polarities[target] != STEM_POLARITY[day])]
+        for day in range(10) for target in range(len(elements))
+    )
+
+SIPSUNG_BY_GAN = _build_sipsung_table(STEM_ELEMENT, STEM_POLARITY)
+SIPSUNG_BY_JI = _build_sipsung_table(BRANCH_ELEMENT, BRANCH_POLARITY)
 
 # 파일 경로 상수
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -42,20 +58,20 @@ _DATA_CACHE = {}
 def safe_load_json(file_path: str, default: Dict = None) -> Dict:
     """안전하게 JSON 파일을 로드합니다."""
     try:
-        print(f"파일 로딩 시도: {file_path}")
+        logger.debug("파일 로딩 시도: %s", file_path)
         if not os.path.exists(file_path):
-            print(f"파일이 존재하지 않음: {file_path}")
+            logger.warning("파일이 존재하지 않음: %s", file_path)
             return default or {}
         
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            print(f"파일 로딩 성공: {file_path}")
+            logger.debug("파일 로딩 성공: %s", file_path)
             return data
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"데이터 로딩 오류 ({file_path}): {e}")
+        logger.error("데이터 로딩 오류 (%s): %s", file_path, e)
         return default or {}
     except Exception as e:
-        print(f"예상치 못한 오류 ({file_path}): {e}")
+        logger.exception("예상치 못한 오류 (%s): %s", file_path, e)
         return default or {}
 
 @lru_cache(maxsize=128)
@@ -99,7 +115,7 @@ def safe_ai_generation(func_name: str, prompt: str) -> Optional[str]:
             return "https://via.placeholder.com/400x300/9B59B6/FFFFFF?text=사주+이미지"
             
     except Exception as e:
-        print(f"AI {func_name} generation failed: {str(e)}")
+        logger.error("AI %s generation failed: %s", func_name, e)
         return None
 
 def get_saju_details(year: int, month: int, day: int, hour: int, minute: int) -> Dict[str, Any]:
@@ -138,85 +154,144 @@ def get_saju_details(year: int, month: int, day: int, hour: int, minute: int) ->
         return final_result
         
     except Exception as e:
-        print(f"사주 분석 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("사주 분석 중 오류 발생: %s", e)
         return create_error_response(f"분석 중 오류가 발생했습니다: {str(e)}")
 
 def calculate_saju_pillars(year: int, month: int, day: int, hour: int, minute: int) -> Dict[str, str]:
-    """사주 사주를 계산합니다."""
+    """사주 사주를 계산합니다. (한자 평면 dict, 기존 인터페이스)"""
     try:
-        ref_date = datetime.datetime(1899, 12, 22, 0, 0)
-        target_date = datetime.datetime(year, month, day, hour, minute)
-        delta_days = (target_date - ref_date).days
-        
-        # 일간 계산
-        day_gan_idx = delta_days % 10
-        day_ji_idx = delta_days % 12
-        day_gan = CHEONGAN[day_gan_idx]
-        
-        # 연간 계산
-        ipchun = datetime.datetime(year, 2, 4)
-        saju_year = year if target_date >= ipchun else year - 1
-        year_gan_idx = (saju_year - 1864) % 10
-        year_ji_idx = (saju_year - 1864) % 12
-        year_gan = CHEONGAN[year_gan_idx]
-        year_ji = JIJI[year_ji_idx]
-        
-        # 월간 계산
-        month_ji_map = {1:"寅", 2:"卯", 3:"辰", 4:"巳", 5:"午", 6:"未", 7:"申", 8:"酉", 9:"戌", 10:"亥", 11:"子", 12:"丑"}
-        month_ji = month_ji_map.get(month, "寅")
-        month_gan = calculate_month_gan(year_gan, month_ji)
+        pillars_char = calculate_pillars(year, month, day, hour, minute).to_chars()
         
-        # 시간 계산
-        hour_ji_idx = (hour + 1) // 2 % 12
-        if hour == 23: hour_ji_idx = 0
-        hour_ji = JIJI[hour_ji_idx]
-        hour_gan = calculate_hour_gan(day_gan, hour_ji_idx)
+        logger.debug("사주 계산 결과: %s%s %s%s %s%s %s%s",
+                     pillars_char['year_gan'], pillars_char['year_ji'], pillars_char['month_gan'], pillars_char['month_ji'],
+                     pillars_char['day_gan'], pillars_char['day_ji'], pillars_char['hour_gan'], pillars_char['hour_ji'])
         
-        print(f"사주 계산 결과: {year_gan}{year_ji} {month_gan}{month_ji} {day_gan}{JIJI[day_ji_idx]} {hour_gan}{hour_ji}")
-        
-        return {
-            'year_gan': year_gan, 'year_ji': year_ji,
-            'month_gan': month_gan, 'month_ji': month_ji,
-            'day_gan': day_gan, 'day_ji': JIJI[day_ji_idx],
-            'hour_gan': hour_gan, 'hour_ji': hour_ji
-        }
+        return pillars_char
         
     except Exception as e:
-        print(f"사주 계산 중 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("사주 계산 중 오류: %s", e)
         return create_error_response(f"사주 계산 오류: {str(e)}")
 
+def calculate_pillars(year: int, month: int, day: int, hour: int, minute: int) -> Pillars:
+    """사주 팔자를 정수 Pillars로 계산합니다."""
+    if not validate_date_input(year, month, day, hour, minute):
+        raise ValueError("유효하지 않은 날짜/시간 입력입니다.")
+    
+    # 일간 계산 (1899-12-22 기준)
+    delta_days = days_from_civil(year, month, day) - _DAY_REF_EPOCH_DAYS
+    day_gan_idx = delta_days % 10
+    day_ji_idx = delta_days % 12
+    
+    # 연간/월간 계산 (절기 테이블: 입춘에 해가, 각 절에 달이 바뀜)
+    saju_year, month_ji_idx = get_solar_terms().year_and_month_branch(
+        local_to_utc_seconds(year, month, day, hour, minute)
+    )
+    year_gan_idx = (saju_year - 1864) % 10
+    year_ji_idx = (saju_year - 1864) % 12
+    month_gan_idx = MONTH_STEM[year_gan_idx * 12 + month_ji_idx]
+    
+    # 시간 계산 (23시는 자시)
+    hour_ji_idx = HOUR_BRANCH[hour]
+    hour_gan_idx = HOUR_STEM[day_gan_idx * 12 + hour_ji_idx]
+    
+    return Pillars(
+        year_gan_idx, year_ji_idx, month_gan_idx, month_ji_idx,
+        day_gan_idx, day_ji_idx, hour_gan_idx, hour_ji_idx
+    )
+
+# 일간 기준일(1899-12-22)의 1970-01-01 기준 일수
+_DAY_REF_EPOCH_DAYS = days_from_civil(1899, 12, 22)
+
+# 배치 계산용 NumPy 조회 테이블
+if np is not None:
+    _MONTH_DAYS = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+    _MONTH_STEM_ARRAY = np.frombuffer(MONTH_STEM, dtype=np.uint8)
+    _HOUR_STEM_ARRAY = np.frombuffer(HOUR_STEM, dtype=np.uint8)
+    _HOUR_BRANCH_ARRAY = np.frombuffer(HOUR_BRANCH, dtype=np.uint8)
+
+def calculate_saju_pillars_batch(years, months, days, hours, minutes):
+    """여러 생년월일시의 사주를 한 번에 계산합니다.
+
+    calculate_pillars와 같은 규칙을 NumPy 정수 배열 연산으로 적용한다.
+    반환값은 (N, 8) uint8 배열이며 열 순서는 Pillars 필드 순서
+    (year_gan, year_ji, month_gan, month_ji, day_gan, day_ji, hour_gan, hour_ji)다.
+    """
+    if np is None:
+        raise ImportError("calculate_saju_pillars_batch에는 numpy가 필요합니다 (pip install numpy)")
+    
+    years, months, days, hours, minutes = (
+        np.asarray(values, dtype=np.int64).ravel()
+        for values in (years, months, days, hours, minutes)
+    )
+    n = len(years)
+    if not (len(months) == len(days) == len(hours) == len(minutes) == n):
+        raise ValueError("입력 배열의 길이가 서로 다릅니다.")
+    
+    # 입력값 검증 (스칼라 경로의 datetime 생성과 같은 범위)
+    is_leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    month_valid = (months >= 1) & (months <= 12)
+    month_days = _MONTH_DAYS[np.where(month_valid, months - 1, 0)] + (is_leap & (months == 2))
+    valid = (
+        (years >= 1) & (years <= 9999) & month_valid & (days >= 1) & (days <= month_days)
+        & (hours >= 0) & (hours <= 23) & (minutes >= 0) & (minutes <= 59)
+    )
+    if not valid.all():
+        row = int(np.argmin(valid))
+        raise ValueError(
+            f"유효하지 않은 날짜/시간 입력입니다 (index {row}: "
+            f"{years[row]}-{months[row]}-{days[row]} {hours[row]}:{minutes[row]})"
+        )
+    
+    # 1970-01-01 기준 일수 (days_from_civil은 정수 연산만 쓰므로 배열에도 그대로 적용됨)
+    epoch_days = days_from_civil(years, months, days)
+    
+    # 일주
+    delta_days = epoch_days - _DAY_REF_EPOCH_DAYS
+    day_gan_idx = delta_days % 10
+    day_ji_idx = delta_days % 12
+    
+    # 연주/월주 (절기 테이블을 searchsorted로 조회)
+    solar_terms = get_solar_terms()
+    instants = np.frombuffer(solar_terms.instants, dtype=np.int64)
+    utc_seconds = epoch_days * 86400 + hours * 3600 + minutes * 60 - KST_OFFSET_SECONDS
+    term_index = np.searchsorted(instants, utc_seconds, side='right') - 1
+    out_of_range = (term_index < 0) | (utc_seconds >= solar_terms.end_seconds)
+    if out_of_range.any():
+        row = int(np.argmax(out_of_range))
+        raise ValueError(f"절기 테이블 범위를 벗어난 시각입니다 (index {row}: {years[row]}년)")
+    year_offset, term = np.divmod(term_index, TERMS_PER_YEAR)
+    saju_year = solar_terms.start_year + year_offset - (term < 2)
+    year_gan_idx = (saju_year - 1864) % 10
+    year_ji_idx = (saju_year - 1864) % 12
+    month_ji_idx = (term // 2 + 1) % 12
+    month_gan_idx = _MONTH_STEM_ARRAY[year_gan_idx * 12 + month_ji_idx]
+    
+    # 시주 (23시는 자시)
+    hour_ji_idx = _HOUR_BRANCH_ARRAY[hours]
+    hour_gan_idx = _HOUR_STEM_ARRAY[day_gan_idx * 12 + hour_ji_idx]
+    
+    result = np.empty((n, 8), dtype=np.uint8)
+    for column, values in enumerate((
+        year_gan_idx, year_ji_idx, month_gan_idx, month_ji_idx,
+        day_gan_idx, day_ji_idx, hour_gan_idx, hour_ji_idx
+    )):
+        result[:, column] = values
+    return result
+
 def calculate_month_gan(year_gan: str, month_ji: str) -> str:
     """월간을 계산합니다."""
-    gan_start_map = {"甲己":"丙", "乙庚":"戊", "丙辛":"庚", "丁壬":"壬", "戊癸":"甲"}
-    year_gan_key_list = [k for k in gan_start_map if year_gan in k]
-    if not year_gan_key_list:
+    year_gan_idx = STEM_INDEX.get(year_gan)
+    month_ji_idx = BRANCH_INDEX.get(month_ji)
+    if year_gan_idx is None or month_ji_idx is None:
         raise ValueError("연간 계산 오류")
-    
-    year_gan_key = year_gan_key_list[0]
-    month_gan_start_char = gan_start_map[year_gan_key]
-    month_gan_start_idx = CHEONGAN.find(month_gan_start_char)
-    month_ji_start_idx = JIJI.find("寅")
-    month_ji_current_idx = JIJI.find(month_ji)
-    month_offset = (month_ji_current_idx - month_ji_start_idx + 12) % 12
-    month_gan_idx = (month_gan_start_idx + month_offset) % 10
-    return CHEONGAN[month_gan_idx]
+    return CHEONGAN[MONTH_STEM[year_gan_idx * 12 + month_ji_idx]]
 
 def calculate_hour_gan(day_gan: str, hour_ji_idx: int) -> str:
     """시간을 계산합니다."""
-    gan_start_map_hour = {"甲己":"甲", "乙庚":"丙", "丙辛":"戊", "丁壬":"庚", "戊癸":"壬"}
-    day_gan_key_list = [k for k in gan_start_map_hour if day_gan in k]
-    if not day_gan_key_list:
+    day_gan_idx = STEM_INDEX.get(day_gan)
+    if day_gan_idx is None:
         raise ValueError("시간 계산 오류")
-    
-    day_gan_key = day_gan_key_list[0]
-    hour_gan_start_char = gan_start_map_hour[day_gan_key]
-    hour_gan_start_idx = CHEONGAN.find(hour_gan_start_char)
-    hour_gan_idx = (hour_gan_start_idx + hour_ji_idx) % 10
-    return CHEONGAN[hour_gan_idx]
+    return CHEONGAN[HOUR_STEM[day_gan_idx * 12 + hour_ji_idx % 12]]
 
 def perform_basic_analysis(pillars_char: Dict[str, str]) -> Dict[str, Any]:
     """기본 분석을 수행합니다."""
@@ -233,17 +308,19 @@ def perform_basic_analysis(pillars_char: Dict[str, str]) -> Dict[str, Any]:
 def perform_enhanced_analysis(pillars_char: Dict[str, str], basic_results: Dict[str, Any], year: int = None, month: int = None, day: int = None, hour: int = None, minute: int = None) -> Dict[str, Any]:
     """확장 분석을 수행합니다."""
     sipsung_result = basic_results["sipsung_raw"]
+    # 십성/오행 개수는 차트당 한 번만 계산해 모든 분석 함수가 공유
+    features = ChartFeatures.from_chart(Pillars.from_chars(pillars_char), sipsung_result)
     
     # 기본 분석
-    wealth_luck = analyze_wealth_luck(sipsung_result)
-    love_luck = analyze_love_luck(sipsung_result)
-    career_luck = analyze_career_luck(sipsung_result)
-    health_luck = analyze_health_luck(sipsung_result, pillars_char)
+    wealth_luck = analyze_wealth_luck(features)
+    love_luck = analyze_love_luck(features)
+    career_luck = analyze_career_luck(features)
+    health_luck = analyze_health_luck(features, pillars_char)
     
     # 확장 분석
-    wealth_enhanced = enhance_wealth_analysis(sipsung_result)
-    love_enhanced = enhance_love_analysis(sipsung_result)
-    career_enhanced = enhance_career_analysis(sipsung_result)
+    wealth_enhanced = enhance_wealth_analysis(features)
+    love_enhanced = enhance_love_analysis(features)
+    career_enhanced = enhance_career_analysis(features)
     health_enhanced = enhance_health_analysis(sipsung_result, pillars_char)
     
     # 대운 분석 - 날짜 정보가 있으면 정확한 분석 수행
@@ -265,7 +342,7 @@ def perform_enhanced_analysis(pillars_char: Dict[str, str], basic_results: Dict[
         "career_luck_analysis": {**career_enhanced, **career_luck},
         "health_luck_analysis": {**health_luck, **health_enhanced},
         "life_flow_analysis": life_flow,
-        "comprehensive_report": generate_comprehensive_report_detailed(pillars_char, basic_results, life_flow)
+        "comprehensive_report": generate_comprehensive_report_detailed(pillars_char, basic_results, life_flow, features)
     }
     
     return final_result
@@ -282,14 +359,12 @@ def generate_ai_images(pillars_char: Dict[str, str]) -> Dict[str, Any]:
         "sibiunseong_illustration_url": sibiunseong_illustration_url
     }
 
-def analyze_career_luck(sipsung_result):
+def analyze_career_luck(features: ChartFeatures):
     """십성 데이터를 기반으로 직업운을 분석하고 AI 아바타를 생성합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 관성 (관리, 리더십)
-    gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")
+    gwanseong_count = features.groups['관성']
     # 식상 (창의성, 전문성)
-    siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")
+    siksang_count = features.groups['식상']
     
     # 직업 스타일 분석
     if gwanseong_count == 0:
@@ -325,14 +400,12 @@ def generate_ai_avatar(prompt):
     # safe_ai_generation 함수를 사용하여 placeholder URL 반환
     return safe_ai_generation("avatar", prompt)
 
-def analyze_love_luck(sipsung_result):
+def analyze_love_luck(features: ChartFeatures):
     """십성 데이터를 기반으로 연애운을 분석하고 AI 일러스트를 생성합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 관성 (배우자, 연인)
-    gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")
+    gwanseong_count = features.groups['관성']
     # 재성 (재물, 매력)
-    jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")
+    jaeseong_count = features.groups['재성']
     
     # 연애 스타일 분석
     if gwanseong_count == 0:
@@ -378,17 +451,15 @@ def generate_ai_illustration(prompt):
         return None
         
     except Exception as e:
-        print(f"AI illustration generation failed: {str(e)}")
+        logger.error("AI illustration generation failed: %s", e)
         return None
 
-def analyze_wealth_luck(sipsung_result):
+def analyze_wealth_luck(features: ChartFeatures):
     """십성 데이터를 기반으로 기본적인 재물운을 분석합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 재성 (재물의 별)
-    jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")
+    jaeseong_count = features.groups['재성']
     # 식상 (재물을 만들어내는 힘)
-    siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")
+    siksang_count = features.groups['식상']
     
     if jaeseong_count == 0:
         if siksang_count > 0:
@@ -414,32 +485,22 @@ def analyze_wealth_luck(sipsung_result):
             }
     return {"title": "재물운 분석", "description": "일반적인 분석입니다."}
 
-def analyze_health_luck(sipsung_result, pillars_char):
+def analyze_health_luck(features: ChartFeatures, pillars_char):
     """십성 데이터와 사주팔자를 기반으로 건강운을 분석합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 일간의 오행
     day_gan = pillars_char['day_gan']
     day_oheng = OHENG_GAN[day_gan]
     
-    # 오행별 개수 계산
-    oheng_count = {"목": 0, "화": 0, "토": 0, "금": 0, "수": 0}
-    
-    for key, char in pillars_char.items():
-        if 'gan' in key:
-            oheng = OHENG_GAN[char]
-            oheng_count[oheng] += 1
-        elif 'ji' in key:
-            oheng = OHENG_JIJI[char]
-            oheng_count[oheng] += 1
+    # 오행별 개수
+    oheng_count = features.elements
     
     # 건강 관련 십성 분석
     # 식상 (소화기, 창의성) - 과다하면 소화불량, 부족하면 식욕부진
-    siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")
+    siksang_count = features.groups['식상']
     # 관성 (관절, 뼈) - 과다하면 관절염, 부족하면 골다공증
-    gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")
+    gwanseong_count = features.groups['관성']
     # 재성 (순환계, 피부) - 과다하면 혈압문제, 부족하면 빈혈
-    jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")
+    jaeseong_count = features.groups['재성']
     
     # 건강 스타일 분석
     if siksang_count > 2:
@@ -621,32 +682,26 @@ def analyze_life_flow(year: int, month: int, day: int, hour: int, minute: int, s
 
 def calculate_sibiunseong(pillars_char: Dict[str, str]) -> Dict[str, str]:
     """십이운성을 계산합니다."""
-    ilgan = pillars_char['day_gan']
+    row = STEM_INDEX[pillars_char['day_gan']] * 12
     result = {}
     for key, jiji in pillars_char.items():
         if 'ji' in key:
             period_key = key.replace('_ji', '주')
-            result[period_key] = SIBIUNSEONG_TABLE[ilgan].get(jiji, "정보 없음")
+            branch = BRANCH_INDEX.get(jiji)
+            result[period_key] = TWELVE_STAGES[TWELVE_STAGE[row + branch]] if branch is not None else "정보 없음"
     return result
 
 def calculate_sipsung(pillars_char: Dict[str, str]) -> Dict[str, str]:
     """십성을 계산합니다."""
-    ilgan_char = pillars_char['day_gan']
-    ilgan_oheng = OHENG_GAN[ilgan_char]
-    ilgan_eumyang = EUMYANG_GAN[ilgan_char]
-    ilgan_eumyang_idx = 0 if ilgan_eumyang == '+' else 1
+    ilgan_idx = STEM_INDEX[pillars_char['day_gan']]
     sipsung_result = {}
     for key, char_val in pillars_char.items():
         if key == 'day_gan':
             sipsung_result[key] = "일간"
-            continue
-        target_oheng = OHENG_GAN[char_val] if 'gan' in key else OHENG_JIJI[char_val]
-        target_eumyang = EUMYANG_GAN[char_val] if 'gan' in key else EUMYANG_JIJI[char_val]
-        oheng_diff = (SIPSUNG_OHENG_ORDER.find(target_oheng) - SIPSUNG_OHENG_ORDER.find(ilgan_oheng) + 5) % 5
-        base_sipsung_idx = oheng_diff * 2
-        if ilgan_eumyang != target_eumyang:
-            base_sipsung_idx += 1
-        sipsung_result[key] = SIPSUNG_MAP[ilgan_eumyang_idx][base_sipsung_idx]
+        elif 'gan' in key:
+            sipsung_result[key] = SIPSUNG_BY_GAN[ilgan_idx * 10 + STEM_INDEX[char_val]]
+        else:
+            sipsung_result[key] = SIPSUNG_BY_JI[ilgan_idx * 12 + BRANCH_INDEX[char_val]]
     return sipsung_result
 
 def analyze_sibisinsal(pillars_char: Dict[str, str]) -> Dict[str, str]:
@@ -765,17 +820,15 @@ def generate_ai_portrait(prompt: str, guin_data: List[str]) -> Optional[str]:
         return None
         
     except Exception as e:
-        print(f"AI portrait generation failed: {str(e)}")
+        logger.error("AI portrait generation failed: %s", e)
         return None
 
-def enhance_wealth_analysis(sipsung_result: Dict[str, str]) -> Dict[str, Any]:
+def enhance_wealth_analysis(features: ChartFeatures) -> Dict[str, Any]:
     """재물운 분석을 확장합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 재성 (재물의 별)
-    jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")
+    jaeseong_count = features.groups['재성']
     # 식상 (재물을 만들어내는 힘)
-    siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")
+    siksang_count = features.groups['식상']
     
     # 전반적인 재물운 흐름
     if jaeseong_count > 0 and siksang_count > 0:
@@ -820,14 +873,12 @@ def enhance_wealth_analysis(sipsung_result: Dict[str, str]) -> Dict[str, Any]:
         "business_analysis": business_analysis
     }
 
-def enhance_love_analysis(sipsung_result: Dict[str, str]) -> Dict[str, str]:
+def enhance_love_analysis(features: ChartFeatures) -> Dict[str, str]:
     """연애운 분석을 확장합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 관성 (배우자, 연인)
-    gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")
+    gwanseong_count = features.groups['관성']
     # 재성 (재물, 매력)
-    jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")
+    jaeseong_count = features.groups['재성']
     
     # 전반적인 연애 성향
     if gwanseong_count > 0 and jaeseong_count > 0:
@@ -859,14 +910,12 @@ def enhance_love_analysis(sipsung_result: Dict[str, str]) -> Dict[str, str]:
         "timing_location": timing_location
     }
 
-def enhance_career_analysis(sipsung_result: Dict[str, str]) -> Dict[str, Any]:
+def enhance_career_analysis(features: ChartFeatures) -> Dict[str, Any]:
     """직업운 분석을 확장합니다."""
-    sipsung_list = list(sipsung_result.values())
-    
     # 관성 (관리, 리더십)
-    gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")
+    gwanseong_count = features.groups['관성']
     # 식상 (창의성, 전문성)
-    siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")
+    siksang_count = features.groups['식상']
     
     # 잘 맞는 직업/직장
     suitable_jobs = []
@@ -917,7 +966,7 @@ def enhance_health_analysis(sipsung_result: Dict[str, str], pillars_char: Dict[s
         "timing_analysis": timing_analysis
     }
 
-def generate_comprehensive_report_detailed(pillars_char: Dict[str, str], basic_results: Dict[str, Any], life_flow: Dict[str, Any]) -> Dict[str, Any]:
+def generate_comprehensive_report_detailed(pillars_char: Dict[str, str], basic_results: Dict[str, Any], life_flow: Dict[str, Any], features: ChartFeatures) -> Dict[str, Any]:
     """20년 역술가 수준의 상세한 종합 리포트를 생성합니다."""
     
     # 1. 일주 분석
@@ -951,7 +1000,7 @@ def generate_comprehensive_report_detailed(pillars_char: Dict[str, str], basic_r
     daeun_analysis = generate_daeun_analysis_detailed(life_flow)
     
     # 11. 종합 리포트
-    final_summary = generate_final_summary_detailed(pillars_char, basic_results, life_flow)
+    final_summary = generate_final_summary_detailed(pillars_char, basic_results, life_flow, features)
     
     return {
         "ilju_analysis": ilju_analysis,
@@ -1848,7 +1897,7 @@ def generate_daeun_analysis_detailed(life_flow: Dict[str, Any]) -> Dict[str, Any
         "future_outlook": life_flow.get('future_outlook', '')
     }
 
-def generate_final_summary_detailed(pillars_char: Dict[str, str], basic_results: Dict[str, Any], life_flow: Dict[str, Any]) -> Dict[str, Any]:
+def generate_final_summary_detailed(pillars_char: Dict[str, str], basic_results: Dict[str, Any], life_flow: Dict[str, Any], features: ChartFeatures) -> Dict[str, Any]:
     """종합 리포트 - 상세 버전"""
     
     # 각 분석에서 핵심 내용 추출
@@ -1857,11 +1906,9 @@ def generate_final_summary_detailed(pillars_char: Dict[str, str], basic_results:
     ilju_key = f"{day_gan}{day_ji}"
     
     # 십성 분석에서 핵심 특성 추출
-    sipsung_raw = basic_results.get('sipsung_raw', {})
-    sipsung_list = list(sipsung_raw.values())
-    gwanseong_count = sipsung_list.count("편관") + sipsung_list.count("정관")
-    jaeseong_count = sipsung_list.count("편재") + sipsung_list.count("정재")
-    siksang_count = sipsung_list.count("식신") + sipsung_list.count("상관")
+    gwanseong_count = features.groups['관성']
+    jaeseong_count = features.groups['재성']
+    siksang_count = features.groups['식상']
     
     # 성격 유형 결정
     personality_type = ""
@@ -0,0 +1,246 @@
+# WSGI -> ASGI 어댑터
+#
+# Flask 앱(WSGI)을 그대로 ASGI 서버(uvicorn 등)에서 돌리기 위한 최소 구현이다.
+#   - 연결 수락, 요청 본문 수신, 응답 전송은 이벤트 루프에서 비동기로 처리하므로
+#     유휴 연결이 많아도 스레드를 차지하지 않는다.
+#   - 라우트(WSGI 앱) 실행과 응답 본문 순회는 크기가 정해진 스레드 풀에서 한 요청당
+#     한 스레드로 처리한다 (Flask의 요청 컨텍스트가 한 스레드에 머물도록). 순회 중
+#     나오는 조각은 큐로 이벤트 루프에 넘겨 바로 전송하므로 스트리밍 응답도 유지된다.
+#     전송되지 않은 조각은 max_chunks개까지만 쌓이고, 그보다 앞서면 응답 스레드가
+#     기다린다 (느린 클라이언트 때문에 메모리가 늘지 않도록).
+#   - 본문을 받는 도중 연결이 끊긴 요청은 라우트를 실행하지 않고, 응답 중에 끊기면
+#     응답 본문 순회를 멈춘다. 응답 시작 뒤에 오류가 나면 마지막 조각을 보내지 않고
+#     예외를 올려 서버가 연결을 끊게 한다 (잘린 200이 정상 응답처럼 보이지 않도록).
+#   - lifespan 이벤트로 시작/종료 작업(엔진 준비, 프로세스 풀 시작/종료)을 실행한다.
+import asyncio
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_THREADS = 32
+DEFAULT_MAX_BODY = 1024 * 1024
+DEFAULT_MAX_CHUNKS = 8
+
+_END = object()
+
+class ClientDisconnected(Exception):
+    """클라이언트가 요청 본문 수신 또는 응답 전송 도중 연결을 끊음"""
+
+class WsgiToAsgi:
+    """WSGI 앱을 감싼 ASGI 앱"""
+
+    def __init__(self, wsgi_app, threads=DEFAULT_THREADS, max_body=DEFAULT_MAX_BODY, max_chunks=DEFAULT_MAX_CHUNKS,
+                 on_startup=None, on_shutdown=None):
+        self.wsgi_app = wsgi_app
+        self.threads = threads
+        self.max_body = max_body
+        self.max_chunks = max_chunks
+        self.on_startup = on_startup
+        self.on_shutdown = on_shutdown
+        self._executor = None
+
+    @property
+    def executor(self):
+        # 이벤트 루프 안에서만 호출되므로 락 없이 한 번만 만든다
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='asgi-wsgi')
+        return self._executor
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+        else:
+            raise NotImplementedError(f"지원하지 않는 ASGI scope: {scope['type']}")
+
+    async def _lifespan(self, receive, send):
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    if self.on_startup is not None:
+                        await loop.run_in_executor(None, self.on_startup)
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.on_shutdown is not None:
+                    await loop.run_in_executor(None, self.on_shutdown)
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        try:
+            body = await self._read_body(receive)
+        except ClientDisconnected:
+            logger.info("요청 본문 수신 중 연결 끊김, 처리하지 않음: %s %s", scope['method'], scope['path'])
+            return
+        if body is None:
+            await send({'type': 'http.response.start', 'status': 413,
+                        'headers': [(b'content-type', b'text/plain; charset=utf-8')]})
+            await send({'type': 'http.response.body', 'body': b'Request body too large'})
+            return
+
+        loop = asyncio.get_running_loop()
+        # 큐 길이는 slots(응답 스레드가 조각마다 하나씩 얻고 전송 후 돌려받음)로 제한
+        queue = asyncio.Queue()
+        slots = threading.Semaphore(self.max_chunks)
+        closed = threading.Event()
+        environ = self._environ(scope, body)
+        task = loop.run_in_executor(self.executor, self._run_wsgi, environ, loop, queue, slots, closed)
+        disconnect = asyncio.ensure_future(self._wait_disconnect(receive))
+
+        started = failed = False
+        try:
+            while True:
+                get = asyncio.ensure_future(queue.get())
+                await asyncio.wait((get, disconnect), return_when=asyncio.FIRST_COMPLETED)
+                if disconnect.done():
+                    get.cancel()
+                    # Content-Length 응답을 다 읽은 클라이언트도 마지막 빈 조각 전에 끊을 수 있으므로 debug
+                    logger.debug("응답 전송 중 연결 끊김: %s %s", scope['method'], scope['path'])
+                    return
+                item = get.result()
+                if item is _END:
+                    break
+                kind, value = item
+                if kind == 'start':
+                    status, headers = value
+                    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+                    started = True
+                    slots.release()
+                elif kind == 'body':
+                    await send({'type': 'http.response.body', 'body': value, 'more_body': True})
+                    slots.release()
+                elif started:
+                    failed = True
+                else:
+                    await send({'type': 'http.response.start', 'status': 500,
+                                'headers': [(b'content-type', b'text/plain; charset=utf-8')]})
+                    started = True
+            if failed:
+                raise RuntimeError(f"응답 도중 오류, 연결을 끊음: {scope['method']} {scope['path']}")
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            # 응답 스레드가 다음 조각에서 멈추도록 알리고, 자리를 기다리고 있으면 깨움
+            closed.set()
+            slots.release()
+            disconnect.cancel()
+            await task
+
+    async def _wait_disconnect(self, receive):
+        """본문을 다 받은 뒤 http.disconnect가 올 때까지 기다림"""
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    async def _read_body(self, receive):
+        """요청 본문 전체 (max_body를 넘으면 None, 도중에 연결이 끊기면 ClientDisconnected)"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                raise ClientDisconnected()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > self.max_body:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                break
+        return b''.join(chunks)
+
+    def _environ(self, scope, body):
+        """ASGI scope -> WSGI environ"""
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': str(server[0]),
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'REMOTE_ADDR': str(client[0]),
+            'REMOTE_PORT': str(client[1]),
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False,
+        }
+        for name, value in scope.get('headers', []):
+            name = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+                continue
+            if name == 'CONTENT_LENGTH':
+                continue
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+    def _run_wsgi(self, environ, loop, queue, slots, closed):
+        """스레드 풀에서 WSGI 앱을 실행하고 응답 시작/본문 조각을 큐로 보냄
+
+        조각마다 slots 자리를 얻어야 보낼 수 있고, closed가 설정되면 (연결이 끊겼거나
+        응답 전송이 끝남) ClientDisconnected로 순회를 멈춘다.
+        """
+        def put(item):
+            slots.acquire()
+            if closed.is_set():
+                raise ClientDisconnected()
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        def finish(item):
+            if not closed.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        pending_start = []
+
+        def flush_start():
+            # 응답 시작은 첫 본문 조각(또는 빈 본문의 끝) 직전에 보냄
+            if pending_start:
+                put(('start', pending_start.pop()))
+
+        def write(data):
+            flush_start()
+            put(('body', data))
+
+        def start_response(status, headers, exc_info=None):
+            pending_start[:] = [(int(status.split(' ', 1)[0]), [
+                (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers
+            ])]
+            return write
+
+        iterable = None
+        try:
+            iterable = self.wsgi_app(environ, start_response)
+            for chunk in iterable:
+                if chunk:
+                    write(chunk)
+            flush_start()
+        except ClientDisconnected:
+            pass
+        except Exception as e:
+            logger.exception("ASGI 요청 처리 오류: %s", e)
+            finish(('error', None))
+        finally:
+            if hasattr(iterable, 'close'):
+                iterable.close()
+            finish(_END)
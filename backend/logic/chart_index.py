@@ -0,0 +1,234 @@
+# 사주 역색인 모듈
+#
+# 팔자(연주/월주/일주/시주)는 시간 축에서 구간별로 일정하다.
+#   - 연주/월주: 절(節) 경계 사이 구간 (절기 테이블)
+#   - 일주: 하루 단위
+#   - 시주: 일간과 시각(시 단위)으로 결정
+# 각 구간의 팔자를 엔진(SajuCalculator)으로 한 번씩만 계산해 60갑자별 게시 목록
+# (posting list)을 만들어 두고, 검색은 게시 목록의 교집합과 구간 병합만으로
+# 수행한다. 시각은 모두 한국 표준시 기준 1970-01-01 00:00부터의 분(分) 단위다.
+import datetime
+import threading
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+from .ganji_tables import STEM_INDEX, BRANCH_INDEX, GAPJA_INDEX, GAPJA_STEM
+from .pillars import POSITIONS
+from .solar_terms import KST_OFFSET_SECONDS, days_from_civil, civil_from_days
+
+MINUTES_PER_DAY = 1440
+
+def parse_ganji(text):
+    """'갑자' / '甲子' 형태의 간지를 60갑자 순번으로 변환 (잘못된 값은 ValueError)"""
+    if not isinstance(text, str) or len(text) != 2:
+        raise ValueError(f"간지는 두 글자여야 합니다: {text!r}")
+    stem = STEM_INDEX.get(text[0])
+    branch = BRANCH_INDEX.get(text[1])
+    if stem is None or branch is None or GAPJA_INDEX[stem * 12 + branch] == 255:
+        raise ValueError(f"올바른 60갑자가 아닙니다: {text!r}")
+    return GAPJA_INDEX[stem * 12 + branch]
+
+def _gapja(gan, ji):
+    return GAPJA_INDEX[gan * 12 + ji]
+
+def minutes_to_datetime(minutes):
+    """분 단위 시각 -> datetime (한국 표준시, tzinfo 없음)"""
+    days, minute_of_day = divmod(minutes, MINUTES_PER_DAY)
+    year, month, day = civil_from_days(days)
+    return datetime.datetime(year, month, day, minute_of_day // 60, minute_of_day % 60)
+
+def datetime_to_minutes(value):
+    """date/datetime -> 분 단위 시각"""
+    minutes = days_from_civil(value.year, value.month, value.day) * MINUTES_PER_DAY
+    if isinstance(value, datetime.datetime):
+        minutes += value.hour * 60 + value.minute
+    return minutes
+
+def _merge_runs(runs):
+    """정렬된 [시작, 끝) 구간 목록에서 맞닿은 구간을 합침"""
+    merged = []
+    for start, end in runs:
+        if merged and merged[-1][1] >= start:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+class ChartIndex:
+    """팔자 구성 요소 -> 시간 구간 역색인"""
+
+    def __init__(self, calculator, start_year=1900, end_year=2100):
+        self.start = days_from_civil(start_year, 1, 1) * MINUTES_PER_DAY
+        self.end = days_from_civil(end_year + 1, 1, 1) * MINUTES_PER_DAY
+        self._build_month_intervals(calculator)
+        self._build_days(calculator, start_year, end_year)
+        self._build_hours(calculator)
+
+    def _pillars_at(self, calculator, minutes):
+        moment = minutes_to_datetime(minutes)
+        return calculator.calculate_pillars(moment.year, moment.month, moment.day, moment.hour, moment.minute)
+
+    def _build_month_intervals(self, calculator):
+        """절 경계로 나뉜 구간과 연주/월주 게시 목록"""
+        table = calculator.solar_terms
+        boundaries = [self.start]
+        for index in range(0, len(table.instants), 2):
+            # 엔진은 (해당 분의 0초) >= 절기 시각이면 다음 달로 보므로 경계는 올림한 분
+            boundary = -(-(table.instants[index] + KST_OFFSET_SECONDS) // 60)
+            if self.start < boundary < self.end:
+                boundaries.append(boundary)
+        boundaries.append(self.end)
+
+        self.month_starts = boundaries[:-1]
+        self.month_ends = boundaries[1:]
+        self.year_postings = [[] for _ in range(60)]
+        self.month_postings = [[] for _ in range(60)]
+        for interval, start in enumerate(self.month_starts):
+            pillars = self._pillars_at(calculator, start)
+            self.year_postings[_gapja(pillars.year_gan, pillars.year_ji)].append(interval)
+            self.month_postings[_gapja(pillars.month_gan, pillars.month_ji)].append(interval)
+
+    def _build_days(self, calculator, start_year, end_year):
+        """일주 게시 목록 (날짜는 1970-01-01 기준 일수)"""
+        self.first_day = days_from_civil(start_year, 1, 1)
+        self.day_gapja = bytearray()
+        self.day_postings = [[] for _ in range(60)]
+        self.day_stem_samples = {}
+        for days in range(self.first_day, days_from_civil(end_year + 1, 1, 1)):
+            pillars = self._pillars_at(calculator, days * MINUTES_PER_DAY + 12 * 60)
+            gapja = _gapja(pillars.day_gan, pillars.day_ji)
+            self.day_gapja.append(gapja)
+            self.day_postings[gapja].append(days)
+            self.day_stem_samples.setdefault(pillars.day_gan, days)
+
+    def _build_hours(self, calculator):
+        """시주 게시 목록: 시주 순번 -> [(일간, [(시작 분, 끝 분), ...]), ...]"""
+        self.hour_postings = [[] for _ in range(60)]
+        for day_gan, days in sorted(self.day_stem_samples.items()):
+            ranges = {}
+            for hour in range(24):
+                pillars = self._pillars_at(calculator, days * MINUTES_PER_DAY + hour * 60)
+                hour_ranges = ranges.setdefault(_gapja(pillars.hour_gan, pillars.hour_ji), [])
+                if hour_ranges and hour_ranges[-1][1] == hour * 60:
+                    hour_ranges[-1][1] += 60
+                else:
+                    hour_ranges.append([hour * 60, hour * 60 + 60])
+            for gapja, hour_ranges in ranges.items():
+                self.hour_postings[gapja].append((day_gan, [tuple(r) for r in hour_ranges]))
+
+    def search(self, year=None, month=None, day=None, hour=None, start=None, end=None, limit=None):
+        """조건에 맞는 시각 구간 목록 [(시작 datetime, 끝 datetime), ...] (끝은 미포함)
+
+        year/month/day/hour는 '갑자' 또는 '甲子' 형태이며 생략한 기둥은 조건에서 제외된다.
+        start/end(date 또는 datetime)로 검색 범위를 좁힐 수 있다.
+        """
+        runs, _ = self.search_minutes(
+            *(None if value is None else parse_ganji(value) for value in (year, month, day, hour)),
+            start=None if start is None else datetime_to_minutes(start),
+            end=None if end is None else datetime_to_minutes(end),
+            limit=limit
+        )
+        return [(minutes_to_datetime(s), minutes_to_datetime(e)) for s, e in runs]
+
+    def search_minutes(self, year=None, month=None, day=None, hour=None, start=None, end=None, limit=None):
+        """60갑자 순번 조건으로 검색, ([[시작 분, 끝 분], ...], 잘림 여부) 반환"""
+        start = self.start if start is None else max(start, self.start)
+        end = self.end if end is None else min(end, self.end)
+        if start >= end:
+            return [], False
+
+        coarse = self._coarse_intervals(year, month, start, end)
+        if day is None and hour is None:
+            runs = coarse
+        else:
+            runs = self._fine_intervals(coarse, day, hour)
+
+        runs = _merge_runs(runs)
+        truncated = limit is not None and len(runs) > limit
+        return (runs[:limit] if truncated else runs), truncated
+
+    def occurs(self, pillars, year):
+        """정수 Pillars의 팔자가 양력 year년 안의 어느 시각에 나오는지 여부"""
+        runs, _ = self.search_minutes(
+            *(_gapja(pillars.gan(position), pillars.ji(position)) for position in POSITIONS),
+            start=days_from_civil(year, 1, 1) * MINUTES_PER_DAY,
+            end=days_from_civil(year + 1, 1, 1) * MINUTES_PER_DAY,
+            limit=1
+        )
+        return bool(runs)
+
+    def _coarse_intervals(self, year, month, start, end):
+        """연주/월주 조건을 만족하는 절 구간 목록 (검색 범위로 잘라냄)"""
+        first = max(bisect_right(self.month_starts, start) - 1, 0)
+        last = bisect_left(self.month_starts, end)
+        if year is None and month is None:
+            candidates = range(first, last)
+        else:
+            postings = [p[value] for p, value in ((self.year_postings, year), (self.month_postings, month)) if value is not None]
+            candidates = postings[0] if len(postings) == 1 else sorted(set(postings[0]).intersection(postings[1]))
+            candidates = candidates[bisect_left(candidates, first):bisect_left(candidates, last)]
+        intervals = []
+        for interval in candidates:
+            interval_start = max(self.month_starts[interval], start)
+            interval_end = min(self.month_ends[interval], end)
+            if interval_start < interval_end:
+                intervals.append((interval_start, interval_end))
+        return _merge_runs(intervals)
+
+    def _candidate_days(self, day, hour):
+        """일주/시주 조건을 만족하는 날짜 목록과 일간별 시각 범위 ({일간: [(시작 분, 끝 분), ...]})"""
+        hour_ranges = None
+        if hour is not None:
+            hour_ranges = dict(self.hour_postings[hour])
+        if day is not None:
+            if hour_ranges is not None and GAPJA_STEM[day] not in hour_ranges:
+                return [], None
+            return self.day_postings[day], hour_ranges
+        # 시주만 주어진 경우: 해당 시주가 나오는 일간의 날짜들을 합침
+        days = list(merge(*(
+            self.day_postings[gapja] for gapja in range(60) if GAPJA_STEM[gapja] in hour_ranges
+        )))
+        return days, hour_ranges
+
+    def _fine_intervals(self, coarse, day, hour):
+        """절 구간 안에서 일주/시주 조건을 만족하는 시각 구간 목록"""
+        days, hour_ranges = self._candidate_days(day, hour)
+        runs = []
+        for coarse_start, coarse_end in coarse:
+            first = bisect_left(days, coarse_start // MINUTES_PER_DAY)
+            last = bisect_left(days, -(-coarse_end // MINUTES_PER_DAY))
+            for days_value in days[first:last]:
+                base = days_value * MINUTES_PER_DAY
+                if hour_ranges is None:
+                    day_ranges = ((0, MINUTES_PER_DAY),)
+                else:
+                    day_ranges = hour_ranges[GAPJA_STEM[self.day_gapja[days_value - self.first_day]]]
+                for range_start, range_end in day_ranges:
+                    run_start = max(base + range_start, coarse_start)
+                    run_end = min(base + range_end, coarse_end)
+                    if run_start < run_end:
+                        runs.append((run_start, run_end))
+        return runs
+
+# 프로세스 전역 색인 (preload 시점에 만들어 두면 워커가 그대로 물려받음)
+_index = None
+_index_lock = threading.Lock()
+
+def get_chart_index():
+    """프로세스 전역 ChartIndex를 반환 (최초 호출 시 공유 엔진으로 한 번만 만든다)"""
+    global _index
+    index = _index
+    if index is None:
+        with _index_lock:
+            if _index is None:
+                from .saju_analyzer import get_engine
+                _index = ChartIndex(get_engine().calculator)
+            index = _index
+    return index
+
+def reset_chart_index():
+    """프로세스 전역 색인을 버림 (엔진을 교체한 뒤 호출하면 다음 조회 때 새 엔진으로 다시 만든다)"""
+    global _index
+    with _index_lock:
+        _index = None
@@ -0,0 +1,77 @@
+# 응답 압축 모듈
+#
+# 요청의 Accept-Encoding에 따라 응답 본문을 br(brotli, 설치되어 있을 때) 또는 gzip으로
+# 압축한다. 압축 수준과 최소 크기는 환경 변수로 조정한다.
+#   SAJU_GZIP_LEVEL (1-9, 기본 6), SAJU_BROTLI_QUALITY (0-11, 기본 5),
+#   SAJU_COMPRESS_MIN_BYTES (이보다 작은 본문은 압축하지 않음, 기본 1024)
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_BROTLI_QUALITY = 5
+DEFAULT_MIN_BYTES = 1024
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더 -> {인코딩 이름: q 값} (이름은 소문자)"""
+    accepted = {}
+    for item in header.split(','):
+        name, _, params = item.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+class Compressor:
+    """인코딩 협상과 압축 설정"""
+
+    def __init__(self, gzip_level=DEFAULT_GZIP_LEVEL, brotli_quality=DEFAULT_BROTLI_QUALITY, min_bytes=DEFAULT_MIN_BYTES):
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.min_bytes = min_bytes
+        # 같은 q 값이면 앞쪽을 우선
+        self.encodings = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수(SAJU_GZIP_LEVEL, SAJU_BROTLI_QUALITY, SAJU_COMPRESS_MIN_BYTES)로 생성"""
+        return cls(
+            gzip_level=int(os.environ.get('SAJU_GZIP_LEVEL', DEFAULT_GZIP_LEVEL)),
+            brotli_quality=int(os.environ.get('SAJU_BROTLI_QUALITY', DEFAULT_BROTLI_QUALITY)),
+            min_bytes=int(os.environ.get('SAJU_COMPRESS_MIN_BYTES', DEFAULT_MIN_BYTES))
+        )
+
+    def negotiate(self, accept_encoding):
+        """Accept-Encoding 헤더로 사용할 인코딩을 고름 (압축하지 않으면 None)"""
+        if not accept_encoding:
+            return None
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*', 0.0)
+        best, best_quality = None, 0.0
+        for name in self.encodings:
+            quality = accepted.get(name, wildcard)
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    def compress(self, data, encoding):
+        """(본문, 실제 적용한 인코딩) 반환 (min_bytes보다 작거나 encoding이 None이면 그대로)"""
+        if encoding is None or len(data) < self.min_bytes:
+            return data, None
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality), 'br'
+        # mtime을 고정해 같은 본문은 항상 같은 바이트로 압축
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0), 'gzip'
@@ -0,0 +1,55 @@
+# 차트 파생 특징 모듈
+#
+# 재물/연애/직업/건강 분석기와 십성 분석기가 각자 반복해서 세던 십성 개수,
+# 십성 묶음(비겁/식상/재성/관성/인성) 개수, 오행 개수, 음양 균형을 차트마다
+# 한 번만 계산해 공유한다.
+from typing import NamedTuple
+
+from .ganji_tables import (
+    ELEMENTS, POLARITIES, STEM_ELEMENT, STEM_POLARITY, BRANCH_ELEMENT, BRANCH_POLARITY, TEN_GOD_INDEX
+)
+from .pillars import POSITIONS
+
+# 십성 묶음 (TEN_GODS 순서에서 두 개씩)
+TEN_GOD_GROUPS = ('비겁', '식상', '재성', '관성', '인성')
+
+class ChartFeatures(NamedTuple):
+    """차트 한 개의 파생 특징 (분석기 간 공유, 읽기 전용으로 사용)"""
+    ten_gods: dict   # 십성 -> 개수 (처음 나온 순서, 값이 없거나 '미확인'이면 제외)
+    groups: dict     # 십성 묶음 -> 개수
+    elements: dict   # 오행 -> 개수 (천간/지지 여덟 글자)
+    polarity: dict   # 음양('+', '-') -> 개수
+
+    @classmethod
+    def from_chart(cls, pillars, sipsung_data):
+        """정수 Pillars와 위치별 십성 dict로부터 생성"""
+        ten_gods = {}
+        for name in sipsung_data.values():
+            if name and name != '미확인':
+                ten_gods[name] = ten_gods.get(name, 0) + 1
+
+        group_counts = [0] * len(TEN_GOD_GROUPS)
+        for name, count in ten_gods.items():
+            index = TEN_GOD_INDEX.get(name)
+            if index is not None:
+                group_counts[index // 2] += count
+
+        element_counts = [0] * len(ELEMENTS)
+        polarity_counts = [0] * len(POLARITIES)
+        for position in POSITIONS:
+            stem, branch = pillars.gan(position), pillars.ji(position)
+            element_counts[STEM_ELEMENT[stem]] += 1
+            element_counts[BRANCH_ELEMENT[branch]] += 1
+            polarity_counts[STEM_POLARITY[stem]] += 1
+            polarity_counts[BRANCH_POLARITY[branch]] += 1
+
+        return cls(
+            ten_gods,
+            dict(zip(TEN_GOD_GROUPS, group_counts)),
+            dict(zip(ELEMENTS, element_counts)),
+            dict(zip(POLARITIES, polarity_counts))
+        )
+
+    def has(self, name):
+        """해당 십성이 한 번이라도 있는지"""
+        return name in self.ten_gods
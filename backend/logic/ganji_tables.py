@@ -0,0 +1,59 @@
+# 천간/지지 정수 조회 테이블 모듈
+#
+# 천간은 0~9(갑~계), 지지는 0~11(자~해), 60갑자는 0~59(갑자~계해) 정수로 다룬다.
+# 2차원 표는 모두 1차원 bytes로 펼쳐 두었으므로 `TABLE[행 * 열수 + 열]` 한 번의
+# 인덱싱으로 조회된다. 모든 값은 모듈 로드 시 한 번만 계산된다.
+
+STEMS_KOR = ('갑', '을', '병', '정', '무', '기', '경', '신', '임', '계')
+STEMS_HANJA = ('甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸')
+BRANCHES_KOR = ('자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해')
+BRANCHES_HANJA = ('子', '丑', '寅', '卯', '辰', '巳', '午', '未', '申', '酉', '戌', '亥')
+
+ELEMENTS = ('목', '화', '토', '금', '수')
+POLARITIES = ('+', '-')
+TEN_GODS = ('비견', '겁재', '식신', '상관', '편재', '정재', '편관', '정관', '편인', '정인')
+TWELVE_STAGES = ('장생', '목욕', '관대', '건록', '제왕', '쇠', '병', '사', '묘', '절', '태', '양')
+
+# 글자 -> 인덱스 ('신'은 천간 辛과 지지 申이 겹치므로 천간/지지 사전을 분리)
+STEM_INDEX = {**{c: i for i, c in enumerate(STEMS_KOR)}, **{c: i for i, c in enumerate(STEMS_HANJA)}}
+BRANCH_INDEX = {**{c: i for i, c in enumerate(BRANCHES_KOR)}, **{c: i for i, c in enumerate(BRANCHES_HANJA)}}
+TEN_GOD_INDEX = {name: i for i, name in enumerate(TEN_GODS)}
+
+# 오행(0=목 ~ 4=수)과 음양(0=양, 1=음)
+STEM_ELEMENT = bytes(i // 2 for i in range(10))
+STEM_POLARITY = bytes(i % 2 for i in range(10))
+BRANCH_ELEMENT = bytes((4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4))
+BRANCH_POLARITY = bytes(i % 2 for i in range(12))
+
+# 지지의 대표 천간 (SajuAnalyzer의 간단화된 지장간 매핑과 동일)
+BRANCH_MAIN_STEM = bytes((9, 9, 0, 1, 4, 2, 3, 5, 6, 7, 4, 8))
+
+# 시각(0~23시) -> 시지: 23시와 0시는 자시, 이후 2시간 단위
+HOUR_BRANCH = bytes(((hour + 1) // 2) % 12 for hour in range(24))
+
+def _twelve_stage(stem, branch):
+    """천간의 지지별 십이운성 인덱스 (양간 순행, 음간 역행)"""
+    birth_branch = (11, 6, 2, 9, 2, 9, 5, 0, 8, 3)[stem]
+    if STEM_POLARITY[stem] == 0:
+        return (branch - birth_branch) % 12
+    return (birth_branch - branch) % 12
+
+# 십이운성: [천간 * 12 + 지지] (analyzer.calculate_sibiunseong에서 사용)
+TWELVE_STAGE = bytes(_twelve_stage(stem, branch) for stem in range(10) for branch in range(12))
+
+# 월간: [연간 * 12 + 월지] (갑기년 병인월 기준), 시간: [일간 * 12 + 시지] (갑기일 갑자시 기준)
+MONTH_STEM = bytes(
+    ((year_stem % 5) * 2 + 2 + (month_branch - 2) % 12) % 10
+    for year_stem in range(10) for month_branch in range(12)
+)
+HOUR_STEM = bytes(
+    ((day_stem % 5) * 2 + hour_branch) % 10
+    for day_stem in range(10) for hour_branch in range(12)
+)
+
+# 60갑자: 순번 -> 천간/지지, [천간 * 12 + 지지] -> 순번 (음양이 맞지 않는 조합은 255)
+GAPJA_STEM = bytes(i % 10 for i in range(60))
+GAPJA_INDEX = bytes(
+    next((i for i in range(60) if i % 10 == stem and i % 12 == branch), 255)
+    for stem in range(10) for branch in range(12)
+)
@@ -0,0 +1,165 @@
+# 로깅 설정 모듈
+#
+# 'saju' 로거 아래에 모든 로그를 모은다 (get_logger(__name__)).
+#   - 로그 호출은 레코드를 메모리 큐에 넣기만 하고, 실제 출력(stderr)은 별도
+#     스레드(QueueListener)가 한다. 큐가 가득 차면 레코드를 버리고 개수만 센다.
+#   - 레코드마다 현재 요청 ID(request_id)를 붙인다 (요청이 아니면 '-').
+#   - 분석 결과 같은 큰 내용은 payload 로거(get_payload_logger())로 남기며,
+#     SAJU_LOG_PAYLOAD_SAMPLE 비율만큼만 표본으로 기록한다 (기본 0 = 기록하지 않음).
+#     표본에서 빠진 호출은 메시지를 만들지 않으므로 비용이 거의 없다.
+#   SAJU_LOG_LEVEL (기본 INFO), SAJU_LOG_FORMAT (text | json, 기본 text),
+#   SAJU_LOG_QUEUE (큐 크기, 기본 10000), SAJU_LOG_PAYLOAD_SAMPLE (0-1, 기본 0)
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import uuid
+
+ROOT_LOGGER = 'saju'
+PAYLOAD_LOGGER = 'saju.payload'
+DEFAULT_LEVEL = 'INFO'
+DEFAULT_QUEUE_SIZE = 10000
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s'
+
+# 현재 요청 ID (스레드/태스크마다 따로 유지됨)
+_request_id = contextvars.ContextVar('saju_request_id', default='-')
+
+def new_request_id():
+    return uuid.uuid4().hex[:16]
+
+def get_request_id():
+    """현재 요청 ID (요청 처리 중이 아니면 '-')"""
+    return _request_id.get()
+
+def set_request_id(request_id):
+    """현재 요청 ID 설정, 되돌릴 때 쓰는 토큰 반환"""
+    return _request_id.set(request_id)
+
+def reset_request_id(token):
+    _request_id.reset(token)
+
+class RequestIdFilter(logging.Filter):
+    """레코드에 현재 요청 ID를 붙임 (로그를 호출한 스레드에서 실행됨)"""
+
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+class SampleFilter(logging.Filter):
+    """rate 비율의 레코드만 통과"""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return random.random() < self.rate
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 형식"""
+
+    def format(self, record):
+        return json.dumps({
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', '-'),
+            'message': record.getMessage()
+        }, ensure_ascii=False)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class _LoggingState:
+    """설정된 핸들러와 출력 스레드"""
+
+    def __init__(self, level, log_format, queue_size, payload_sample):
+        self.level = level
+        self.queue_size = queue_size
+        self.payload_sample = payload_sample
+        self.output = logging.StreamHandler(sys.stderr)
+        self.output.setFormatter(JsonFormatter() if log_format == 'json' else logging.Formatter(TEXT_FORMAT))
+        self.handler = DroppingQueueHandler(queue.Queue(queue_size))
+        self.handler.addFilter(RequestIdFilter())
+        self.listener = None
+
+    def start(self):
+        self.listener = logging.handlers.QueueListener(self.handler.queue, self.output)
+        self.listener.start()
+
+    def restart_after_fork(self):
+        # fork된 자식에는 출력 스레드가 없으므로 새 큐와 스레드로 다시 시작
+        self.handler.queue = queue.Queue(self.queue_size)
+        self.start()
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+_state = None
+_state_lock = threading.Lock()
+
+def configure_logging():
+    """환경 변수로 'saju' 로거 설정 (프로세스에서 한 번만 적용)"""
+    global _state
+    if _state is not None:
+        return _state
+    with _state_lock:
+        if _state is None:
+            state = _LoggingState(
+                level=os.environ.get('SAJU_LOG_LEVEL', DEFAULT_LEVEL).upper(),
+                log_format=os.environ.get('SAJU_LOG_FORMAT', 'text').lower(),
+                queue_size=int(os.environ.get('SAJU_LOG_QUEUE', DEFAULT_QUEUE_SIZE)),
+                payload_sample=float(os.environ.get('SAJU_LOG_PAYLOAD_SAMPLE', 0))
+            )
+            root = logging.getLogger(ROOT_LOGGER)
+            root.setLevel(state.level)
+            root.addHandler(state.handler)
+            # gunicorn 등이 루트 로거에 단 핸들러로 중복 출력되지 않도록
+            root.propagate = False
+
+            payload = logging.getLogger(PAYLOAD_LOGGER)
+            if state.payload_sample > 0:
+                payload.setLevel(logging.DEBUG)
+                payload.addFilter(SampleFilter(state.payload_sample))
+            else:
+                # 표본 비율 0이면 isEnabledFor 단계에서 바로 걸러짐
+                payload.setLevel(logging.CRITICAL + 1)
+
+            state.start()
+            atexit.register(state.stop)
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=state.restart_after_fork)
+            _state = state
+    return _state
+
+def get_logger(name):
+    """'saju.<name>' 로거 (처음 호출 시 로깅 설정)"""
+    configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+def get_payload_logger():
+    """큰 내용(요청/분석 결과)을 표본으로 남기는 로거, debug 레벨로 호출"""
+    configure_logging()
+    return logging.getLogger(PAYLOAD_LOGGER)
+
+def dropped_count():
+    """큐가 가득 차서 버린 로그 레코드 수"""
+    return _state.handler.dropped if _state is not None else 0
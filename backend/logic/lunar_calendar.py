@@ -0,0 +1,177 @@
+# 양력/음력 변환 모듈
+#
+# data/lunar_months.bin 에는 1900~2100년을 덮는 음력 달들의 시작일(1970-01-01
+# 기준 일수)과 음력 연도/월/윤달 여부가 열(column) 단위 배열로 저장되어 있다.
+# 마지막 항목은 범위 끝을 나타내는 다음 달의 시작일이다. 변환은 모두 이 배열에
+# 대한 이분 탐색 한 번으로 끝나며, 배치 변환은 같은 배열을 NumPy로 조회한다.
+#
+# 파일 형식 (little-endian)
+#   헤더: magic(4s) 'SJLM', version(H), reserved(H), count(I)
+#   본문: start_day int32 x count, year uint16 x count, month uint8 x count, is_leap uint8 x count
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+
+from .solar_terms import days_from_civil, civil_from_days
+
+try:
+    import numpy as np
+except ImportError:  # 배치 변환에서만 필요
+    np = None
+
+MAGIC = b'SJLM'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'lunar_months.bin')
+
+def month_key(year, month, is_leap):
+    """음력 달의 정렬 키 (같은 해 안에서 평달 다음에 같은 번호의 윤달이 온다)"""
+    return year * 32 + month * 2 + is_leap
+
+def _column(buffer, offset, typecode, count):
+    """mmap 버퍼의 한 열을 복사 없이 (big-endian이면 복사 후 변환) 읽음"""
+    size = array(typecode).itemsize * count
+    view = memoryview(buffer)[offset:offset + size].cast(typecode)
+    if sys.byteorder == 'little' or size == count:
+        return view
+    column = array(typecode, view)
+    column.byteswap()
+    return column
+
+class LunarCalendar:
+    """음력 달 시작일 테이블 기반 양력/음력 변환기"""
+
+    def __init__(self, path=DEFAULT_TABLE_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"음력 테이블 형식이 올바르지 않습니다: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 음력 테이블 버전입니다: {version}")
+        if len(self._mmap) != HEADER.size + count * 8:
+            raise ValueError(f"음력 테이블 크기가 헤더와 맞지 않습니다: {path}")
+
+        offset = HEADER.size
+        self.start_days = _column(self._mmap, offset, 'i', count)
+        offset += count * 4
+        self.years = _column(self._mmap, offset, 'H', count)
+        offset += count * 2
+        self.months = _column(self._mmap, offset, 'B', count)
+        offset += count
+        self.leaps = _column(self._mmap, offset, 'B', count)
+
+        # 음력 -> 양력 조회용 정렬 키 (수천 개뿐이므로 로드 시 한 번 계산)
+        self.keys = array('i', (
+            month_key(self.years[i], self.months[i], self.leaps[i]) for i in range(count)
+        ))
+        self.count = count
+
+    def solar_to_lunar(self, year, month, day):
+        """양력 날짜 -> {'year', 'month', 'day', 'is_leap'}"""
+        days = days_from_civil(year, month, day)
+        index = bisect_right(self.start_days, days) - 1
+        if index < 0 or index >= self.count - 1:
+            raise ValueError("음력 변환 범위를 벗어난 날짜입니다.")
+        return {
+            'year': self.years[index],
+            'month': self.months[index],
+            'day': days - self.start_days[index] + 1,
+            'is_leap': bool(self.leaps[index])
+        }
+
+    def lunar_to_solar(self, year, month, day, is_leap=False):
+        """음력 날짜 -> 양력 (연, 월, 일)"""
+        key = month_key(year, month, int(bool(is_leap)))
+        index = bisect_right(self.keys, key) - 1
+        if index < 0 or index >= self.count - 1 or self.keys[index] != key:
+            raise ValueError("존재하지 않는 음력 달입니다.")
+        if not 1 <= day <= self.start_days[index + 1] - self.start_days[index]:
+            raise ValueError("음력 날짜가 해당 달의 일수를 벗어났습니다.")
+        return civil_from_days(self.start_days[index] + day - 1)
+
+    def solar_to_lunar_batch(self, years, months, days):
+        """양력 배열 -> (음력 연, 월, 일, 윤달 여부) NumPy 배열"""
+        start_days, lunar_years, lunar_months, leaps, _ = self._arrays()
+        epoch_days = days_from_civil(
+            np.asarray(years, dtype=np.int64), np.asarray(months, dtype=np.int64), np.asarray(days, dtype=np.int64)
+        )
+        index = np.searchsorted(start_days, epoch_days, side='right') - 1
+        if ((index < 0) | (index >= self.count - 1)).any():
+            raise ValueError("음력 변환 범위를 벗어난 날짜가 있습니다.")
+        return lunar_years[index], lunar_months[index], epoch_days - start_days[index] + 1, leaps[index].astype(bool)
+
+    def lunar_to_solar_batch(self, years, months, days, is_leap=None):
+        """음력 배열 -> 양력 (연, 월, 일) NumPy 배열"""
+        start_days, _, _, _, keys = self._arrays()
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        leaps = np.zeros_like(years) if is_leap is None else np.asarray(is_leap, dtype=np.int64)
+        wanted = month_key(years, months, leaps)
+        index = np.searchsorted(keys, wanted, side='right') - 1
+        valid = (index >= 0) & (index < self.count - 1)
+        index = np.where(valid, index, 0)
+        valid &= keys[index] == wanted
+        valid &= (days >= 1) & (days <= start_days[index + 1] - start_days[index])
+        if not valid.all():
+            raise ValueError("존재하지 않는 음력 날짜가 있습니다.")
+        return civil_from_days(start_days[index] + days - 1)
+
+    def _arrays(self):
+        """배치 변환용 NumPy 배열 (최초 호출 시 한 번 생성)"""
+        if np is None:
+            raise ImportError("배치 음력 변환에는 numpy가 필요합니다 (pip install numpy)")
+        arrays = self.__dict__.get('_np_arrays')
+        if arrays is None:
+            arrays = self._np_arrays = (
+                np.asarray(self.start_days, dtype=np.int64),
+                np.asarray(self.years, dtype=np.int64),
+                np.asarray(self.months, dtype=np.int64),
+                np.asarray(self.leaps, dtype=np.int64),
+                np.asarray(self.keys, dtype=np.int64)
+            )
+        return arrays
+
+def write_table(path, months):
+    """(시작일, 음력 연, 월, 윤달 여부) 목록을 테이블 파일로 저장 (마지막 항목은 범위 끝)"""
+    columns = (
+        array('i', (m[0] for m in months)),
+        array('H', (m[1] for m in months)),
+        array('B', (m[2] for m in months)),
+        array('B', (int(m[3]) for m in months))
+    )
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(months)))
+        for column in columns:
+            if sys.byteorder != 'little':
+                column.byteswap()
+            f.write(column.tobytes())
+
+# 프로세스 전역 변환기 (preload 시점에 열어 두면 워커가 그대로 물려받음)
+_calendar = None
+_calendar_lock = threading.Lock()
+
+def get_lunar_calendar():
+    """프로세스 전역 LunarCalendar를 반환 (최초 호출 시 한 번만 연다)"""
+    global _calendar
+    calendar = _calendar
+    if calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = LunarCalendar(os.environ.get('SAJU_LUNAR_TABLE_PATH', DEFAULT_TABLE_PATH))
+            calendar = _calendar
+    return calendar
+
+def reload_lunar_calendar():
+    """테이블 파일을 다시 열어 프로세스 전역 LunarCalendar를 교체 (HUP 재시작용, 이전 것은 닫지 않음)"""
+    global _calendar
+    with _calendar_lock:
+        _calendar = LunarCalendar(os.environ.get('SAJU_LUNAR_TABLE_PATH', DEFAULT_TABLE_PATH))
+        return _calendar
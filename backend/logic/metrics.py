@@ -0,0 +1,378 @@
+# 메트릭 모듈 (Prometheus 텍스트 형식)
+#
+# 카운터와 히스토그램 값을 프로세스마다 따로 기록하고, /metrics 요청 때 모든
+# 프로세스의 값을 더해 내보낸다.
+#   - SAJU_METRICS_DIR이 있으면 각 프로세스가 그 디렉터리의 <pid>.db 파일(mmap)에
+#     값을 쓴다. gunicorn 워커와 분석 프로세스 풀 워커가 모두 같은 디렉터리를 쓰므로
+#     어느 워커가 /metrics를 받아도 서버 전체 합계가 나온다.
+#   - 없으면 현재 프로세스 메모리에만 기록한다.
+# 카운터/히스토그램은 줄지 않는 값이므로 종료된 프로세스의 파일도 계속 합산한다.
+# gunicorn 마스터는 워커가 종료되면 그 파일을 archive.db에 합치고 지운다.
+#
+# 값 파일 형식 (little-endian, 쓰는 프로세스는 하나)
+#   헤더: 사용한 바이트 수(I), 4바이트 패딩
+#   항목: 키 길이(I), 키(UTF-8, 8바이트 경계까지 0으로 채움), 값(float64)
+import atexit
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 읽음
+    fcntl = None
+
+HEADER = struct.Struct('<I4x')
+KEY_LENGTH = struct.Struct('<I')
+VALUE = struct.Struct('<d')
+INITIAL_FILE_SIZE = 64 * 1024
+ARCHIVE_FILE = 'archive.db'
+LOCK_FILE = '.lock'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 요청 처리 시간 버킷 (초)
+REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 분석 단계(노드) 시간 버킷 (초), 단계 하나는 수십 마이크로초 ~ 수 밀리초
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+
+def _key_slots(key):
+    """키 항목 전체 크기 (값 위치가 8바이트 경계에 오도록 채움)"""
+    head = KEY_LENGTH.size + len(key)
+    return head + (-head % 8) + VALUE.size
+
+def _iter_entries(data, used):
+    """값 파일 내용에서 (키, 값, 값 위치)를 차례로 꺼냄"""
+    offset = HEADER.size
+    while offset < used:
+        length = KEY_LENGTH.unpack_from(data, offset)[0]
+        start = offset + KEY_LENGTH.size
+        key = bytes(data[start:start + length]).decode('utf-8')
+        position = offset + _key_slots(key.encode('utf-8')) - VALUE.size
+        yield key, VALUE.unpack_from(data, position)[0], position
+        offset = position + VALUE.size
+
+class ValueFile:
+    """프로세스 하나의 메트릭 값 파일 (키 -> float64)
+
+    새 키는 항목을 다 쓴 뒤에 헤더의 사용 바이트 수를 늘리므로, 다른 프로세스가
+    언제 읽어도 반쯤 쓰인 항목은 보이지 않는다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a+b')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < INITIAL_FILE_SIZE:
+            self._file.truncate(INITIAL_FILE_SIZE)
+            size = INITIAL_FILE_SIZE
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._used = HEADER.unpack_from(self._map, 0)[0] or HEADER.size
+        self._positions = {key: position for key, _, position in _iter_entries(self._map, self._used)}
+
+    def add(self, key, amount):
+        with self._lock:
+            position = self._positions.get(key)
+            if position is None:
+                position = self._append(key)
+            VALUE.pack_into(self._map, position, VALUE.unpack_from(self._map, position)[0] + amount)
+
+    def _append(self, key):
+        encoded = key.encode('utf-8')
+        size = _key_slots(encoded)
+        if self._used + size > len(self._map):
+            new_size = len(self._map)
+            while self._used + size > new_size:
+                new_size *= 2
+            self._file.truncate(new_size)
+            old_map, self._map = self._map, mmap.mmap(self._file.fileno(), new_size)
+            old_map.close()
+        KEY_LENGTH.pack_into(self._map, self._used, len(encoded))
+        start = self._used + KEY_LENGTH.size
+        self._map[start:start + len(encoded)] = encoded
+        position = self._used + size - VALUE.size
+        VALUE.pack_into(self._map, position, 0.0)
+        self._used += size
+        HEADER.pack_into(self._map, 0, self._used)
+        self._positions[key] = position
+        return position
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+def read_value_file(path):
+    """값 파일 하나의 {키: 값}"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        return {}
+    used = min(HEADER.unpack_from(data, 0)[0], len(data))
+    return {key: value for key, value, _ in _iter_entries(data, used)}
+
+class MemoryValues:
+    """공유 디렉터리가 없을 때 쓰는 프로세스 메모리 값 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def add(self, key, amount):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def close(self):
+        pass
+
+# 프로세스별 값 저장소 (처음 기록할 때 만들고, fork된 자식에서는 새로 만든다)
+_store = None
+_store_lock = threading.Lock()
+
+def metrics_dir():
+    """공유 메트릭 디렉터리 (SAJU_METRICS_DIR), 없으면 None"""
+    return os.environ.get('SAJU_METRICS_DIR') or None
+
+def _values():
+    global _store
+    store = _store
+    if store is None:
+        with _store_lock:
+            if _store is None:
+                directory = metrics_dir()
+                if directory is None:
+                    _store = MemoryValues()
+                else:
+                    os.makedirs(directory, exist_ok=True)
+                    _store = ValueFile(os.path.join(directory, f"{os.getpid()}.db"))
+            store = _store
+    return store
+
+def _reset_after_fork():
+    # 부모의 값은 부모 파일에 남아 있으므로 자식은 자기 파일에 새로 기록
+    global _store, _store_lock
+    _store = None
+    _store_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+@contextmanager
+def _dir_lock(directory, exclusive):
+    """메트릭 디렉터리 잠금 (읽기는 공유, archive 합치기는 배타)"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(directory, LOCK_FILE), 'a+b') as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def collect_values():
+    """모든 프로세스의 값을 키별로 더한 {키: 값}"""
+    directory = metrics_dir()
+    if directory is None or not os.path.isdir(directory):
+        store = _store
+        return store.snapshot() if isinstance(store, MemoryValues) else {}
+    totals = {}
+    with _dir_lock(directory, exclusive=False):
+        for name in os.listdir(directory):
+            if not name.endswith('.db'):
+                continue
+            try:
+                values = read_value_file(os.path.join(directory, name))
+            except FileNotFoundError:
+                continue
+            for key, value in values.items():
+                totals[key] = totals.get(key, 0.0) + value
+    return totals
+
+# prepare_metrics_dir가 직접 만든 임시 디렉터리 (경로, 만든 프로세스 pid)
+_created_dir = None
+
+def prepare_metrics_dir(clear=False):
+    """공유 메트릭 디렉터리 준비 (SAJU_METRICS_DIR이 없으면 임시 디렉터리를 만들어 설정)
+
+    이후 만드는 자식 프로세스는 환경 변수를 물려받아 같은 디렉터리를 쓴다.
+    직접 만든 임시 디렉터리는 remove_metrics_dir(서버 종료 훅, 없으면 atexit)로 지운다.
+    clear=True면 이전 실행이 남긴 값 파일을 지운다 (서버 시작 시 한 번만).
+    """
+    global _created_dir
+    directory = metrics_dir()
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix='saju-metrics-')
+        os.environ['SAJU_METRICS_DIR'] = directory
+        _created_dir = (directory, os.getpid())
+        atexit.register(remove_metrics_dir)
+    elif clear and os.path.isdir(directory):
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+def remove_metrics_dir():
+    """prepare_metrics_dir가 만든 임시 디렉터리를 지움 (설정된 SAJU_METRICS_DIR은 그대로 둠)"""
+    global _created_dir
+    # fork된 자식(gunicorn 워커)에도 이 값과 atexit 등록이 복사되므로 만든 프로세스에서만 지운다
+    if _created_dir is None or _created_dir[1] != os.getpid():
+        return
+    directory, _created_dir = _created_dir[0], None
+    shutil.rmtree(directory, ignore_errors=True)
+
+def archive_process(pid):
+    """종료된 프로세스의 값 파일을 archive.db에 합치고 지움 (gunicorn 마스터에서 호출)"""
+    directory = metrics_dir()
+    if directory is None:
+        return
+    path = os.path.join(directory, f"{pid}.db")
+    if not os.path.exists(path):
+        return
+    with _dir_lock(directory, exclusive=True):
+        archive = ValueFile(os.path.join(directory, ARCHIVE_FILE))
+        try:
+            for key, value in read_value_file(path).items():
+                archive.add(key, value)
+        finally:
+            archive.close()
+        os.remove(path)
+
+class _Metric:
+    """메트릭 정의 (이름, 설명, 라벨 이름)"""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        _registry.append(self)
+
+    def labels(self, *values):
+        """라벨 값 조합 하나의 기록기 (라벨 이름 순서대로)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} 라벨 개수가 맞지 않습니다: {values}")
+            child = self._children.setdefault(values, self._make_child(tuple(str(v) for v in values)))
+        return child
+
+    def _key(self, suffix, values):
+        return '\t'.join((self.name, suffix) + values)
+
+class _CounterChild:
+    def __init__(self, key):
+        self._key = key
+
+    def inc(self, amount=1.0):
+        _values().add(self._key, amount)
+
+class Counter(_Metric):
+    """증가만 하는 값"""
+
+    kind = 'counter'
+
+    def _make_child(self, values):
+        return _CounterChild(self._key('', values))
+
+class _HistogramChild:
+    def __init__(self, buckets, bucket_keys, sum_key, count_key):
+        self._buckets = buckets
+        self._bucket_keys = bucket_keys
+        self._sum_key = sum_key
+        self._count_key = count_key
+
+    def observe(self, value):
+        # 버킷별 개수는 겹치지 않게 기록하고 내보낼 때 누적
+        store = _values()
+        store.add(self._bucket_keys[bisect_left(self._buckets, value)], 1.0)
+        store.add(self._sum_key, value)
+        store.add(self._count_key, 1.0)
+
+class Histogram(_Metric):
+    """버킷별 관측 개수, 합계, 개수"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=REQUEST_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _make_child(self, values):
+        bucket_keys = [self._key(f"bucket:{index}", values) for index in range(len(self.buckets) + 1)]
+        return _HistogramChild(self.buckets, bucket_keys, self._key('sum', values), self._key('count', values))
+
+_registry = []
+
+# 요청/단계/캐시 메트릭
+REQUESTS = Counter('saju_http_requests_total', "HTTP 요청 수", ('route', 'method', 'status'))
+REQUEST_SECONDS = Histogram('saju_http_request_duration_seconds', "HTTP 요청 처리 시간 (스트리밍은 첫 응답까지)",
+                            ('route', 'method', 'status'), REQUEST_BUCKETS)
+STAGE_SECONDS = Histogram('saju_stage_duration_seconds', "분석 단계별 처리 시간 (팔자 계산, 분석 노드, 직렬화, 압축)",
+                          ('stage',), STAGE_BUCKETS)
+CACHE_LOOKUPS = Counter('saju_cache_lookups_total', "캐시 조회 수 (result: 분석 결과, body: 응답 본문)",
+                        ('cache', 'result'))
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+def _bound(bound):
+    return repr(float(bound))
+
+def render():
+    """모든 프로세스의 합계를 Prometheus 텍스트 형식으로"""
+    values = collect_values()
+    series = {}
+    for key, value in values.items():
+        name, suffix, *labels = key.split('\t')
+        series.setdefault(name, {}).setdefault(tuple(labels), {})[suffix] = value
+
+    lines = []
+    for metric in _registry:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for labels, samples in sorted(series.get(metric.name, {}).items()):
+            if metric.kind == 'counter':
+                lines.append(f"{metric.name}{_labels(metric.labelnames, labels)} {_number(samples.get('', 0.0))}")
+                continue
+            cumulative = 0.0
+            for index, bound in enumerate(metric.buckets + (None,)):
+                cumulative += samples.get(f"bucket:{index}", 0.0)
+                le = _bound(bound) if bound is not None else '+Inf'
+                lines.append(f"{metric.name}_bucket{_labels(metric.labelnames, labels, (('le', le),))} {_number(cumulative)}")
+            lines.append(f"{metric.name}_sum{_labels(metric.labelnames, labels)} {repr(samples.get('sum', 0.0))}")
+            lines.append(f"{metric.name}_count{_labels(metric.labelnames, labels)} {_number(samples.get('count', 0.0))}")
+
+    # 캐시 적중률 (cache별 hit / (hit + miss))
+    lookups = series.get(CACHE_LOOKUPS.name, {})
+    caches = sorted({labels[0] for labels in lookups})
+    lines.append("# HELP saju_cache_hit_ratio 캐시 적중률 (전체 프로세스 합계 기준)")
+    lines.append("# TYPE saju_cache_hit_ratio gauge")
+    for cache in caches:
+        hits = lookups.get((cache, 'hit'), {}).get('', 0.0)
+        misses = lookups.get((cache, 'miss'), {}).get('', 0.0)
+        if hits + misses:
+            lines.append(f'saju_cache_hit_ratio{{cache="{_escape(cache)}"}} {repr(hits / (hits + misses))}')
+    return '\n'.join(lines) + '\n'
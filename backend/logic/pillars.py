@@ -0,0 +1,79 @@
+# 사주 팔자 값 타입 모듈
+from typing import NamedTuple
+
+from .ganji_tables import (
+    STEMS_KOR, STEMS_HANJA, BRANCHES_KOR, BRANCHES_HANJA, STEM_INDEX, BRANCH_INDEX, GAPJA_INDEX
+)
+
+POSITIONS = ('year', 'month', 'day', 'hour')
+
+class Pillars(NamedTuple):
+    """사주 팔자 (천간 0~9, 지지 0~11 정수 8개)
+
+    튜플 기반이라 인스턴스 dict가 없고, 해시 가능하므로 그대로 캐시 키로 쓸 수 있다.
+    화면에 표시할 문자열로는 JSON 응답을 만들 때만 변환한다.
+    """
+    year_gan: int
+    year_ji: int
+    month_gan: int
+    month_ji: int
+    day_gan: int
+    day_ji: int
+    hour_gan: int
+    hour_ji: int
+
+    @classmethod
+    def from_dict(cls, saju_pillars):
+        """{'year': {'gan': '갑', 'ji': '자'}, ...} 형태에서 생성 (한글/한자 모두 허용)"""
+        return cls(*(
+            index[saju_pillars[position][part]]
+            for position in POSITIONS
+            for part, index in (('gan', STEM_INDEX), ('ji', BRANCH_INDEX))
+        ))
+
+    @classmethod
+    def from_chars(cls, pillars_char):
+        """{'year_gan': '甲', 'year_ji': '子', ...} 형태에서 생성 (한글/한자 모두 허용)"""
+        return cls(*(
+            index[pillars_char[f'{position}_{part}']]
+            for position in POSITIONS
+            for part, index in (('gan', STEM_INDEX), ('ji', BRANCH_INDEX))
+        ))
+
+    @classmethod
+    def from_code(cls, code):
+        """to_code()가 만든 16진수(소문자) 8글자에서 생성 (잘못된 값은 ValueError)"""
+        if not isinstance(code, str) or len(code) != 8:
+            raise ValueError(f"팔자 코드는 16진수 8글자여야 합니다: {code!r}")
+        values = ['0123456789ab'.find(char) for char in code]
+        for gan, ji in zip(values[::2], values[1::2]):
+            if not 0 <= gan <= 9 or ji < 0 or GAPJA_INDEX[gan * 12 + ji] == 255:
+                raise ValueError(f"올바른 60갑자가 아닙니다: {code!r}")
+        return cls(*values)
+
+    def gan(self, position):
+        """기둥('year', 'month', 'day', 'hour')의 천간 인덱스"""
+        return self[POSITIONS.index(position) * 2]
+
+    def ji(self, position):
+        """기둥('year', 'month', 'day', 'hour')의 지지 인덱스"""
+        return self[POSITIONS.index(position) * 2 + 1]
+
+    def to_dict(self):
+        """표시용 한글 중첩 dict ({'year': {'gan': '갑', 'ji': '자'}, ...})"""
+        return {
+            position: {'gan': STEMS_KOR[self[i * 2]], 'ji': BRANCHES_KOR[self[i * 2 + 1]]}
+            for i, position in enumerate(POSITIONS)
+        }
+
+    def to_code(self):
+        """URL 등에 쓰는 16진수 8글자 (천간/지지 인덱스를 한 글자씩, 예: '66759697')"""
+        return ''.join('%x' % value for value in self)
+
+    def to_chars(self):
+        """한자 평면 dict ({'year_gan': '甲', 'year_ji': '子', ...})"""
+        chars = {}
+        for i, position in enumerate(POSITIONS):
+            chars[f'{position}_gan'] = STEMS_HANJA[self[i * 2]]
+            chars[f'{position}_ji'] = BRANCHES_HANJA[self[i * 2 + 1]]
+        return chars
@@ -0,0 +1,125 @@
+# 분석 파이프라인 (의존성 그래프 실행기)
+#
+# 각 노드는 이름, 계산 함수, 입력 노드 이름 목록으로 등록한다. 실행 시 요청한
+# 노드와 그 선행 노드만 한 번씩 계산하며, 중간 결과(예: 십성)는 여러 분석기가
+# 공유한다. 노드마다 경과 시간(wall)과 CPU 시간을 기록한다 (wall은 /metrics 단계별
+# 히스토그램에도 기록).
+#
+# 스레드 풀을 주면 입력이 준비된 노드들을 동시에 실행한다. GIL이 있는 빌드에서는
+# 순수 파이썬 분석기가 병렬로 돌지 않으므로 기본값은 순차 실행이고, free-threaded
+# 빌드(python3.13t 등)에서만 기본으로 스레드 풀을 쓴다 (SAJU_PIPELINE_WORKERS로 조정).
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .metrics import STAGE_SECONDS
+
+def default_worker_count():
+    """SAJU_PIPELINE_WORKERS 환경 변수, 없으면 free-threaded 빌드에서만 4 (0이면 순차 실행)"""
+    value = os.environ.get('SAJU_PIPELINE_WORKERS')
+    if value is not None:
+        return max(int(value), 0)
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    return 0 if gil_enabled else 4
+
+class Pipeline:
+    """분석 노드 DAG와 실행기"""
+
+    def __init__(self, inputs=()):
+        self.inputs = frozenset(inputs)
+        self.nodes = {}
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def add(self, name, func, inputs=()):
+        """노드 등록 (입력 노드는 먼저 등록되어 있어야 하며, 등록 순서가 곧 순차 실행 순서)"""
+        missing = [dep for dep in inputs if dep not in self.nodes and dep not in self.inputs]
+        if missing:
+            raise ValueError(f"등록되지 않은 입력 노드: {', '.join(missing)}")
+        self.nodes[name] = (func, tuple(inputs))
+
+    def required(self, targets):
+        """targets와 그 선행 노드 전체 (외부 입력 제외), 등록 순서대로"""
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name in needed or name in self.inputs:
+                continue
+            if name not in self.nodes:
+                raise ValueError(f"알 수 없는 노드: {name}")
+            needed.add(name)
+            pending.extend(self.nodes[name][1])
+        return [name for name in self.nodes if name in needed]
+
+    def run(self, values, targets, executor=None, timings=None):
+        """targets 계산에 필요한 노드를 실행하며 완료되는 대로 (이름, 값)을 내보냄
+
+        values에는 외부 입력을 넣고, 계산된 노드 값도 여기에 채워진다.
+        timings(dict)를 주면 노드별 (wall 초, CPU 초)를 기록한다.
+        """
+        order = self.required(targets)
+        if executor is None:
+            for name in order:
+                values[name] = self._run_node(name, values, timings)
+                yield name, values[name]
+            return
+
+        remaining = {name: set(self.nodes[name][1]) - self.inputs for name in order}
+        running = {}
+        try:
+            while remaining or running:
+                for name in [n for n, deps in remaining.items() if deps.issubset(values)]:
+                    del remaining[name]
+                    running[executor.submit(self._run_node, name, values, timings)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    values[name] = future.result()
+                    yield name, values[name]
+        finally:
+            for future in running:
+                future.cancel()
+
+    def _run_node(self, name, values, timings):
+        func, inputs = self.nodes[name]
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        result = func(*(values[dep] for dep in inputs))
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        if timings is not None:
+            timings[name] = (wall, cpu)
+        with self._stats_lock:
+            count, total_wall, total_cpu = self._stats.get(name, (0, 0.0, 0.0))
+            self._stats[name] = (count + 1, total_wall + wall, total_cpu + cpu)
+        STAGE_SECONDS.labels(name).observe(wall)
+        return result
+
+    def stats(self):
+        """노드별 누적 실행 통계 {이름: {'count', 'wall_ms', 'cpu_ms'}}"""
+        with self._stats_lock:
+            return {
+                name: {'count': count, 'wall_ms': round(wall * 1000, 3), 'cpu_ms': round(cpu * 1000, 3)}
+                for name, (count, wall, cpu) in self._stats.items()
+            }
+
+# 프로세스 전역 스레드 풀 (fork 이후 워커에서 처음 쓸 때 만든다)
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """파이프라인용 스레드 풀, 순차 실행 설정이면 None"""
+    global _executor
+    executor = _executor
+    if executor is None:
+        workers = default_worker_count()
+        if workers == 0:
+            return None
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='saju-pipeline')
+            executor = _executor
+    return executor
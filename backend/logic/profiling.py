@@ -0,0 +1,154 @@
+# 요청 단위 프로파일링 모듈
+#
+# 운영자가 /analysis?profile=... 로 요청 하나를 프로파일러 아래에서 실행해 볼 때 쓴다.
+# SAJU_PROFILE_TOKEN이 설정되어 있고 요청의 X-Profile-Token 헤더가 같을 때만 켜진다.
+#   - cprofile: cProfile(결정적)로 실행하고 누적 시간 상위 함수 목록을 돌려준다.
+#   - sample: 별도 스레드가 interval마다 실행 중인 스택을 기록하고, flame graph 도구
+#     (flamegraph.pl, speedscope 등)가 읽는 collapsed stack 파일로 저장한다.
+# 프로세스 전체 설정(스위치 간격)을 바꾸므로 한 번에 하나의 프로파일만 실행한다.
+#   SAJU_PROFILE_TOKEN (없으면 비활성), SAJU_PROFILE_DIR (collapsed 파일 위치, 기본 임시 디렉터리),
+#   SAJU_PROFILE_INTERVAL_MS (샘플 간격, 기본 1)
+import cProfile
+import hmac
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+
+PROFILE_MODES = ('cprofile', 'sample')
+DEFAULT_TOP = 30
+DEFAULT_INTERVAL_MS = 1.0
+
+class ProfilerBusy(Exception):
+    """다른 요청의 프로파일이 실행 중"""
+
+# 한 번에 하나의 프로파일만 실행
+_profile_lock = threading.Lock()
+
+def check_token(token):
+    """요청 토큰이 SAJU_PROFILE_TOKEN과 같은지 (설정되어 있지 않으면 항상 False)"""
+    expected = os.environ.get('SAJU_PROFILE_TOKEN', '')
+    return bool(expected) and bool(token) and hmac.compare_digest(token.encode(), expected.encode())
+
+def _function_name(filename, line, name):
+    if filename == '~':
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+def run_cprofile(func, top=DEFAULT_TOP):
+    """func()를 cProfile로 실행해 (결과, 보고서) 반환
+
+    보고서의 functions는 누적 시간 상위 top개 함수의 호출 수, 자체 시간, 누적 시간(ms)이다.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("다른 프로파일이 실행 중입니다")
+    try:
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        result = profiler.runcall(func)
+        elapsed = time.perf_counter() - started
+    finally:
+        _profile_lock.release()
+
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    return result, {
+        'mode': 'cprofile',
+        'total_ms': round(elapsed * 1000, 3),
+        'functions': [
+            {
+                'function': _function_name(*key),
+                'calls': calls,
+                'self_ms': round(self_time * 1000, 3),
+                'cumulative_ms': round(cumulative * 1000, 3)
+            }
+            for key, (_, calls, self_time, cumulative, _) in rows
+        ]
+    }
+
+class SamplingProfiler:
+    """스레드 하나의 스택을 주기적으로 기록하는 샘플링 프로파일러
+
+    run(func)을 호출한 프레임 아래의 스택만 기록하며, 스택은 루트부터
+    '파일:함수' 이름을 ';'로 이은 collapsed 형식의 키로 센다.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL_MS / 1000):
+        self.interval = interval
+        self.stacks = {}
+        self.samples = 0
+
+    def run(self, func):
+        target = threading.get_ident()
+        root = sys._getframe()
+        stop = threading.Event()
+        sampler = threading.Thread(target=self._sample, args=(target, root, stop), daemon=True)
+        # GIL 전환 간격이 샘플 간격보다 길면 샘플러가 제때 깨어나지 못하므로 잠시 줄임
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval / 2))
+        sampler.start()
+        try:
+            return func()
+        finally:
+            stop.set()
+            sampler.join()
+            sys.setswitchinterval(switch_interval)
+
+    def _sample(self, target, root, stop):
+        while not stop.wait(self.interval):
+            frame = sys._current_frames().get(target)
+            names = []
+            while frame is not None and frame is not root:
+                code = frame.f_code
+                names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if frame is None or not names:
+                # run() 밖(시작/종료 직전)에서 잡힌 샘플
+                continue
+            stack = ';'.join(reversed(names))
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.samples += 1
+
+    def collapsed(self):
+        """collapsed stack 형식 줄 목록 ('a;b;c 개수', 많은 순)"""
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1])]
+
+    def top_functions(self, top=DEFAULT_TOP):
+        """자체(스택 맨 끝) 샘플 수 상위 함수"""
+        counts = {}
+        for stack, count in self.stacks.items():
+            leaf = stack.rsplit(';', 1)[-1]
+            counts[leaf] = counts.get(leaf, 0) + count
+        return [
+            {'function': name, 'samples': count}
+            for name, count in sorted(counts.items(), key=lambda item: -item[1])[:top]
+        ]
+
+def run_sampling(func, name, top=DEFAULT_TOP):
+    """func()를 샘플링 프로파일러로 실행하고 collapsed stack 파일을 저장해 (결과, 보고서) 반환"""
+    interval_ms = float(os.environ.get('SAJU_PROFILE_INTERVAL_MS', DEFAULT_INTERVAL_MS))
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("다른 프로파일이 실행 중입니다")
+    try:
+        profiler = SamplingProfiler(interval_ms / 1000)
+        started = time.perf_counter()
+        result = profiler.run(func)
+        elapsed = time.perf_counter() - started
+    finally:
+        _profile_lock.release()
+
+    directory = os.environ.get('SAJU_PROFILE_DIR') or tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"profile-{name}.collapsed")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(profiler.collapsed()) + '\n')
+    return result, {
+        'mode': 'sample',
+        'total_ms': round(elapsed * 1000, 3),
+        'interval_ms': interval_ms,
+        'samples': profiler.samples,
+        'collapsed_file': path,
+        'functions': profiler.top_functions(top)
+    }
@@ -1,4 +1,8 @@
 # 리포트 생성 모듈
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
 class ReportGenerator:
     """종합 리포트를 생성하는 클래스"""
     
@@ -15,12 +19,14 @@ class ReportGenerator:
                 'daeun_analysis': self._format_daeun_analysis(analysis_results.get('daeun_analysis', {}))
             }
         except Exception as e:
-            print(f"리포트 생성 중 오류: {str(e)}")
+            logger.error("리포트 생성 중 오류: %s", e)
             return self._get_default_report()
     
     def _generate_final_summary(self, analysis_results):
         """최종 요약 생성"""
-        saju_pillars = analysis_results.get('saju_pillars', {})
+        # 정수 Pillars는 리포트 문구에 넣을 때만 표시용 문자열로 변환
+        pillars = analysis_results.get('saju_pillars')
+        saju_pillars = pillars.to_dict() if pillars is not None else {}
         ilju = saju_pillars.get('day', '미확인')
         
         content = f"""【종합 리포트】
@@ -0,0 +1,133 @@
+# 분석 결과 캐시 모듈
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from .metrics import CACHE_LOOKUPS
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# 항목 하나에 붙일 수 있는 부가 데이터 개수 (예: 인코딩별 압축 본문)
+MAX_ATTACHMENTS = 8
+
+class ResultCache:
+    """차트 키로 분석 결과를 보관하는 LRU 캐시
+
+    항목 수와 추정 바이트 수 두 가지 한도를 두고, 어느 쪽이든 넘으면
+    가장 오래 사용되지 않은 항목부터 제거한다. 저장된 결과는 여러 요청이
+    공유하므로 호출 측에서 수정해서는 안 된다.
+
+    항목마다 직렬화/압축된 응답 본문 같은 부가 데이터를 붙여 둘 수 있으며,
+    부가 데이터는 항목 크기에 합산되고 항목과 함께 제거된다.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수(SAJU_RESULT_CACHE_ENTRIES, SAJU_RESULT_CACHE_BYTES)로 생성"""
+        return cls(
+            max_entries=int(os.environ.get('SAJU_RESULT_CACHE_ENTRIES', DEFAULT_MAX_ENTRIES)),
+            max_bytes=int(os.environ.get('SAJU_RESULT_CACHE_BYTES', DEFAULT_MAX_BYTES))
+        )
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key):
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        CACHE_LOOKUPS.labels('result', 'miss' if entry is None else 'hit').inc()
+        return entry[0] if entry is not None else None
+
+    def __contains__(self, key):
+        """항목이 있는지 (적중/미스 횟수와 LRU 순서는 바꾸지 않음)"""
+        with self._lock:
+            return key in self._entries
+
+    def get_attachment(self, key, name):
+        """항목에 붙여 둔 부가 데이터 조회 (항목이 없거나 붙인 적이 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            data = entry[2].get(name) if entry is not None else None
+        CACHE_LOOKUPS.labels('body', 'miss' if data is None else 'hit').inc()
+        return data
+
+    def attach(self, key, name, data):
+        """항목에 부가 데이터를 붙임 (항목이 없거나 이미 MAX_ATTACHMENTS개면 무시)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or name in entry[2] or len(entry[2]) >= MAX_ATTACHMENTS:
+                return
+            entry[2][name] = data
+            size = _estimate_size(data)
+            self._entries[key] = (entry[0], entry[1] + size, entry[2])
+            self._bytes += size
+            self._evict()
+
+    def put(self, key, value):
+        """결과 저장 후 한도를 넘는 항목 제거"""
+        if not self.enabled:
+            return
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size, {})
+            self._bytes += size
+            self._evict()
+
+    def _evict(self):
+        """한도를 넘는 동안 가장 오래된 항목 제거 (락을 잡은 상태에서 호출)"""
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """적중/미스/제거 카운터와 현재 사용량"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+def _estimate_size(value):
+    """중첩된 dict/list/str 구조의 대략적인 메모리 크기 (바이트)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_size(k) + _estimate_size(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += _estimate_size(v)
+    return size
@@ -1,14 +1,74 @@
 # 사주 분석 메인 클래스
+import datetime
+import hashlib
+import os
+import threading
+import time
+
 from .saju_calculator import SajuCalculator
+from .solar_terms import reload_solar_terms
+from .lunar_calendar import reload_lunar_calendar
+from .ganji_tables import BRANCH_MAIN_STEM
 from .analysis import (
     IljuAnalyzer, SipsungAnalyzer, SibiunseongAnalyzer,
     SibisinsalAnalyzer, GuinAnalyzer, WealthAnalyzer,
     LoveAnalyzer, CareerAnalyzer, HealthAnalyzer, DaeunAnalyzer
 )
 from .report_generator import ReportGenerator
+from .result_cache import ResultCache
+from .pipeline import Pipeline, get_executor
+from .features import ChartFeatures
+from .pillars import Pillars
+from .logger import get_logger
+from .metrics import STAGE_SECONDS
+
+logger = get_logger(__name__)
+
+# 분석 결과 섹션 (응답 키, 계산 순서)
+SECTIONS = (
+    'saju_pillars', 'sipsung_raw', 'ilju_analysis', 'sipsung_analysis', 'sibiunseong_analysis',
+    'sibisinsal_analysis', 'guin_analysis', 'wealth_luck_analysis', 'love_luck_analysis',
+    'career_luck_analysis', 'health_luck_analysis', 'daeun_analysis', 'comprehensive_report'
+)
+
+# 분석 결과 형식/문구나 팔자 계산이 바뀌면 올린다 (차트 키 응답의 ETag에 포함)
+# 2: 절기 기준 월주, 1899-12-22 갑자일 기준 일주
+ENGINE_VERSION = 2
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
 
+def data_fingerprint(data_dir=DATA_DIR):
+    """데이터 디렉터리 파일들(이름과 내용)의 SHA-256"""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, name)
+        if os.path.isfile(path):
+            digest.update(name.encode() + b'\0')
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def format_chart_key(key):
+    """차트 키 (팔자, 생년, 기준년도) -> URL용 문자열 (예: '66756697-1990-2026')"""
+    pillars, birth_year, as_of_year = key
+    return f"{pillars.to_code()}-{birth_year}-{as_of_year}"
+
+def parse_chart_key(text):
+    """format_chart_key()의 문자열 -> 차트 키 (잘못된 값은 ValueError)"""
+    parts = text.split('-')
+    if len(parts) != 3 or not all(part.isdigit() and len(part) == 4 for part in parts[1:]):
+        raise ValueError(f"올바른 차트 키가 아닙니다: {text!r}")
+    birth_year, as_of_year = int(parts[1]), int(parts[2])
+    if not 1900 <= birth_year <= 2100:
+        raise ValueError(f"지원하지 않는 생년입니다: {birth_year}")
+    return (Pillars.from_code(parts[0]), birth_year, as_of_year)
 class SajuAnalyzer:
-    """사주 분석을 총괄하는 메인 클래스"""
+    """사주 분석을 총괄하는 메인 클래스
+
+    생성 시점에 모든 데이터 파일을 읽어 두고, 이후에는 (스레드 안전한 결과
+    캐시를 제외하면) 상태를 바꾸지 않는다. 따라서 하나의 인스턴스를 여러
+    요청/스레드가 동시에 공유해도 안전하다.
+    """
     
     def __init__(self):
         # 계산기 초기화
@@ -16,7 +76,7 @@ class SajuAnalyzer:
         
         # 분석기들 초기화
         self.ilju_analyzer = IljuAnalyzer()
-        self.sipsung_analyzer = SipsungAnalyzer()
+        self.sipsung_analyzer = SipsungAnalyzer(self.calculator)
         self.sibiunseong_analyzer = SibiunseongAnalyzer()
         self.sibisinsal_analyzer = SibisinsalAnalyzer()
         self.guin_analyzer = GuinAnalyzer()
@@ -28,77 +88,222 @@ class SajuAnalyzer:
         
         # 리포트 생성기
         self.report_generator = ReportGenerator()
+        
+        # 차트 단위 결과 캐시
+        self.result_cache = ResultCache.from_env()
+        
+        # 분석 노드 의존성 그래프
+        self.pipeline = self._build_pipeline()
+        
+        # 차트 키 응답의 ETag에 쓰는 데이터 파일 해시 (엔진을 다시 만들면 새로 계산)
+        self.data_fingerprint = data_fingerprint()
+    
+    def _build_pipeline(self):
+        """분석기 노드와 입력 관계 등록 (등록 순서 = 순차 실행 및 스트리밍 순서)"""
+        pipeline = Pipeline(inputs=('saju_pillars', 'birth_year'))
+        pipeline.add('sipsung_raw', self._calculate_all_sipsung, ('saju_pillars',))
+        # 십성/오행 개수 등 여러 분석기가 쓰는 파생 특징 (차트당 한 번)
+        pipeline.add('chart_features', ChartFeatures.from_chart, ('saju_pillars', 'sipsung_raw'))
+        pipeline.add('ilju_analysis', self.ilju_analyzer.analyze, ('saju_pillars',))
+        pipeline.add('sipsung_analysis', self.sipsung_analyzer.analyze, ('sipsung_raw', 'chart_features'))
+        pipeline.add('sibiunseong_analysis', self.sibiunseong_analyzer.analyze, ('saju_pillars',))
+        pipeline.add('sibisinsal_analysis', self.sibisinsal_analyzer.analyze, ('saju_pillars',))
+        pipeline.add('guin_analysis', self.guin_analyzer.analyze, ('saju_pillars',))
+        pipeline.add('wealth_luck_analysis', self.wealth_analyzer.analyze, ('saju_pillars', 'chart_features'))
+        pipeline.add('love_luck_analysis', self.love_analyzer.analyze, ('saju_pillars', 'chart_features'))
+        pipeline.add('career_luck_analysis', self.career_analyzer.analyze, ('saju_pillars', 'chart_features'))
+        pipeline.add('health_luck_analysis', self.health_analyzer.analyze, ('saju_pillars', 'chart_features'))
+        pipeline.add('daeun_analysis', self.daeun_analyzer.analyze, ('saju_pillars', 'birth_year'))
+        pipeline.add('comprehensive_report', self._generate_report, (
+            'saju_pillars', 'sibisinsal_analysis', 'guin_analysis', 'career_luck_analysis', 'daeun_analysis'
+        ))
+        return pipeline
+    
+    def _generate_report(self, pillars, sibisinsal, guin, career, daeun):
+        """종합 리포트 노드 (리포트 생성기가 읽는 섹션만 입력으로 받음)"""
+        return self.report_generator.generate_comprehensive_report({
+            'saju_pillars': pillars,
+            'sibisinsal_analysis': sibisinsal,
+            'guin_analysis': guin,
+            'career_luck_analysis': career,
+            'daeun_analysis': daeun
+        })
     
-    def analyze(self, year, month, day, hour, minute):
-        """전체 사주 분석 수행"""
+    def analyze(self, year, month, day, hour, minute, sections=None, timings=None, use_cache=True):
+        """전체 사주 분석 수행 (sections를 주면 해당 섹션과 그 선행 계산만 수행)"""
         try:
-            # 1. 사주 팔자 계산
-            saju_pillars = self.calculator.calculate_saju_pillars(year, month, day, hour, minute)
-            
-            # 2. 십성 계산
-            sipsung_data = self._calculate_all_sipsung(saju_pillars)
-            
-            # 3. 각 부문별 분석 수행
-            analysis_results = {
-                'saju_pillars': saju_pillars,
-                'sipsung_raw': sipsung_data,
-                'ilju_analysis': self.ilju_analyzer.analyze(saju_pillars['day']),
-                'sipsung_analysis': self.sipsung_analyzer.analyze(sipsung_data),
-                'sibiunseong_analysis': self.sibiunseong_analyzer.analyze(saju_pillars),
-                'sibisinsal_analysis': self.sibisinsal_analyzer.analyze(saju_pillars),
-                'guin_analysis': self.guin_analyzer.analyze(saju_pillars),
-                'wealth_luck_analysis': self.wealth_analyzer.analyze(saju_pillars, sipsung_data),
-                'love_luck_analysis': self.love_analyzer.analyze(saju_pillars, sipsung_data),
-                'career_luck_analysis': self.career_analyzer.analyze(saju_pillars, sipsung_data),
-                'health_luck_analysis': self.health_analyzer.analyze(saju_pillars, sipsung_data),
-                'daeun_analysis': self.daeun_analyzer.analyze(saju_pillars, year)
-            }
-            
-            # 4. 종합 리포트 생성
-            comprehensive_report = self.report_generator.generate_comprehensive_report(analysis_results)
-            
-            return {
-                **analysis_results,
-                'comprehensive_report': comprehensive_report
-            }
+            return dict(self.iter_sections(year, month, day, hour, minute, sections, timings, use_cache))
             
         except Exception as e:
-            print(f"사주 분석 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("사주 분석 오류: %s", e)
             return {"error": str(e)}
     
-    def _calculate_all_sipsung(self, saju_pillars):
-        """모든 기둥의 십성 계산"""
-        day_gan = saju_pillars['day']['gan']
+    def iter_sections(self, year, month, day, hour, minute, sections=None, timings=None, use_cache=True):
+        """분석 결과를 섹션이 완성되는 순서대로 (키, 값)으로 내보내는 generator
+        
+        팔자와 음력 날짜가 가장 먼저 나오고 comprehensive_report가 마지막에 나온다.
+        스트리밍 응답은 이 순서 그대로 전송하며, 끝까지 소비된 결과만 캐시에 저장된다.
+        sections를 주면 요청한 섹션만 내보내고, 요청하지 않은 분석기는 (다른 요청
+        섹션의 선행 계산이 아니면) 실행하지 않는다. 부분 결과는 캐시에 저장하지 않는다.
+        timings(dict)를 주면 팔자 계산('pillars')과 실행된 노드별 (wall 초, CPU 초)가
+        기록된다 (캐시에서 꺼낸 결과면 노드 기록이 없다).
+        use_cache=False면 결과 캐시를 조회/저장하지 않고 항상 계산한다 (프로파일링용).
+        """
+        requested = self._requested_sections(sections)
+        
+        # 1. 사주 팔자 계산 (정수 Pillars, 표시용 문자열 변환은 응답 직전에 수행)
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        pillars = self.calculator.calculate_pillars(year, month, day, hour, minute)
+        wall = time.perf_counter() - started
+        STAGE_SECONDS.labels('pillars').observe(wall)
+        if timings is not None:
+            timings['pillars'] = (wall, time.thread_time() - cpu_started)
+        if 'saju_pillars' in requested:
+            yield 'saju_pillars', pillars
+            yield 'lunar_date', self.calculator.lunar_date(year, month, day)
+        
+        yield from self._iter_chart_sections(self.chart_key(pillars, year), requested, timings, use_cache)
+    
+    def analyze_chart(self, key, sections=None, timings=None):
+        """차트 키로 분석 (출생 날짜가 없으므로 음력 날짜 없이 팔자와 분석 섹션만 반환)
+        
+        기준년도가 올해가 아닌 키는 결과를 재현할 수 없으므로 ValueError로 알린다.
+        timings는 iter_sections와 같다 (팔자는 키에 있으므로 'pillars' 기록 없음).
+        """
+        requested = self._requested_sections(sections)
+        pillars, _, as_of_year = key
+        if as_of_year != datetime.date.today().year:
+            raise ValueError(f"기준년도가 지난 차트 키입니다: {as_of_year}")
+        result = {'saju_pillars': pillars} if 'saju_pillars' in requested else {}
+        result.update(self._iter_chart_sections(key, requested, timings))
+        return result
+    
+    def _requested_sections(self, sections):
+        requested = frozenset(SECTIONS if sections is None else sections)
+        unknown = requested.difference(SECTIONS)
+        if unknown:
+            raise ValueError(f"알 수 없는 섹션: {', '.join(sorted(unknown))}")
+        return requested
+    
+    def _iter_chart_sections(self, cache_key, requested, timings, use_cache=True):
+        """차트 키 하나의 분석 섹션 (팔자 제외)을 완성되는 순서대로 내보냄"""
+        pillars, year = cache_key[0], cache_key[1]
+        
+        # 같은 팔자/생년/기준년도의 결과는 캐시에서 반환 (음력 날짜 등 요청별 정보만 교체)
+        cached = self.result_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            for key, value in cached.items():
+                if key in requested and key != 'saju_pillars':
+                    yield key, value
+            return
+        
+        # 2. 분석 노드 실행 (십성 등 공유 입력은 한 번만 계산, 완료되는 대로 전송)
+        values = {'saju_pillars': pillars, 'birth_year': year}
+        targets = [key for key in SECTIONS if key in requested and key != 'saju_pillars']
+        for key, value in self.pipeline.run(values, targets, get_executor(), timings):
+            if key in requested:
+                yield key, value
+        
+        if use_cache and len(requested) == len(SECTIONS):
+            self.result_cache.put(cache_key, {key: values[key] for key in SECTIONS})
+    
+    def chart_key(self, pillars, year):
+        """분석 결과가 같은 출생 정보를 묶는 키 (팔자, 생년, 기준년도)"""
+        return (pillars, year, datetime.date.today().year)
+    
+    def is_cached(self, year, month, day, hour, minute):
+        """이 출생 정보의 전체 결과가 결과 캐시에 있는지 (팔자만 계산)"""
+        pillars = self.calculator.calculate_pillars(year, month, day, hour, minute)
+        return self.chart_key(pillars, year) in self.result_cache
+    
+    def remember(self, year, result):
+        """다른 프로세스(분석 프로세스 풀)가 계산한 전체 결과를 이 엔진의 결과 캐시에 저장"""
+        if not result or 'error' in result or not all(key in result for key in SECTIONS):
+            return
+        cache_key = self.chart_key(result['saju_pillars'], year)
+        if cache_key not in self.result_cache:
+            self.result_cache.put(cache_key, {key: result[key] for key in SECTIONS})
+    
+    def chart_etag(self, key):
+        """차트 키 응답의 강한 ETag 값 (차트 키, 엔진 버전, 데이터 파일 해시로 결정)"""
+        text = f"{format_chart_key(key)}:{ENGINE_VERSION}:{self.data_fingerprint}"
+        return hashlib.sha256(text.encode()).hexdigest()[:32]
+    
+    def analyze_batch(self, births, sections=None):
+        """여러 (연, 월, 일, 시, 분)을 분석해 (입력 순서의 결과 목록, 고유 차트 수) 반환
+        
+        같은 차트 키의 항목은 처음 한 번만 분석하고, 나머지는 음력 날짜만 바꿔 재사용한다.
+        """
+        results = []
+        computed = {}
+        for year, month, day, hour, minute in births:
+            try:
+                key = self.chart_key(self.calculator.calculate_pillars(year, month, day, hour, minute), year)
+            except Exception as e:
+                results.append({"error": str(e)})
+                continue
+            result = computed.get(key)
+            if result is None:
+                result = computed[key] = self.analyze(year, month, day, hour, minute, sections)
+            elif 'lunar_date' in result:
+                result = {**result, 'lunar_date': self.calculator.lunar_date(year, month, day)}
+            results.append(result)
+        return results, len(computed)
+    
+    def _calculate_all_sipsung(self, pillars):
+        """모든 기둥의 십성 계산 (지지는 간단화된 지장간 대표 천간 기준)"""
+        table = self.calculator.sipsung_table
+        day_row = pillars.day_gan * 10
         
         return {
-            'year_gan': self.calculator.calculate_sipsung(day_gan, saju_pillars['year']['gan']),
-            'year_ji': self._calculate_ji_sipsung(day_gan, saju_pillars['year']['ji']),
-            'month_gan': self.calculator.calculate_sipsung(day_gan, saju_pillars['month']['gan']),
-            'month_ji': self._calculate_ji_sipsung(day_gan, saju_pillars['month']['ji']),
+            'year_gan': table[day_row + pillars.year_gan],
+            'year_ji': table[day_row + BRANCH_MAIN_STEM[pillars.year_ji]],
+            'month_gan': table[day_row + pillars.month_gan],
+            'month_ji': table[day_row + BRANCH_MAIN_STEM[pillars.month_ji]],
             'day_gan': '일간',
-            'day_ji': self._calculate_ji_sipsung(day_gan, saju_pillars['day']['ji']),
-            'hour_gan': self.calculator.calculate_sipsung(day_gan, saju_pillars['hour']['gan']),
-            'hour_ji': self._calculate_ji_sipsung(day_gan, saju_pillars['hour']['ji'])
+            'day_ji': table[day_row + BRANCH_MAIN_STEM[pillars.day_ji]],
+            'hour_gan': table[day_row + pillars.hour_gan],
+            'hour_ji': table[day_row + BRANCH_MAIN_STEM[pillars.hour_ji]]
         }
-    
-    def _calculate_ji_sipsung(self, day_gan, ji):
-        """지지의 십성 계산 (지장간 기준)"""
-        # 지장간 매핑 (간단화된 버전)
-        ji_to_gan = {
-            '자': '계', '축': '계', '인': '갑', '묘': '을',
-            '진': '무', '사': '병', '오': '정', '미': '기',
-            '신': '경', '유': '신', '술': '무', '해': '임'
-        }
-        
-        gan = ji_to_gan.get(ji, '')
-        if gan:
-            return self.calculator.calculate_sipsung(day_gan, gan)
-        return "알 수 없음"
+
+# 프로세스 전역 공유 엔진
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    """프로세스 전역 SajuAnalyzer 인스턴스를 반환 (최초 호출 시 한 번만 생성)
+
+    gunicorn preload 단계에서 미리 호출해 두면 워커들은 fork 시점의
+    인스턴스를 그대로 물려받으므로 요청 처리 중에는 파일 I/O가 발생하지 않는다.
+    """
+    global _engine
+    engine = _engine
+    if engine is None:
+        with _engine_lock:
+            engine = _engine
+            if engine is None:
+                engine = _engine = SajuAnalyzer()
+    return engine
+
+def rebuild_engine():
+    """데이터 파일을 다시 읽어 새 엔진을 만들고 교체
+
+    절기/음력 테이블을 먼저 다시 열고 새 인스턴스를 완전히 만든 뒤 참조만
+    바꾸므로, 교체 도중에 진행 중인 요청은 이전 엔진으로 끝까지 처리된다.
+    역색인은 버려 두고 다음 조회 때 새 엔진으로 다시 만든다.
+    """
+    global _engine
+    from .chart_index import reset_chart_index
+    reload_solar_terms()
+    reload_lunar_calendar()
+    engine = SajuAnalyzer()
+    with _engine_lock:
+        _engine = engine
+    reset_chart_index()
+    return engine
 
 # 기존 analyzer.py와의 호환성을 위한 함수
-def get_saju_details(year, month, day, hour, minute):
+def get_saju_details(year, month, day, hour, minute, sections=None):
     """기존 인터페이스와의 호환성을 위한 wrapper 함수"""
-    analyzer = SajuAnalyzer()
-    return analyzer.analyze(year, month, day, hour, minute)
\ No newline at end of file
+    return get_engine().analyze(year, month, day, hour, minute, sections)
\ No newline at end of file
@@ -1,8 +1,21 @@
 # 사주 기본 계산 모듈
-from datetime import datetime
+from datetime import date
 import json
 import os
 
+from .ganji_tables import (
+    STEMS_KOR, STEM_INDEX, MONTH_STEM, HOUR_STEM, HOUR_BRANCH
+)
+from .pillars import Pillars
+from .solar_terms import get_solar_terms, local_to_utc_seconds
+from .lunar_calendar import get_lunar_calendar
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# 일주 계산의 기준일 (1899-12-22 갑자일, analyzer.calculate_pillars와 같음)
+_DAY_BASE_ORDINAL = date(1899, 12, 22).toordinal()
+
 class SajuCalculator:
     """사주팔자 기본 계산을 담당하는 클래스"""
     
@@ -16,151 +29,91 @@ class SajuCalculator:
         with open(os.path.join(self.data_dir, 'ganji_data.json'), 'r', encoding='utf-8') as f:
             self.ganji_data = json.load(f)
         
-        # 만세력 데이터
-        with open(os.path.join(self.data_dir, 'calendar_data.json'), 'r', encoding='utf-8') as f:
-            self.calendar_data = json.load(f)
-        
         # 십성 데이터
         with open(os.path.join(self.data_dir, 'sipsung_data.json'), 'r', encoding='utf-8') as f:
             self.sipsung_data = json.load(f)
+        
+        # 만세력 (절기 경계 테이블, mmap으로 프로세스 전역 공유)
+        self.solar_terms = get_solar_terms()
+        
+        # 음력 달 시작일 테이블 (양력/음력 변환)
+        self.lunar_calendar = get_lunar_calendar()
+        
+        # 십성 데이터를 [일간 * 10 + 대상 천간] 1차원 테이블로 펼쳐 둠
+        self.sipsung_table = tuple(
+            self.sipsung_data.get(day_gan, {}).get(target_gan, "알 수 없음")
+            for day_gan in STEMS_KOR for target_gan in STEMS_KOR
+        )
     
     def calculate_saju_pillars(self, year, month, day, hour, minute):
-        """사주 팔자를 계산하여 반환"""
+        """사주 팔자를 표시용 dict로 계산하여 반환 (기존 인터페이스)"""
+        saju_pillars = self.calculate_pillars(year, month, day, hour, minute).to_dict()
+        saju_pillars['lunar_date'] = self.lunar_date(year, month, day)
+        return saju_pillars
+    
+    def calculate_pillars(self, year, month, day, hour, minute):
+        """사주 팔자를 정수 Pillars로 계산하여 반환"""
         try:
-            # 양력을 음력으로 변환
-            lunar_date = self._solar_to_lunar(year, month, day)
+            # 절기 테이블에서 사주 연도(입춘 기준)와 월지(절 기준) 조회
+            saju_year, month_ji = self.solar_terms.year_and_month_branch(
+                local_to_utc_seconds(year, month, day, hour, minute)
+            )
             
             # 연주 계산
-            year_pillar = self._calculate_year_pillar(lunar_date['year'])
+            year_gan, year_ji = self._calculate_year_pillar(saju_year)
             
             # 월주 계산
-            month_pillar = self._calculate_month_pillar(lunar_date['year'], lunar_date['month'])
+            month_gan = self._calculate_month_gan(year_gan, month_ji)
             
             # 일주 계산
-            day_pillar = self._calculate_day_pillar(year, month, day)
+            day_gan, day_ji = self._calculate_day_pillar(year, month, day)
             
             # 시주 계산
-            hour_pillar = self._calculate_hour_pillar(day_pillar['gan'], hour)
+            hour_gan, hour_ji = self._calculate_hour_pillar(day_gan, hour)
             
-            return {
-                'year': year_pillar,
-                'month': month_pillar,
-                'day': day_pillar,
-                'hour': hour_pillar,
-                'lunar_date': lunar_date
-            }
+            return Pillars(year_gan, year_ji, month_gan, month_ji, day_gan, day_ji, hour_gan, hour_ji)
         except Exception as e:
-            print(f"사주 계산 오류: {str(e)}")
+            logger.error("사주 계산 오류: %s", e)
             raise
     
+    def lunar_date(self, year, month, day):
+        """양력 날짜의 음력 날짜 정보"""
+        return self._solar_to_lunar(year, month, day)
+    
+    def lunar_to_solar(self, year, month, day, is_leap=False):
+        """음력 날짜를 양력 (연, 월, 일)로 변환"""
+        return self.lunar_calendar.lunar_to_solar(year, month, day, is_leap)
+    
     def _solar_to_lunar(self, year, month, day):
         """양력을 음력으로 변환"""
-        # 실제 변환 로직 구현 필요
-        # 여기서는 간단한 예시만 제공
-        return {
-            'year': year,
-            'month': month,
-            'day': day,
-            'is_leap': False
-        }
+        return self.lunar_calendar.solar_to_lunar(year, month, day)
     
     def _calculate_year_pillar(self, year):
-        """연주 계산"""
-        gan_cycle = ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계']
-        ji_cycle = ['자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해']
-        
+        """연주 계산 (천간, 지지 인덱스)"""
         # 60갑자 계산
-        gan_index = (year - 4) % 10
-        ji_index = (year - 4) % 12
-        
-        return {
-            'gan': gan_cycle[gan_index],
-            'ji': ji_cycle[ji_index]
-        }
+        return (year - 4) % 10, (year - 4) % 12
     
-    def _calculate_month_pillar(self, year, month):
-        """월주 계산"""
-        # 월간 계산 (년간에 따라 결정)
-        month_gan_table = {
-            '갑': ['병', '정', '무', '기', '경', '신', '임', '계', '갑', '을', '병', '정'],
-            '을': ['무', '기', '경', '신', '임', '계', '갑', '을', '병', '정', '무', '기'],
-            '병': ['경', '신', '임', '계', '갑', '을', '병', '정', '무', '기', '경', '신'],
-            '정': ['임', '계', '갑', '을', '병', '정', '무', '기', '경', '신', '임', '계'],
-            '무': ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계', '갑', '을'],
-            '기': ['병', '정', '무', '기', '경', '신', '임', '계', '갑', '을', '병', '정'],
-            '경': ['무', '기', '경', '신', '임', '계', '갑', '을', '병', '정', '무', '기'],
-            '신': ['경', '신', '임', '계', '갑', '을', '병', '정', '무', '기', '경', '신'],
-            '임': ['임', '계', '갑', '을', '병', '정', '무', '기', '경', '신', '임', '계'],
-            '계': ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계', '갑', '을']
-        }
-        
-        year_gan = self._calculate_year_pillar(year)['gan']
-        month_ji = ['인', '묘', '진', '사', '오', '미', '신', '유', '술', '해', '자', '축'][month - 1]
-        
-        return {
-            'gan': month_gan_table[year_gan][month - 1],
-            'ji': month_ji
-        }
+    def _calculate_month_gan(self, year_gan, month_ji):
+        """월간 계산 (천간 인덱스)"""
+        # 월간은 연간에 따라 결정 (갑기년 병인월 기준)
+        return MONTH_STEM[year_gan * 12 + month_ji]
     
     def _calculate_day_pillar(self, year, month, day):
-        """일주 계산"""
-        # 만세력 데이터에서 일주 찾기
-        date_key = f"{year}-{month:02d}-{day:02d}"
-        if date_key in self.calendar_data:
-            return self.calendar_data[date_key]
-        
-        # 기본 계산 로직 (실제로는 더 복잡함)
-        gan_cycle = ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계']
-        ji_cycle = ['자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해']
-        
-        # 간단한 예시 계산
-        days_from_base = (datetime(year, month, day) - datetime(1900, 1, 1)).days
-        gan_index = days_from_base % 10
-        ji_index = days_from_base % 12
-        
-        return {
-            'gan': gan_cycle[gan_index],
-            'ji': ji_cycle[ji_index]
-        }
+        """일주 계산 (천간, 지지 인덱스)"""
+        # 일진은 60일 주기로 끊김 없이 이어지므로 기준 갑자일로부터의 일수로 결정
+        days_from_base = date(year, month, day).toordinal() - _DAY_BASE_ORDINAL
+        return days_from_base % 10, days_from_base % 12
     
     def _calculate_hour_pillar(self, day_gan, hour):
-        """시주 계산"""
-        # 시간을 지지로 변환
-        hour_ji_map = {
-            (23, 1): '자', (1, 3): '축', (3, 5): '인', (5, 7): '묘',
-            (7, 9): '진', (9, 11): '사', (11, 13): '오', (13, 15): '미',
-            (15, 17): '신', (17, 19): '유', (19, 21): '술', (21, 23): '해'
-        }
-        
-        hour_ji = '자'  # 기본값
-        for (start, end), ji in hour_ji_map.items():
-            if start <= hour < end or (start == 23 and hour >= 23) or (start == 23 and hour < 1):
-                hour_ji = ji
-                break
-        
-        # 시간 천간 계산 (일간에 따라 결정)
-        hour_gan_table = {
-            '갑': ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계', '갑', '을'],
-            '을': ['병', '정', '무', '기', '경', '신', '임', '계', '갑', '을', '병', '정'],
-            '병': ['무', '기', '경', '신', '임', '계', '갑', '을', '병', '정', '무', '기'],
-            '정': ['경', '신', '임', '계', '갑', '을', '병', '정', '무', '기', '경', '신'],
-            '무': ['임', '계', '갑', '을', '병', '정', '무', '기', '경', '신', '임', '계'],
-            '기': ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계', '갑', '을'],
-            '경': ['병', '정', '무', '기', '경', '신', '임', '계', '갑', '을', '병', '정'],
-            '신': ['무', '기', '경', '신', '임', '계', '갑', '을', '병', '정', '무', '기'],
-            '임': ['경', '신', '임', '계', '갑', '을', '병', '정', '무', '기', '경', '신'],
-            '계': ['임', '계', '갑', '을', '병', '정', '무', '기', '경', '신', '임', '계']
-        }
-        
-        ji_index = ['자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해'].index(hour_ji)
-        hour_gan = hour_gan_table[day_gan][ji_index]
-        
-        return {
-            'gan': hour_gan,
-            'ji': hour_ji
-        }
+        """시주 계산 (천간, 지지 인덱스)"""
+        # 시간을 지지로 변환 (23시와 0시는 자시), 시간 천간은 일간에 따라 결정
+        hour_ji = HOUR_BRANCH[hour]
+        return HOUR_STEM[day_gan * 12 + hour_ji], hour_ji
     
     def calculate_sipsung(self, day_gan, target_gan):
         """십성 계산"""
-        sipsung_map = self.sipsung_data.get(day_gan, {})
-        return sipsung_map.get(target_gan, "알 수 없음")
\ No newline at end of file
+        day_index = STEM_INDEX.get(day_gan)
+        target_index = STEM_INDEX.get(target_gan)
+        if day_index is None or target_index is None:
+            return "알 수 없음"
+        return self.sipsung_table[day_index * 10 + target_index]
\ No newline at end of file
@@ -0,0 +1,87 @@
+# JSON 직렬화 모듈
+#
+# 응답 본문을 UTF-8 JSON 바이트로 만든다 (한글은 \uXXXX로 바꾸지 않고, 키 순서 유지).
+#   - orjson이 설치되어 있으면 orjson으로 한 번에 인코딩한다.
+#   - 없으면 FragmentEncoder를 쓴다. 분석 결과의 긴 문장은 대부분 차트와 무관한
+#     고정 문구이므로, 한 번 인코딩한 문자열과 dict 키의 UTF-8 바이트 조각을 보관해
+#     두었다가 같은 문자열이 다시 나오면 조각을 그대로 이어 붙인다.
+import json
+import os
+from json.encoder import encode_basestring
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_MAX_FRAGMENTS = 8192
+
+class FragmentEncoder:
+    """인코딩한 문자열 조각을 재사용하는 순수 파이썬 JSON 인코더
+
+    조각 캐시는 max_fragments개까지 먼저 나온 문자열부터 채우고 이후에는 늘리지
+    않는다 (고정 문구는 처음 몇 개 차트에서 모두 나오므로 앞쪽에 자리 잡는다).
+    dict 조회/대입만 하므로 여러 스레드가 같은 인코더를 써도 된다.
+    """
+
+    def __init__(self, max_fragments=DEFAULT_MAX_FRAGMENTS):
+        self.max_fragments = max_fragments
+        self._fragments = {}
+
+    def encode(self, obj):
+        """obj를 UTF-8 JSON 바이트로 인코딩"""
+        chunks = []
+        self._encode(obj, chunks.append)
+        return b''.join(chunks)
+
+    def fragment_count(self):
+        return len(self._fragments)
+
+    def _string(self, text):
+        data = self._fragments.get(text)
+        if data is None:
+            data = encode_basestring(text).encode()
+            if len(self._fragments) < self.max_fragments:
+                self._fragments[text] = data
+        return data
+
+    def _encode(self, obj, append):
+        kind = type(obj)
+        if kind is str:
+            append(self._string(obj))
+        elif kind is dict:
+            separator = b'{'
+            for key, value in obj.items():
+                append(separator)
+                append(self._string(key if type(key) is str else json.dumps(key)))
+                append(b':')
+                self._encode(value, append)
+                separator = b','
+            append(b'}' if separator == b',' else b'{}')
+        elif kind is list or kind is tuple:
+            separator = b'['
+            for value in obj:
+                append(separator)
+                self._encode(value, append)
+                separator = b','
+            append(b']' if separator == b',' else b'[]')
+        elif obj is None:
+            append(b'null')
+        elif obj is True:
+            append(b'true')
+        elif obj is False:
+            append(b'false')
+        else:
+            # 숫자와 그 밖의 타입은 표준 json에 맡김
+            append(json.dumps(obj, ensure_ascii=False).encode())
+
+# 프로세스 전역 인코더 (조각 캐시 크기는 SAJU_JSON_FRAGMENTS로 조정)
+_encoder = FragmentEncoder(int(os.environ.get('SAJU_JSON_FRAGMENTS', DEFAULT_MAX_FRAGMENTS)))
+
+ENCODER_NAME = 'orjson' if orjson is not None else 'fragment'
+
+def dumps(obj):
+    """obj를 UTF-8 JSON 바이트로 인코딩 (orjson이 있으면 orjson, 없으면 조각 인코더)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _encoder.encode(obj)
@@ -0,0 +1,159 @@
+# 절기 경계 테이블 모듈
+#
+# data/solar_terms.bin 에는 24절기의 시각이 UTC 기준 epoch 초(int64)로 연도별
+# 소한(小寒)부터 동지(冬至)까지 차례로 저장되어 있다. 파일은 읽기 전용 mmap으로
+# 열기 때문에 같은 서버의 gunicorn 워커들은 페이지 캐시를 공유하고, 월/연 경계는
+# 요청마다 천문 계산 없이 이분 탐색 한 번으로 결정된다.
+#
+# 파일 형식 (little-endian)
+#   헤더: magic(4s) 'SJST', version(H), start_year(H), year_count(H), terms_per_year(H)
+#   본문: int64 x (year_count * terms_per_year)
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+
+MAGIC = b'SJST'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHHH')
+TERMS_PER_YEAR = 24
+
+# 절기 이름 (소한부터, 짝수 인덱스는 월이 바뀌는 절(節), 홀수는 중기(中氣))
+TERM_NAMES = (
+    '소한', '대한', '입춘', '우수', '경칩', '춘분', '청명', '곡우', '입하', '소만', '망종', '하지',
+    '소서', '대서', '입추', '처서', '백로', '추분', '한로', '상강', '입동', '소설', '대설', '동지'
+)
+# 각 절기의 태양 황경 (도): 소한 285도부터 15도 간격
+TERM_LONGITUDES = tuple((285 + 15 * k) % 360 for k in range(TERMS_PER_YEAR))
+
+# 입력 시각은 한국 표준시(UTC+9)로 해석
+KST_OFFSET_SECONDS = 9 * 3600
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'solar_terms.bin')
+
+def days_from_civil(year, month, day):
+    """1970-01-01 기준 일수 (proleptic 그레고리력, 정수 연산)"""
+    y = year - (month <= 2)
+    era = y // 400
+    year_of_era = y - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+def civil_from_days(days):
+    """1970-01-01 기준 일수 -> (연, 월, 일) (days_from_civil의 역함수, 정수 연산)"""
+    z = days + 719468
+    era = z // 146097
+    day_of_era = z - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 - 12 * (shifted_month >= 10)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+def local_to_utc_seconds(year, month, day, hour, minute):
+    """한국 표준시 입력을 UTC epoch 초로 변환"""
+    return days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 - KST_OFFSET_SECONDS
+
+class SolarTermTable:
+    """mmap으로 연 절기 시각 테이블
+
+    instants[i]는 (start_year + i // 24)년의 (i % 24)번째 절기(소한 기준) 시각이다.
+    """
+
+    def __init__(self, path=DEFAULT_TABLE_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, start_year, year_count, terms_per_year = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or terms_per_year != TERMS_PER_YEAR:
+            raise ValueError(f"절기 테이블 형식이 올바르지 않습니다: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 절기 테이블 버전입니다: {version}")
+        count = year_count * terms_per_year
+        if len(self._mmap) != HEADER.size + count * 8:
+            raise ValueError(f"절기 테이블 크기가 헤더와 맞지 않습니다: {path}")
+
+        self.version = version
+        self.start_year = start_year
+        self.year_count = year_count
+        # 마지막 해 동지 이후는 다음 해 1월 1일(KST) 전까지만 유효
+        self.end_seconds = local_to_utc_seconds(start_year + year_count, 1, 1, 0, 0)
+        body = memoryview(self._mmap)[HEADER.size:]
+        if sys.byteorder == 'little':
+            self.instants = body.cast('q')
+        else:
+            # big-endian 환경에서는 복사본을 만들어 바이트 순서를 맞춤
+            self.instants = array('q', body)
+            self.instants.byteswap()
+
+    @property
+    def end_year(self):
+        return self.start_year + self.year_count - 1
+
+    def term_instant(self, year, term):
+        """year년 term번째 절기(0=소한 ~ 23=동지)의 UTC epoch 초"""
+        return self.instants[(year - self.start_year) * TERMS_PER_YEAR + term]
+
+    def term_index(self, utc_seconds):
+        """해당 시각 직전(같은 시각 포함)에 시작한 절기의 전체 인덱스"""
+        index = bisect_right(self.instants, utc_seconds) - 1
+        if index < 0 or utc_seconds >= self.end_seconds:
+            raise ValueError("절기 테이블 범위를 벗어난 시각입니다.")
+        return index
+
+    def year_and_month_branch(self, utc_seconds):
+        """해당 시각의 사주 연도(입춘 기준)와 월지 인덱스(절 기준)"""
+        year_offset, term = divmod(self.term_index(utc_seconds), TERMS_PER_YEAR)
+        saju_year = self.start_year + year_offset - (term < 2)
+        return saju_year, (term // 2 + 1) % 12
+
+    def close(self):
+        if isinstance(self.instants, memoryview):
+            self.instants.release()
+        self._mmap.close()
+
+def write_table(path, start_year, instants):
+    """절기 시각 목록(연도별 24개, UTC epoch 초)을 테이블 파일로 저장"""
+    if len(instants) % TERMS_PER_YEAR:
+        raise ValueError("절기 개수가 연도별 24개 단위가 아닙니다.")
+    body = array('q', instants)
+    if sys.byteorder != 'little':
+        body.byteswap()
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, start_year, len(instants) // TERMS_PER_YEAR, TERMS_PER_YEAR))
+        f.write(body.tobytes())
+
+# 프로세스 전역 테이블 (preload 시점에 열어 두면 워커가 그대로 물려받음)
+_table = None
+_table_lock = threading.Lock()
+
+def get_solar_terms():
+    """프로세스 전역 SolarTermTable을 반환 (최초 호출 시 한 번만 연다)
+
+    SAJU_SOLAR_TERMS_PATH 환경 변수로 tools/build_solar_terms.py가 만든
+    다른 범위의 테이블을 지정할 수 있다.
+    """
+    global _table
+    table = _table
+    if table is None:
+        with _table_lock:
+            if _table is None:
+                _table = SolarTermTable(os.environ.get('SAJU_SOLAR_TERMS_PATH', DEFAULT_TABLE_PATH))
+            table = _table
+    return table
+
+def reload_solar_terms():
+    """테이블 파일을 다시 열어 프로세스 전역 SolarTermTable을 교체 (HUP 재시작용)
+
+    이전 테이블은 닫지 않는다 (진행 중인 요청이 끝까지 쓸 수 있도록).
+    """
+    global _table
+    with _table_lock:
+        _table = SolarTermTable(os.environ.get('SAJU_SOLAR_TERMS_PATH', DEFAULT_TABLE_PATH))
+        return _table
@@ -0,0 +1,126 @@
+# 분석 프로세스 풀
+#
+# ASGI 앱(main.asgi_app)에서 CPU를 쓰는 분석을 별도 프로세스에서 실행한다. 요청을
+# 처리하는 스레드는 결과를 기다리기만 하므로, 느린 리포트가 몇 개 돌고 있어도
+# /health 같은 가벼운 요청은 막히지 않는다.
+#
+# 실행 중 + 대기 중 작업 수가 workers + queue_depth를 넘으면 새 작업은 바로
+# PoolBusy로 거절한다 (대기열이 끝없이 쌓이지 않도록). 워커는 forkserver(없으면
+# spawn)로 만들어 요청 스레드가 도는 프로세스를 fork하지 않으며, 시작할 때 각자
+# 엔진을 한 번 만든다. 풀을 시작하지 않은 프로세스(gunicorn sync 워커 등)에서는
+# get_analysis_pool()이 None이고 분석은 현재 프로세스에서 실행된다.
+#   SAJU_PROCESS_WORKERS (기본 CPU 수), SAJU_PROCESS_QUEUE (워커 수 외 대기 작업, 기본 워커 수 x 4)
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .logger import get_request_id, set_request_id
+
+class PoolBusy(Exception):
+    """분석 프로세스 풀의 대기열이 가득 참"""
+
+def _start_worker():
+    # 워커 프로세스 시작 시 엔진을 미리 만들어 첫 작업이 데이터 로딩을 기다리지 않게 함
+    from .saju_analyzer import get_engine
+    get_engine()
+
+def _ping():
+    return os.getpid()
+
+def _call_engine(method, args, request_id, timed):
+    # 워커에서 남기는 로그에도 요청을 보낸 쪽의 요청 ID가 붙도록
+    from .saju_analyzer import get_engine
+    set_request_id(request_id)
+    if not timed:
+        return getattr(get_engine(), method)(*args)
+    timings = {}
+    return getattr(get_engine(), method)(*args, timings=timings), timings
+
+class AnalysisPool:
+    """엔진 메서드를 워커 프로세스에서 실행하는 크기 제한 풀"""
+
+    def __init__(self, workers, queue_depth):
+        self.workers = workers
+        self.max_in_flight = workers + queue_depth
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._executor = ProcessPoolExecutor(workers, mp_context=context, initializer=_start_worker)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수(SAJU_PROCESS_WORKERS, SAJU_PROCESS_QUEUE)로 생성"""
+        workers = int(os.environ.get('SAJU_PROCESS_WORKERS', os.cpu_count() or 1))
+        return cls(workers, int(os.environ.get('SAJU_PROCESS_QUEUE', workers * 4)))
+
+    def call(self, method, *args, timings=None):
+        """get_engine().<method>(*args)를 워커에서 실행하고 결과를 기다림 (대기열이 차면 PoolBusy)
+
+        timings(dict)를 주면 메서드에 timings 인자로 넘겨 워커에서 기록한 단계별 시간을 채운다.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.rejected += 1
+                raise PoolBusy(f"분석 대기열이 가득 찼습니다 ({self.max_in_flight}건)")
+            self._in_flight += 1
+        try:
+            result = self._executor.submit(_call_engine, method, args, get_request_id(), timings is not None).result()
+            if timings is None:
+                return result
+            result, remote_timings = result
+            timings.update(remote_timings)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self.completed += 1
+
+    def warm_up(self):
+        """모든 워커 프로세스를 띄워 엔진 생성까지 마침"""
+        futures = [self._executor.submit(_ping) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def stats(self):
+        """워커 수, 실행/대기 중 작업 수, 완료/거절 횟수"""
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_in_flight': self.max_in_flight,
+                'in_flight': self._in_flight,
+                'completed': self.completed,
+                'rejected': self.rejected
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+# 프로세스 전역 풀 (ASGI 앱 시작 시 start_analysis_pool()로 만든다)
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_analysis_pool():
+    """실행 중인 분석 프로세스 풀, 시작하지 않았으면 None"""
+    return _pool
+
+def start_analysis_pool():
+    """분석 프로세스 풀을 만들고 워커를 미리 띄움 (이미 있으면 그대로 반환)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            pool = AnalysisPool.from_env()
+            pool.warm_up()
+            _pool = pool
+        return _pool
+
+def stop_analysis_pool():
+    """분석 프로세스 풀 종료 (대기 중인 작업은 취소하고 실행 중인 작업은 끝까지 기다림)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
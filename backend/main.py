@@ -1,12 +1,27 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
-import traceback
+import calendar
+import datetime
+import importlib.util
+import json
 import os
+import re
 import time
 
+from logic.asgi import WsgiToAsgi
+from logic.compression import Compressor
+from logic.logger import get_logger, get_payload_logger, new_request_id, set_request_id, reset_request_id
+from logic import metrics
+from logic.serializer import ENCODER_NAME, dumps as json_dumps
+from logic.worker_pool import PoolBusy, get_analysis_pool, start_analysis_pool, stop_analysis_pool
+
 # 서버 시작 시간 기록
 SERVER_START_TIME = time.time()
 
+logger = get_logger(__name__)
+# 요청 본문/분석 결과 전체는 SAJU_LOG_PAYLOAD_SAMPLE 비율만 표본으로 기록
+payload_logger = get_payload_logger()
+
 app = Flask(__name__)
 # CORS 설정을 더 구체적으로 지정
 CORS(app, 
@@ -14,6 +29,390 @@ CORS(app,
      allow_headers=["Content-Type", "Authorization"],
      methods=["GET", "POST", "OPTIONS"])
 
+# 요청 ID: 클라이언트가 보낸 X-Request-ID(영숫자, '-', '_' 64자 이하)를 쓰고 없으면 새로 만든다.
+# 요청 처리 중 남기는 로그에 붙고 응답 헤더로 돌려준다.
+REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+@app.before_request
+def assign_request_id():
+    request_id = request.headers.get("X-Request-ID", "")
+    if not REQUEST_ID_PATTERN.fullmatch(request_id):
+        request_id = new_request_id()
+    request.environ['saju.request_id'] = request_id
+    request.environ['saju.request_id_token'] = set_request_id(request_id)
+    request.environ['saju.started'] = time.perf_counter()
+
+@app.after_request
+def add_request_id_header(response):
+    request_id = request.environ.get('saju.request_id')
+    if request_id:
+        response.headers["X-Request-ID"] = request_id
+    return response
+
+@app.after_request
+def record_request_metrics(response):
+    # 라우트는 URL 규칙으로 묶음 (차트 키 등 경로 값마다 시계열이 생기지 않도록)
+    started = request.environ.get('saju.started')
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        labels = (route, request.method, response.status_code)
+        metrics.REQUESTS.labels(*labels).inc()
+        metrics.REQUEST_SECONDS.labels(*labels).observe(time.perf_counter() - started)
+    return response
+
+@app.teardown_request
+def clear_request_id(error=None):
+    token = request.environ.pop('saju.request_id_token', None)
+    if token is not None:
+        reset_request_id(token)
+
+# 응답 압축 설정 (SAJU_GZIP_LEVEL, SAJU_BROTLI_QUALITY, SAJU_COMPRESS_MIN_BYTES)
+compressor = Compressor.from_env()
+
+def log_active_backends():
+    """성능 경로의 선택 의존성(requirements-perf.txt) 중 실제로 쓰이는 구현을 기록
+
+    하나라도 빠져 느린 대체 구현으로 동작하면 경고로 남긴다.
+    """
+    backends = {
+        'json': ENCODER_NAME,
+        'compression': '+'.join(compressor.encodings),
+        'batch': 'numpy' if importlib.util.find_spec('numpy') is not None else 'unavailable'
+    }
+    missing = [
+        name for name, available in (
+            ('orjson', ENCODER_NAME == 'orjson'),
+            ('brotli', 'br' in compressor.encodings),
+            ('numpy', backends['batch'] == 'numpy')
+        ) if not available
+    ]
+    summary = ', '.join(f"{key}={value}" for key, value in backends.items())
+    if missing:
+        logger.warning("성능 백엔드: %s (없음: %s, pip install -r requirements-perf.txt)", summary, ', '.join(missing))
+    else:
+        logger.info("성능 백엔드: %s", summary)
+
+# 프로세스 시작 시 한 번 (preload면 마스터에서 한 번)
+log_active_backends()
+
+def format_server_timing(entries):
+    """[(이름, 초 또는 None, 설명 또는 None)] -> Server-Timing 헤더 값 (dur는 밀리초)"""
+    parts = []
+    for name, seconds, description in entries:
+        part = name
+        if seconds is not None:
+            part += f";dur={seconds * 1000:.3f}"
+        if description is not None:
+            part += f';desc="{description}"'
+        parts.append(part)
+    return ", ".join(parts)
+
+def analysis_timing(timings, elapsed):
+    """분석 호출 전체 시간과 단계별 시간(timings)의 Server-Timing 항목
+
+    analysis는 분석 호출 전체(프로세스 풀 대기/전달 포함), 그 뒤로 팔자 계산과
+    실행된 분석 노드가 완료 순서대로 온다. 노드 기록이 없으면 결과 캐시 적중이다.
+    """
+    entries = [('analysis', elapsed, None)]
+    entries.extend((name, wall, None) for name, (wall, _) in timings.items())
+    entries.append(('cache', None, 'miss' if timings.keys() - {'pillars'} else 'hit'))
+    return entries
+
+def json_response(payload, status=200, body_cache=None, timing=None):
+    """JSON 응답 (빠른 직렬화 경로 + Accept-Encoding에 따른 gzip/br 압축)
+
+    body_cache=(ResultCache, 차트 키, 변형 키)를 주면 직렬화/압축한 본문을 결과 캐시
+    항목에 붙여 두고, 같은 차트/인코딩의 다음 요청은 그 본문을 그대로 보낸다.
+    timing(Server-Timing 항목 목록)을 주면 직렬화/압축 시간(본문 캐시를 썼으면
+    body-cache 적중)을 덧붙여 Server-Timing 헤더로 보낸다.
+    """
+    encoding = compressor.negotiate(request.headers.get('Accept-Encoding', ''))
+    cached = None
+    if body_cache is not None:
+        cache, key, variant = body_cache
+        cached = cache.get_attachment(key, (encoding, variant))
+        if timing is not None:
+            timing.append(('body-cache', None, 'miss' if cached is None else 'hit'))
+    if cached is None:
+        started = time.perf_counter()
+        body = json_dumps(payload)
+        serialized = time.perf_counter()
+        cached = compressor.compress(body, encoding)
+        compressed = time.perf_counter()
+        metrics.STAGE_SECONDS.labels('serialization').observe(serialized - started)
+        if timing is not None:
+            timing.append(('serialization', serialized - started, None))
+        if cached[1] is not None:
+            metrics.STAGE_SECONDS.labels('compression').observe(compressed - serialized)
+            if timing is not None:
+                timing.append(('compression', compressed - serialized, cached[1]))
+        if body_cache is not None:
+            cache.attach(key, (encoding, variant), cached)
+    body, applied = cached
+
+    response = Response(body, status=status, mimetype='application/json')
+    if applied:
+        response.headers["Content-Encoding"] = applied
+    response.vary.add("Accept-Encoding")
+    if timing is not None:
+        response.headers["Server-Timing"] = format_server_timing(timing)
+        # 다른 출처의 프런트엔드에서도 PerformanceResourceTiming.serverTiming으로 읽을 수 있도록
+        response.headers["Timing-Allow-Origin"] = "*"
+    return response
+
+def busy_response():
+    """분석 프로세스 풀 대기열이 가득 찼을 때의 503 응답"""
+    response = jsonify({"status": "error", "message": "요청이 많습니다. 잠시 후 다시 시도해주세요."})
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    response.headers.add("Access-Control-Allow-Origin", "*")
+    response.headers.add("Access-Control-Allow-Headers", "Content-Type")
+    return response
+
+def run_analysis(method, *args, timings=None):
+    """엔진 분석 메서드 실행 (ASGI 앱에서는 분석 프로세스 풀, 그 밖에는 현재 프로세스)
+
+    풀의 대기열이 가득 차면 PoolBusy가 그대로 전달된다. timings(dict)를 주면
+    메서드의 timings 인자로 넘겨 단계별 시간을 받는다.
+    """
+    pool = get_analysis_pool()
+    if pool is not None:
+        return pool.call(method, *args, timings=timings)
+    from logic.saju_analyzer import get_engine
+    if timings is None:
+        return getattr(get_engine(), method)(*args)
+    return getattr(get_engine(), method)(*args, timings=timings)
+
+def analyze_birth(year, month, day, hour, minute, sections=None, timings=None):
+    """get_saju_details와 같은 결과 (timings는 SajuAnalyzer.analyze와 같음)
+
+    결과 캐시에 있는 차트는 현재 프로세스에서 바로 꺼내고, 없으면 run_analysis로
+    계산한 뒤 전체 결과를 현재 프로세스의 캐시에도 저장한다 (응답 본문 캐시, 차트 키 조회용).
+    """
+    from logic.saju_analyzer import get_engine
+    engine = get_engine()
+    if get_analysis_pool() is None or engine.is_cached(year, month, day, hour, minute):
+        return engine.analyze(year, month, day, hour, minute, sections, timings)
+    result = run_analysis('analyze', year, month, day, hour, minute, sections, timings=timings)
+    if sections is None:
+        engine.remember(year, result)
+    return result
+
+def to_display_result(analysis_result):
+    """분석 결과의 정수 팔자(Pillars)를 응답용 한글 dict로 변환
+
+    엔진 내부와 결과 캐시는 정수 Pillars만 다루고, 표시용 문자열은
+    JSON 응답을 만들기 직전 여기서 한 번만 만든다.
+    """
+    if not analysis_result or "error" in analysis_result:
+        return analysis_result
+    result = dict(analysis_result)
+    if 'saju_pillars' in result:
+        saju_pillars = result['saju_pillars'].to_dict()
+        # 차트 키 조회(GET /analysis/<차트 키>) 결과에는 음력 날짜가 없음
+        if 'lunar_date' in result:
+            saju_pillars['lunar_date'] = result.pop('lunar_date')
+        result['saju_pillars'] = saju_pillars
+    return result
+
+BIRTH_FIELDS = ('year', 'month', 'day', 'hour', 'minute')
+
+def parse_birth_data(birth_data):
+    """요청 JSON의 출생 정보를 검증하고 양력 (연, 월, 일, 시, 분)으로 변환
+
+    calendar: "solar" | "lunar", is_leap_month: 윤달 여부.
+    잘못된 입력은 클라이언트에 그대로 돌려줄 메시지를 담은 ValueError로 알린다.
+    """
+    if not isinstance(birth_data, dict):
+        raise ValueError("Invalid JSON data")
+
+    # 필수 필드 검증
+    for field in BIRTH_FIELDS:
+        if field not in birth_data:
+            raise ValueError(f"Missing required field: {field}")
+
+    # 데이터 타입 검증
+    try:
+        year, month, day, hour, minute = (int(birth_data.get(field)) for field in BIRTH_FIELDS)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid data types. All fields must be integers.")
+
+    # 날짜 유효성 검증
+    if not (1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31 and 0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError("Invalid date/time values")
+
+    calendar_type = birth_data.get('calendar', 'solar')
+    if calendar_type not in ('solar', 'lunar'):
+        raise ValueError("Invalid calendar type. Use 'solar' or 'lunar'.")
+    # 문자열 "false"가 윤달로 해석되지 않도록 JSON 불리언만 허용
+    is_leap_month = birth_data.get('is_leap_month', False)
+    if not isinstance(is_leap_month, bool):
+        raise ValueError("Invalid is_leap_month. Use true or false.")
+
+    if calendar_type == 'solar':
+        if day > calendar.monthrange(year, month)[1]:
+            raise ValueError("Invalid date/time values")
+        return year, month, day, hour, minute
+
+    # 음력 입력은 양력으로 변환 (없는 윤달, 달의 일수를 넘는 날, 지원 범위 밖 양력은 거절)
+    from logic.lunar_calendar import get_lunar_calendar
+    try:
+        year, month, day = get_lunar_calendar().lunar_to_solar(year, month, day, is_leap_month)
+    except ValueError:
+        raise ValueError("Invalid lunar date")
+    if not 1900 <= year <= 2100:
+        raise ValueError("Invalid lunar date")
+    return year, month, day, hour, minute
+
+def parse_sections(raw):
+    """sections 파라미터(목록 또는 쉼표로 구분한 문자열)를 섹션 이름 목록으로 변환
+
+    값이 없으면 None(전체 섹션). 잘못된 값은 클라이언트용 메시지를 담은 ValueError.
+    """
+    if raw is None or raw == '':
+        return None
+    if isinstance(raw, str):
+        raw = [name.strip() for name in raw.split(',') if name.strip()]
+    if not isinstance(raw, list) or not raw or not all(isinstance(name, str) for name in raw):
+        raise ValueError("Invalid sections. Use a list or comma-separated string of section names.")
+
+    from logic.saju_analyzer import SECTIONS
+    unknown = [name for name in raw if name not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown section: {', '.join(unknown)}")
+    return raw
+
+# 스트리밍 응답 형식 (?stream=ndjson | sse 또는 Accept 헤더로 선택)
+STREAM_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream'
+}
+
+def requested_stream_format():
+    """요청이 스트리밍 응답을 원하면 형식 이름을, 아니면 None을 반환
+
+    알 수 없는 ?stream= 값은 클라이언트용 메시지를 담은 ValueError.
+    """
+    stream_format = request.args.get('stream')
+    if stream_format:
+        if stream_format not in STREAM_MIMETYPES:
+            raise ValueError(f"Invalid stream format. Use one of: {', '.join(STREAM_MIMETYPES)}")
+        return stream_format
+    accept = request.headers.get('Accept', '')
+    for name, mimetype in STREAM_MIMETYPES.items():
+        if mimetype in accept:
+            return name
+    return None
+
+def pooled_sections(result):
+    """분석 프로세스 풀의 결과를 iter_sections와 같은 (키, 값) 순서로 내보냄 (실패한 결과면 RuntimeError)"""
+    if not result or "error" in result:
+        raise RuntimeError(f"분석 실패: {result}")
+    yield from result.items()
+
+def stream_analysis(stream_format, year, month, day, hour, minute, sections=None):
+    """분석 섹션을 완성되는 대로 NDJSON 줄 또는 SSE 이벤트로 전송하는 응답
+
+    첫 이벤트는 saju_pillars(음력 날짜 포함)이고, 이후 각 분석 섹션, 마지막으로
+    done 이벤트가 온다. 도중에 오류가 나면 error 이벤트를 보내고 끝낸다.
+    분석 프로세스 풀이 있으면 캐시에 없는 차트는 응답을 시작하기 전에 풀에서
+    계산하고 그 결과를 섹션 순서대로 보낸다 (대기열이 가득 차면 PoolBusy).
+    """
+    # 지연 import로 시작 시간 단축
+    from logic.saju_analyzer import get_engine, format_chart_key
+
+    engine = get_engine()
+    if get_analysis_pool() is None or engine.is_cached(year, month, day, hour, minute):
+        items = engine.iter_sections(year, month, day, hour, minute, sections)
+    else:
+        result = run_analysis('analyze', year, month, day, hour, minute, sections)
+        if sections is None:
+            engine.remember(year, result)
+        items = pooled_sections(result)
+
+    def encode(section, data):
+        payload = json_dumps({"section": section, "data": data})
+        if stream_format == 'sse':
+            return b"event: " + section.encode() + b"\ndata: " + payload + b"\n\n"
+        return payload + b"\n"
+
+    def generate():
+        try:
+            pillars = None
+            for section, data in items:
+                if section == 'saju_pillars':
+                    pillars = data
+                    continue
+                if section == 'lunar_date':
+                    # 일반 응답과 같은 형태로 음력 날짜를 팔자에 합쳐 한 번에 보냄
+                    section, data = 'saju_pillars', {**pillars.to_dict(), 'lunar_date': data}
+                yield encode(section, data)
+            # 전체 결과면 다음부터 GET /analysis/<차트 키>로 조회할 수 있도록 키를 알려줌
+            done = None
+            if sections is None and pillars is not None:
+                done = {"chart_key": format_chart_key(engine.chart_key(pillars, year))}
+            yield encode('done', done)
+        except Exception as e:
+            logger.exception("스트리밍 분석 오류: %s", e)
+            yield encode('error', "분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+
+    response = Response(stream_with_context(generate()), mimetype=STREAM_MIMETYPES[stream_format])
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    response.headers.add("Access-Control-Allow-Origin", "*")
+    response.headers.add("Access-Control-Allow-Headers", "Content-Type")
+    return response
+
+# 프로파일 모드에서 같은 분석을 반복할 수 있는 최대 횟수
+PROFILE_MAX_REPEAT = 200
+
+def profile_analysis(mode, year, month, day, hour, minute, sections=None):
+    """운영자용: 분석을 프로파일러 아래에서 실행하고 보고서를 반환
+
+    X-Profile-Token 헤더가 SAJU_PROFILE_TOKEN과 같아야 한다. 결과 캐시와 분석 프로세스
+    풀을 거치지 않고 현재 프로세스에서 profile_repeat번 새로 계산한다.
+    ?profile=1 또는 cprofile: 누적 시간 상위 함수, ?profile=sample: collapsed stack 파일 저장
+    """
+    from logic.profiling import PROFILE_MODES, DEFAULT_TOP, ProfilerBusy, check_token, run_cprofile, run_sampling
+    from logic.saju_analyzer import get_engine
+
+    if not check_token(request.headers.get("X-Profile-Token")):
+        logger.warning("프로파일 요청 거부 (토큰 불일치 또는 비활성)")
+        return jsonify({"status": "error", "message": "Forbidden"}), 403
+    mode = 'cprofile' if mode == '1' else mode
+    try:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"알 수 없는 프로파일 모드: {mode}")
+        repeat = int(request.args.get('profile_repeat', 1))
+        top = int(request.args.get('profile_top', DEFAULT_TOP))
+        if not 1 <= repeat <= PROFILE_MAX_REPEAT or top < 1:
+            raise ValueError(f"profile_repeat/profile_top 범위 초과: {repeat}, {top}")
+    except ValueError as e:
+        logger.warning("잘못된 프로파일 요청: %s", e)
+        return jsonify({"status": "error", "message": f"Invalid profile request (profile=1|cprofile|sample, profile_repeat 1-{PROFILE_MAX_REPEAT})"}), 400
+
+    engine = get_engine()
+
+    def run():
+        for _ in range(repeat):
+            result = engine.analyze(year, month, day, hour, minute, sections, use_cache=False)
+        return result
+
+    try:
+        if mode == 'sample':
+            result, report = run_sampling(run, request.environ['saju.request_id'], top)
+        else:
+            result, report = run_cprofile(run, top)
+    except ProfilerBusy:
+        return jsonify({"status": "error", "message": "Another profile is running"}), 409
+    if not result or "error" in result:
+        logger.error("프로파일 중 분석 실패: %s", result)
+        return jsonify({"status": "error", "message": "Analysis failed"}), 500
+
+    report['repeat'] = repeat
+    logger.info("프로파일 완료: %s, %d회, %.1fms", mode, repeat, report['total_ms'])
+    return json_response({"status": "success", "profile": report})
+
 @app.route("/")
 def read_root():
     return {"message": "사주지피 API", "status": "running", "version": "1.0"}
@@ -27,6 +426,11 @@ def health_check():
         "uptime_seconds": round(uptime, 2)
     }
 
+@app.route("/metrics")
+def get_metrics():
+    """Prometheus 텍스트 형식 메트릭 (SAJU_METRICS_DIR이 있으면 모든 워커 합계)"""
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
 @app.route("/test")
 def test_endpoint():
     """기본 기능 테스트 엔드포인트"""
@@ -39,12 +443,10 @@ def test_endpoint():
         return jsonify({
             "status": "success",
             "message": "기본 기능 테스트 성공",
-            "test_result": test_result
+            "test_result": to_display_result(test_result)
         })
     except Exception as e:
-        print(f"테스트 엔드포인트 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("테스트 엔드포인트 오류: %s", e)
         return jsonify({
             "status": "error",
             "message": f"테스트 실패: {str(e)}"
@@ -64,79 +466,80 @@ def get_analysis():
         birth_data_json = request.get_json()
         
         if not birth_data_json:
-            print("오류: JSON 데이터가 없습니다.")
+            logger.warning("JSON 데이터가 없습니다.")
             response = jsonify({"status": "error", "message": "Invalid JSON data"})
             response.headers.add("Access-Control-Allow-Origin", "*")
             response.headers.add("Access-Control-Allow-Headers", "Content-Type")
             return response, 400
         
-        print(f"받은 데이터: {birth_data_json}")
-        
-        # 필수 필드 검증
-        required_fields = ['year', 'month', 'day', 'hour', 'minute']
-        for field in required_fields:
-            if field not in birth_data_json:
-                print(f"오류: 필수 필드 누락: {field}")
-                response = jsonify({"status": "error", "message": f"Missing required field: {field}"})
-                response.headers.add("Access-Control-Allow-Origin", "*")
-                response.headers.add("Access-Control-Allow-Headers", "Content-Type")
-                return response, 400
+        payload_logger.debug("받은 데이터: %s", birth_data_json)
         
-        # 데이터 타입 검증
+        # 입력 검증 및 (음력이면) 양력 변환
         try:
-            year = int(birth_data_json.get('year'))
-            month = int(birth_data_json.get('month'))
-            day = int(birth_data_json.get('day'))
-            hour = int(birth_data_json.get('hour'))
-            minute = int(birth_data_json.get('minute'))
-        except (ValueError, TypeError) as e:
-            print(f"오류: 데이터 타입 변환 실패: {e}")
-            response = jsonify({"status": "error", "message": "Invalid data types. All fields must be integers."})
+            year, month, day, hour, minute = parse_birth_data(birth_data_json)
+            # 일부 섹션만 요청 (본문의 sections 또는 ?sections=a,b)
+            sections = parse_sections(birth_data_json.get('sections', request.args.get('sections')))
+            stream_format = requested_stream_format()
+        except ValueError as e:
+            logger.warning("입력 검증 실패: %s", e)
+            response = jsonify({"status": "error", "message": str(e)})
             response.headers.add("Access-Control-Allow-Origin", "*")
             response.headers.add("Access-Control-Allow-Headers", "Content-Type")
             return response, 400
         
-        # 날짜 유효성 검증
-        if not (1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31 and 0 <= hour <= 23 and 0 <= minute <= 59):
-            print(f"오류: 유효하지 않은 날짜/시간: {year}-{month}-{day} {hour}:{minute}")
-            response = jsonify({"status": "error", "message": "Invalid date/time values"})
-            response.headers.add("Access-Control-Allow-Origin", "*")
-            response.headers.add("Access-Control-Allow-Headers", "Content-Type")
-            return response, 400
+        logger.info("분석 시작: %s-%s-%s %s:%s", year, month, day, hour, minute)
+        
+        # 운영자 프로파일 모드 (?profile=1|cprofile|sample, X-Profile-Token 필요)
+        profile_mode = request.args.get('profile')
+        if profile_mode:
+            return profile_analysis(profile_mode, year, month, day, hour, minute, sections)
         
-        print(f"분석 시작: {year}-{month}-{day} {hour}:{minute}")
+        # 스트리밍 모드: 섹션이 완성되는 대로 전송
+        if stream_format:
+            return stream_analysis(stream_format, year, month, day, hour, minute, sections)
         
         # 지연 import로 시작 시간 단축
-        from logic.saju_analyzer import get_saju_details
+        from logic.saju_analyzer import get_engine, format_chart_key
         
-        # 사주 분석 실행
-        analysis_result = get_saju_details(year, month, day, hour, minute)
+        # 사주 분석 실행 (단계별 시간은 Server-Timing 헤더로 보냄)
+        timings = {}
+        started = time.perf_counter()
+        analysis_result = analyze_birth(year, month, day, hour, minute, sections, timings)
+        timing = analysis_timing(timings, time.perf_counter() - started)
         
-        print(f"분석 결과: {analysis_result}")
+        payload_logger.debug("분석 결과: %s", analysis_result)
         
         # 분석 결과 검증
         if not analysis_result or "error" in analysis_result:
-            print(f"오류: 분석 실패 - {analysis_result}")
+            logger.error("분석 실패: %s", analysis_result)
             response = jsonify({"status": "error", "message": "Analysis failed"})
             response.headers.add("Access-Control-Allow-Origin", "*")
             response.headers.add("Access-Control-Allow-Headers", "Content-Type")
             return response, 500
         
-        response = jsonify({
-            "status": "success",
-            "request_data": birth_data_json,
-            "analysis_result": analysis_result
-        })
+        payload = {"status": "success"}
+        
+        # 전체 결과는 차트 캐시 항목에 응답 본문을 함께 보관 (음력 날짜가 다르면 다른 본문)
+        # 하고, GET /analysis/<차트 키>로 다시 조회할 수 있도록 키를 알려줌
+        body_cache = None
+        if sections is None:
+            engine = get_engine()
+            chart_key = engine.chart_key(analysis_result['saju_pillars'], year)
+            body_cache = (engine.result_cache, chart_key, json_dumps(analysis_result['lunar_date']))
+            payload["chart_key"] = format_chart_key(chart_key)
+        
+        payload["analysis_result"] = to_display_result(analysis_result)
+        response = json_response(payload, body_cache=body_cache, timing=timing)
         
         # 응답에도 CORS 헤더 추가
         response.headers.add("Access-Control-Allow-Origin", "*")
         response.headers.add("Access-Control-Allow-Headers", "Content-Type")
         return response
         
+    except PoolBusy:
+        return busy_response()
     except Exception as e:
-        # 로그 출력
-        print(f"분석 엔드포인트 오류: {str(e)}")
-        traceback.print_exc()
+        logger.exception("분석 엔드포인트 오류: %s", e)
         
         # 클라이언트에게 일반적인 오류 메시지 반환
         response = jsonify({
@@ -147,6 +550,238 @@ def get_analysis():
         response.headers.add("Access-Control-Allow-Headers", "Content-Type")
         return response, 500
 
+# 차트 키 응답을 브라우저/CDN이 재검증 없이 쓰는 시간 (초)
+CHART_MAX_AGE = int(os.environ.get('SAJU_CHART_MAX_AGE', 86400))
+
+def chart_max_age(key, now=None):
+    """차트 키 응답의 max-age (CHART_MAX_AGE, 단 기준년도가 끝나 키가 만료되기 전까지)"""
+    now = now or datetime.datetime.now()
+    remaining = (datetime.datetime(key[2] + 1, 1, 1) - now).total_seconds()
+    return max(0, min(CHART_MAX_AGE, int(remaining)))
+
+@app.route("/analysis/<chart_key>", methods=["GET"])
+def get_chart_analysis(chart_key):
+    """차트 키 URL로 전체 분석 결과 조회 (캐시 가능한 GET, ETag/If-None-Match 지원)
+
+    차트 키는 POST /analysis 응답의 chart_key(팔자, 생년, 기준년도)이다. 출생 날짜가
+    없으므로 음력 날짜는 포함하지 않는다. ETag는 차트 키, 엔진 버전, 데이터 파일
+    해시와 압축 방식으로 정해지므로 내용이 같으면 항상 같다.
+    """
+    # 지연 import로 시작 시간 단축
+    from logic.saju_analyzer import get_engine, parse_chart_key
+    from logic.chart_index import get_chart_index
+
+    try:
+        key = parse_chart_key(chart_key)
+    except ValueError:
+        return jsonify({"status": "error", "message": "Invalid chart key"}), 404
+    # 기준년도가 지났거나 실제로 나올 수 없는 팔자/생년 조합이면 없는 키로 취급
+    if key[2] != datetime.date.today().year or not get_chart_index().occurs(key[0], key[1]):
+        return jsonify({"status": "error", "message": "Unknown or expired chart key"}), 404
+
+    engine = get_engine()
+    encoding = compressor.negotiate(request.headers.get('Accept-Encoding', ''))
+    etag = engine.chart_etag(key) + (f"-{encoding}" if encoding else "")
+
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        timings = {}
+        started = time.perf_counter()
+        try:
+            if key in engine.result_cache:
+                analysis_result = engine.analyze_chart(key, timings=timings)
+            else:
+                analysis_result = run_analysis('analyze_chart', key, timings=timings)
+                engine.remember(key[1], analysis_result)
+        except PoolBusy:
+            return busy_response()
+        except Exception as e:
+            logger.exception("차트 키 조회 오류: %s", e)
+            return jsonify({"status": "error", "message": "분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."}), 500
+        response = json_response({
+            "status": "success",
+            "chart_key": chart_key,
+            "analysis_result": to_display_result(analysis_result)
+        }, body_cache=(engine.result_cache, key, None), timing=analysis_timing(timings, time.perf_counter() - started))
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = f"public, max-age={chart_max_age(key)}"
+    response.vary.add("Accept-Encoding")
+    return response
+
+# 배치 분석 제한 (항목 수, 요청 본문 크기)
+BATCH_MAX_ITEMS = 500
+BATCH_MAX_BYTES = 256 * 1024
+
+@app.route("/analysis/batch", methods=["POST", "OPTIONS"])
+def get_batch_analysis():
+    """여러 출생 정보를 한 번에 분석 ({"items": [...]} 또는 배열)
+
+    같은 차트(팔자/생년)는 한 번만 계산하고, 결과는 입력 순서대로 항목별
+    status와 함께 돌려준다. 잘못된 항목이 있어도 나머지 항목은 분석한다.
+    """
+    if request.method == "OPTIONS":
+        response = jsonify({"status": "ok"})
+        response.headers.add("Access-Control-Allow-Origin", "*")
+        response.headers.add("Access-Control-Allow-Headers", "Content-Type")
+        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
+        return response
+
+    def error_response(message, status_code):
+        response = jsonify({"status": "error", "message": message})
+        response.headers.add("Access-Control-Allow-Origin", "*")
+        response.headers.add("Access-Control-Allow-Headers", "Content-Type")
+        return response, status_code
+
+    try:
+        # 본문 크기 제한 (Content-Length가 없으면 제한 크기까지만 읽어 확인)
+        if request.content_length is not None and request.content_length > BATCH_MAX_BYTES:
+            return error_response(f"Payload too large (max {BATCH_MAX_BYTES} bytes)", 413)
+        body = request.stream.read(BATCH_MAX_BYTES + 1)
+        if len(body) > BATCH_MAX_BYTES:
+            return error_response(f"Payload too large (max {BATCH_MAX_BYTES} bytes)", 413)
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return error_response("Invalid JSON data", 400)
+        items = payload.get('items') if isinstance(payload, dict) else payload
+        if not isinstance(items, list) or not items:
+            return error_response("Request must contain a non-empty 'items' array", 400)
+        if len(items) > BATCH_MAX_ITEMS:
+            return error_response(f"Too many items (max {BATCH_MAX_ITEMS})", 413)
+        try:
+            sections = parse_sections(payload.get('sections') if isinstance(payload, dict) else request.args.get('sections'))
+        except ValueError as e:
+            return error_response(str(e), 400)
+
+        # 항목별 입력 검증 (실패한 항목은 오류 메시지만 남김)
+        births = []
+        errors = {}
+        for position, item in enumerate(items):
+            try:
+                births.append(parse_birth_data(item))
+            except ValueError as e:
+                errors[position] = str(e)
+
+        logger.info("배치 분석 시작: %d건 (입력 오류 %d건)", len(items), len(errors))
+
+        analysis_results, unique_charts = run_analysis('analyze_batch', births, sections)
+        analysis_results = iter(analysis_results)
+
+        results = []
+        for position in range(len(items)):
+            if position in errors:
+                results.append({"status": "error", "message": errors[position]})
+                continue
+            analysis_result = next(analysis_results)
+            if not analysis_result or "error" in analysis_result:
+                results.append({"status": "error", "message": "Analysis failed"})
+            else:
+                results.append({"status": "success", "analysis_result": to_display_result(analysis_result)})
+
+        logger.info("배치 분석 완료: %d건, 고유 차트 %d건", len(items), unique_charts)
+
+        response = json_response({
+            "status": "success",
+            "count": len(results),
+            "unique_charts": unique_charts,
+            "results": results
+        })
+        response.headers.add("Access-Control-Allow-Origin", "*")
+        response.headers.add("Access-Control-Allow-Headers", "Content-Type")
+        return response
+
+    except PoolBusy:
+        return busy_response()
+    except Exception as e:
+        logger.exception("배치 분석 엔드포인트 오류: %s", e)
+        return error_response("분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.", 500)
+
+# 역색인 검색 결과 개수 제한 (기본값, 최댓값)
+SEARCH_DEFAULT_LIMIT = 1000
+SEARCH_MAX_LIMIT = 10000
+
+@app.route("/charts/search")
+def search_charts():
+    """팔자(일부 기둥만 지정 가능)가 나오는 출생 시각 구간 검색
+
+    예: /charts/search?day=갑자&hour=병인&start=1990-01-01&end=2000-01-01
+    """
+    from logic.chart_index import get_chart_index, parse_ganji, minutes_to_datetime, datetime_to_minutes
+
+    try:
+        pillars = {}
+        for field in ('year', 'month', 'day', 'hour'):
+            value = request.args.get(field)
+            if value:
+                pillars[field] = parse_ganji(value.strip())
+    except ValueError as e:
+        logger.warning("잘못된 간지: %s", e)
+        return jsonify({"status": "error", "message": "Invalid ganji. Use two characters such as '갑자' or '甲子'."}), 400
+    if not pillars:
+        return jsonify({"status": "error", "message": "At least one of year, month, day, hour is required"}), 400
+
+    try:
+        bounds = {}
+        for field in ('start', 'end'):
+            value = request.args.get(field)
+            if value:
+                bounds[field] = datetime_to_minutes(datetime.datetime.fromisoformat(value))
+        limit = int(request.args.get('limit', SEARCH_DEFAULT_LIMIT))
+        if not 1 <= limit <= SEARCH_MAX_LIMIT:
+            raise ValueError(f"limit 범위 초과: {limit}")
+    except ValueError as e:
+        logger.warning("잘못된 검색 범위: %s", e)
+        return jsonify({"status": "error", "message": f"Invalid start/end/limit (limit must be 1-{SEARCH_MAX_LIMIT})"}), 400
+
+    try:
+        runs, truncated = get_chart_index().search_minutes(**pillars, **bounds, limit=limit)
+    except Exception as e:
+        logger.exception("검색 엔드포인트 오류: %s", e)
+        return jsonify({"status": "error", "message": "검색 중 오류가 발생했습니다."}), 500
+
+    return json_response({
+        "status": "success",
+        "count": len(runs),
+        "truncated": truncated,
+        "runs": [
+            {"start": minutes_to_datetime(start).isoformat(timespec='minutes'),
+             "end": minutes_to_datetime(end).isoformat(timespec='minutes')}
+            for start, end in runs
+        ]
+    })
+
+def prepare_asgi():
+    """ASGI 앱 시작 시 엔진과 역색인을 만들고 분석 프로세스 풀을 띄움"""
+    from logic.saju_analyzer import get_engine
+    from logic.chart_index import get_chart_index
+    get_engine()
+    get_chart_index()
+    # 분석 프로세스 풀 워커도 같은 메트릭 디렉터리에 기록하도록 풀보다 먼저 준비
+    metrics.prepare_metrics_dir()
+    pool = start_analysis_pool()
+    # 분석 대기열이 가득 차도 /health 등 가벼운 요청을 처리할 스레드가 남도록
+    asgi_app.threads = max(asgi_app.threads, pool.max_in_flight + ASGI_SPARE_THREADS)
+    logger.info("ASGI 준비 완료: 분석 프로세스 %d개, 동시 분석 최대 %d건, 스레드 %d개",
+                pool.workers, pool.max_in_flight, asgi_app.threads)
+
+def stop_asgi():
+    """ASGI 앱 종료 시 분석 프로세스 풀을 멈추고 직접 만든 메트릭 디렉터리를 지움"""
+    stop_analysis_pool()
+    metrics.remove_metrics_dir()
+
+# ASGI 진입점 (예: uvicorn main:asgi_app). 라우트는 Flask app과 같고, 연결/본문 I/O는
+# 이벤트 루프에서, 라우트는 스레드 풀에서, 분석은 크기 제한이 있는 프로세스 풀에서 실행한다.
+ASGI_SPARE_THREADS = 16
+asgi_app = WsgiToAsgi(
+    app,
+    threads=int(os.environ.get('SAJU_ASGI_THREADS', 32)),
+    on_startup=prepare_asgi,
+    on_shutdown=stop_asgi
+)
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     app.run(host="0.0.0.0", port=port, debug=False)
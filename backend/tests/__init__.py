@@ -0,0 +1 @@
+# 백엔드 테스트 (backend 디렉터리에서 python -m pytest)
\ No newline at end of file
@@ -0,0 +1,124 @@
+# WSGI -> ASGI 어댑터(logic.asgi.WsgiToAsgi) 테스트 (receive/send를 직접 흉내냄)
+import asyncio
+import threading
+
+import pytest
+
+from logic.asgi import WsgiToAsgi
+
+SCOPE = {'type': 'http', 'method': 'POST', 'path': '/', 'query_string': b'', 'headers': []}
+
+def run(app, messages, send=None, disconnect=None):
+    """messages를 차례로 받고, 그 뒤에는 disconnect(asyncio.Event)가 설정되면 연결 끊김을 받음"""
+    sent = []
+
+    async def main():
+        pending = list(messages)
+        gone = disconnect or asyncio.Event()
+
+        async def receive():
+            if pending:
+                return pending.pop(0)
+            await gone.wait()
+            return {'type': 'http.disconnect'}
+
+        async def record(message):
+            sent.append(message)
+            if send is not None:
+                await send(message, gone)
+
+        await asyncio.wait_for(app(dict(SCOPE), receive, record), 5)
+
+    asyncio.run(main())
+    return sent
+
+def body_message(body=b'', more_body=False):
+    return {'type': 'http.request', 'body': body, 'more_body': more_body}
+
+def test_request_and_response():
+    def wsgi_app(environ, start_response):
+        body = environ['wsgi.input'].read()
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [b'got ', body]
+
+    sent = run(WsgiToAsgi(wsgi_app), [body_message(b'ab', True), body_message(b'c')])
+    assert sent[0] == {'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'text/plain')]}
+    assert b''.join(message.get('body', b'') for message in sent[1:]) == b'got abc'
+    assert sent[-1]['more_body'] is False
+
+def test_disconnect_while_reading_body_skips_route():
+    calls = []
+
+    def wsgi_app(environ, start_response):
+        calls.append(environ)
+        start_response('200 OK', [])
+        return [b'']
+
+    sent = run(WsgiToAsgi(wsgi_app), [body_message(b'{"ye', True), {'type': 'http.disconnect'}])
+    assert calls == []
+    assert sent == []
+
+def test_disconnect_stops_streaming():
+    produced = []
+    closed = threading.Event()
+
+    def wsgi_app(environ, start_response):
+        def generate():
+            try:
+                while True:
+                    produced.append(len(produced))
+                    yield b'x'
+            finally:
+                closed.set()
+        start_response('200 OK', [])
+        return generate()
+
+    async def send(message, gone):
+        if message.get('body') and len(produced) > 3:
+            gone.set()
+            await asyncio.sleep(0.05)
+
+    sent = run(WsgiToAsgi(wsgi_app, max_chunks=2), [body_message()], send=send)
+    assert closed.is_set()
+    assert not any(message.get('more_body') is False for message in sent)
+    assert len(produced) < 50
+
+def test_slow_client_bounds_buffered_chunks():
+    produced = []
+    sent_bodies = []
+    max_ahead = []
+
+    def wsgi_app(environ, start_response):
+        start_response('200 OK', [])
+        for index in range(40):
+            produced.append(index)
+            yield b'x'
+
+    async def send(message, gone):
+        if message['type'] == 'http.response.body' and message.get('body'):
+            # 보낸 조각 수보다 응답 스레드가 얼마나 앞서 있는지
+            await asyncio.sleep(0.005)
+            max_ahead.append(len(produced) - len(sent_bodies))
+            sent_bodies.append(message['body'])
+
+    sent = run(WsgiToAsgi(wsgi_app, max_chunks=4), [body_message()], send=send)
+    assert len(sent_bodies) == 40
+    assert sent[-1]['more_body'] is False
+    assert max(max_ahead) <= 4 + 1
+
+def test_error_before_headers_is_500():
+    def wsgi_app(environ, start_response):
+        raise RuntimeError("boom")
+
+    sent = run(WsgiToAsgi(wsgi_app), [body_message()])
+    assert sent[0]['status'] == 500
+    assert sent[-1]['more_body'] is False
+
+def test_error_after_headers_aborts_response():
+    def wsgi_app(environ, start_response):
+        start_response('200 OK', [])
+        yield b'partial'
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        run(WsgiToAsgi(wsgi_app), [body_message()])
@@ -0,0 +1,69 @@
+# POST /analysis/batch 테스트 (중복 차트 한 번만 계산, 항목별 오류, 413 제한)
+import json
+
+import pytest
+from werkzeug.test import EnvironBuilder
+
+from logic.saju_analyzer import get_engine
+from main import app, BATCH_MAX_BYTES, BATCH_MAX_ITEMS
+
+BIRTH = {'year': 1990, 'month': 5, 'day': 15, 'hour': 10, 'minute': 30}
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+def test_duplicates_are_analyzed_once(client, monkeypatch):
+    engine = get_engine()
+    calls = []
+    analyze = engine.analyze
+    monkeypatch.setattr(engine, 'analyze', lambda *args, **kwargs: calls.append(args) or analyze(*args, **kwargs))
+
+    # 1990-05-15 10:30과 10:40은 같은 시주(사시)라 같은 차트
+    items = [BIRTH, dict(BIRTH, minute=40), BIRTH, dict(BIRTH, day=16)]
+    response = client.post('/analysis/batch', json={'items': items})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['count'] == 4
+    assert data['unique_charts'] == 2
+    assert len(calls) == 2
+    results = data['results']
+    assert [result['status'] for result in results] == ['success'] * 4
+    assert results[0]['analysis_result'] == results[2]['analysis_result']
+    assert results[0]['analysis_result']['saju_pillars'] == results[1]['analysis_result']['saju_pillars']
+    assert results[0]['analysis_result']['saju_pillars'] != results[3]['analysis_result']['saju_pillars']
+
+def test_bare_array_and_per_item_errors(client):
+    items = [BIRTH, {'year': 1990, 'month': 2, 'day': 30, 'hour': 0, 'minute': 0}, 'not an object', BIRTH]
+    response = client.post('/analysis/batch', json=items)
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [result['status'] for result in results] == ['success', 'error', 'error', 'success']
+    assert results[1]['message'] == 'Invalid date/time values'
+
+@pytest.mark.parametrize('body', [b'not json', b'{}', b'[]', b'{"items": []}', b'{"items": 1}'])
+def test_bad_payload_is_400(client, body):
+    response = client.post('/analysis/batch', data=body, content_type='application/json')
+    assert response.status_code == 400
+
+def test_too_many_items_is_413(client):
+    response = client.post('/analysis/batch', json={'items': [BIRTH] * (BATCH_MAX_ITEMS + 1)})
+    assert response.status_code == 413
+    assert str(BATCH_MAX_ITEMS) in response.get_json()['message']
+
+    response = client.post('/analysis/batch', json={'items': [BIRTH] * BATCH_MAX_ITEMS})
+    assert response.status_code == 200
+
+def test_too_large_body_is_413(client):
+    body = json.dumps({'items': [BIRTH], 'padding': 'x' * BATCH_MAX_BYTES}).encode()
+    response = client.post('/analysis/batch', data=body, content_type='application/json')
+    assert response.status_code == 413
+    assert str(BATCH_MAX_BYTES) in response.get_json()['message']
+
+def test_too_large_body_without_content_length_is_413(client):
+    body = json.dumps({'items': [BIRTH], 'padding': 'x' * BATCH_MAX_BYTES}).encode()
+    environ = EnvironBuilder('/analysis/batch', method='POST', data=body, content_type='application/json').get_environ()
+    del environ['CONTENT_LENGTH']
+    environ['wsgi.input_terminated'] = True
+    response = client.open(environ)
+    assert response.status_code == 413
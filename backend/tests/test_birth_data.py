@@ -0,0 +1,58 @@
+# 요청 출생 정보 검증(parse_birth_data) 테스트
+import pytest
+
+from main import parse_birth_data
+
+BIRTH = {'year': 1990, 'month': 5, 'day': 15, 'hour': 10, 'minute': 30}
+
+def test_solar_passthrough():
+    assert parse_birth_data(BIRTH) == (1990, 5, 15, 10, 30)
+    assert parse_birth_data({**BIRTH, 'calendar': 'solar', 'is_leap_month': True}) == (1990, 5, 15, 10, 30)
+
+def test_lunar_conversion():
+    assert parse_birth_data({**BIRTH, 'calendar': 'lunar'}) == (1990, 6, 7, 10, 30)
+    # 1990년 윤5월
+    assert parse_birth_data({**BIRTH, 'calendar': 'lunar', 'is_leap_month': True}) == (1990, 7, 7, 10, 30)
+    assert parse_birth_data({**BIRTH, 'calendar': 'lunar', 'is_leap_month': False}) == (1990, 6, 7, 10, 30)
+
+@pytest.mark.parametrize('changes, message', [
+    ({'is_leap_month': 'false'}, "Invalid is_leap_month"),
+    ({'is_leap_month': 1}, "Invalid is_leap_month"),
+    ({'is_leap_month': None}, "Invalid is_leap_month"),
+    ({'calendar': 'julian'}, "Invalid calendar type"),
+    ({'year': 'abc'}, "Invalid data types"),
+    ({'year': None}, "Invalid data types"),
+    ({'year': 1899}, "Invalid date/time values"),
+    ({'year': 2101}, "Invalid date/time values"),
+    ({'month': 13}, "Invalid date/time values"),
+    ({'hour': 24}, "Invalid date/time values"),
+    ({'minute': -1}, "Invalid date/time values"),
+    ({'month': 2, 'day': 30}, "Invalid date/time values"),
+    ({'year': 2023, 'month': 2, 'day': 29}, "Invalid date/time values"),
+    ({'month': 4, 'day': 31}, "Invalid date/time values"),
+    # 없는 윤달, 달의 일수를 넘는 날, 양력 2101년으로 넘어가는 음력 날짜
+    ({'calendar': 'lunar', 'year': 2024, 'month': 3, 'is_leap_month': True}, "Invalid lunar date"),
+    ({'calendar': 'lunar', 'year': 2023, 'month': 1, 'day': 30}, "Invalid lunar date"),
+    ({'calendar': 'lunar', 'year': 2100, 'month': 12, 'day': 29}, "Invalid lunar date"),
+])
+def test_rejects_bad_input(changes, message):
+    with pytest.raises(ValueError, match=message):
+        parse_birth_data({**BIRTH, **changes})
+
+@pytest.mark.parametrize('field', ['year', 'month', 'day', 'hour', 'minute'])
+def test_rejects_missing_field(field):
+    body = {key: value for key, value in BIRTH.items() if key != field}
+    with pytest.raises(ValueError, match=f"Missing required field: {field}"):
+        parse_birth_data(body)
+
+def test_rejects_non_object():
+    with pytest.raises(ValueError, match="Invalid JSON data"):
+        parse_birth_data([BIRTH])
+
+def test_bad_input_is_400():
+    from main import app
+    client = app.test_client()
+    response = client.post('/analysis', json={**BIRTH, 'calendar': 'lunar', 'is_leap_month': 'false'})
+    assert response.status_code == 400
+    response = client.post('/analysis', json={**BIRTH, 'calendar': 'lunar', 'year': 2100, 'month': 12, 'day': 29})
+    assert response.status_code == 400
@@ -0,0 +1,37 @@
+# 팔자 계산 테스트 (SajuCalculator와 기존 analyzer.calculate_pillars)
+import random
+
+import pytest
+
+from logic.analyzer import calculate_pillars
+from logic.saju_calculator import SajuCalculator
+
+@pytest.fixture(scope='module')
+def calculator():
+    return SajuCalculator()
+
+# (연, 월, 일, 시, 분) -> 표시용 팔자 (연, 월, 일, 시)
+KNOWN_CHARTS = [
+    ((2000, 1, 1, 12, 0), ('기묘', '병자', '무오', '무오')),
+    # 입춘(2024-02-04 17:27 KST) 전후로 연주와 월주가 함께 바뀜
+    ((2024, 2, 4, 17, 0), ('계묘', '을축', '무술', '신유')),
+    ((2024, 2, 4, 18, 0), ('갑진', '병인', '무술', '신유')),
+    # 1월 중순은 소한과 입춘 사이이므로 축월
+    ((1990, 1, 15, 10, 0), ('기사', '정축', '경진', '신사')),
+]
+
+def _display(pillars):
+    chart = pillars.to_dict()
+    return tuple(chart[position]['gan'] + chart[position]['ji'] for position in ('year', 'month', 'day', 'hour'))
+
+@pytest.mark.parametrize('birth, expected', KNOWN_CHARTS)
+def test_known_charts(calculator, birth, expected):
+    assert _display(calculator.calculate_pillars(*birth)) == expected
+    assert _display(calculate_pillars(*birth)) == expected
+
+def test_engines_agree():
+    rng = random.Random(20240101)
+    calculator = SajuCalculator()
+    for _ in range(2000):
+        birth = (rng.randint(1900, 2100), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59))
+        assert calculator.calculate_pillars(*birth) == calculate_pillars(*birth), birth
@@ -0,0 +1,71 @@
+# 차트 키 (형식/해석)와 GET /analysis/<chart_key> 캐시 헤더 테스트
+import datetime
+
+import pytest
+
+from logic.pillars import Pillars
+from logic.saju_analyzer import format_chart_key, parse_chart_key
+from main import app, chart_max_age, CHART_MAX_AGE
+
+BIRTH = {'year': 1990, 'month': 5, 'day': 15, 'hour': 10, 'minute': 30}
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+@pytest.fixture
+def chart_key(client):
+    response = client.post('/analysis', json=BIRTH)
+    assert response.status_code == 200
+    return response.get_json()['chart_key']
+
+def test_format_parse_round_trip():
+    key = (Pillars(6, 6, 7, 5, 6, 4, 7, 5), 1990, 2026)
+    text = format_chart_key(key)
+    assert text == '66756475-1990-2026'
+    assert parse_chart_key(text) == key
+
+@pytest.mark.parametrize('text', [
+    '', '66756475', '66756475-1990', '66756475-1990-2026-1',
+    '6675647-1990-2026', '66756475-90-2026', '66756475-1899-2026', '66756475-2101-2026',
+    # 천간 a(10), 지지 c(12), 음양이 맞지 않는 갑축(0, 1)
+    'a6756475-1990-2026', '6c756475-1990-2026', '01756475-1990-2026', 'X6756475-1990-2026',
+])
+def test_parse_rejects_bad_keys(text):
+    with pytest.raises(ValueError):
+        parse_chart_key(text)
+
+def test_etag_and_304(client, chart_key):
+    first = client.get(f'/analysis/{chart_key}')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert first.get_json()['chart_key'] == chart_key
+    assert 'Accept-Encoding' in first.headers['Vary']
+
+    again = client.get(f'/analysis/{chart_key}', headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.headers['ETag'] == etag
+    assert again.get_data() == b''
+
+    # 압축 방식이 다르면 ETag도 다름
+    gzipped = client.get(f'/analysis/{chart_key}', headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+    assert gzipped.headers['ETag'] != etag
+
+def test_unknown_and_expired_keys_are_404(client, chart_key):
+    assert client.get('/analysis/not-a-key').status_code == 404
+    pillars, birth_year, as_of_year = chart_key.split('-')
+    assert client.get(f'/analysis/{pillars}-{birth_year}-{int(as_of_year) - 1}').status_code == 404
+    # 형식은 맞지만 1990년생에게 나올 수 없는 연주
+    assert client.get(f'/analysis/00{pillars[2:]}-{birth_year}-{as_of_year}').status_code == 404
+
+def test_max_age_stops_at_year_end():
+    key = (Pillars(6, 6, 7, 5, 6, 4, 7, 5), 1990, 2026)
+    assert chart_max_age(key, datetime.datetime(2026, 6, 1)) == CHART_MAX_AGE
+    assert chart_max_age(key, datetime.datetime(2026, 12, 31, 23, 0)) == 3600
+    assert chart_max_age(key, datetime.datetime(2027, 1, 1, 0, 0, 1)) == 0
+
+def test_cache_control_header(client, chart_key):
+    response = client.get(f'/analysis/{chart_key}')
+    max_age = int(response.headers['Cache-Control'].split('max-age=')[1])
+    assert 0 <= max_age <= CHART_MAX_AGE
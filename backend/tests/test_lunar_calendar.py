@@ -0,0 +1,64 @@
+# 양력/음력 변환 테스트
+import pytest
+
+from logic.lunar_calendar import get_lunar_calendar
+from logic.solar_terms import civil_from_days, days_from_civil
+
+@pytest.fixture(scope='module')
+def lunar():
+    return get_lunar_calendar()
+
+# (음력 연, 월, 일, 윤달) -> 양력 (설날, 추석, 윤달, 범위 양 끝)
+KNOWN_DATES = [
+    ((1900, 1, 1, False), (1900, 1, 31)),
+    ((2023, 8, 15, False), (2023, 9, 29)),
+    ((2024, 1, 1, False), (2024, 2, 10)),
+    ((2023, 2, 1, True), (2023, 3, 22)),
+    ((2100, 12, 1, False), (2100, 12, 31)),
+]
+
+@pytest.mark.parametrize('lunar_date, solar_date', KNOWN_DATES)
+def test_known_dates(lunar, lunar_date, solar_date):
+    assert lunar.lunar_to_solar(*lunar_date) == solar_date
+    year, month, day, is_leap = lunar_date
+    assert lunar.solar_to_lunar(*solar_date) == {'year': year, 'month': month, 'day': day, 'is_leap': is_leap}
+
+def test_round_trip_every_day(lunar):
+    """1900-01-01부터 2100-12-31까지 모든 양력 날짜가 음력을 거쳐 그대로 돌아옴"""
+    for days in range(days_from_civil(1900, 1, 1), days_from_civil(2100, 12, 31) + 1):
+        solar = civil_from_days(days)
+        converted = lunar.solar_to_lunar(*solar)
+        assert lunar.lunar_to_solar(converted['year'], converted['month'], converted['day'], converted['is_leap']) == solar
+
+def test_leap_months(lunar):
+    leap_months = [(lunar.years[i], lunar.months[i]) for i in range(lunar.count - 1) if lunar.leaps[i]]
+    # 19년에 7번 정도 윤달이 든다
+    assert 70 <= len(leap_months) <= 80
+    for year, month in leap_months:
+        # 윤달은 같은 번호의 평달 바로 다음 달
+        assert lunar.lunar_to_solar(year, month, 1, True) > lunar.lunar_to_solar(year, month, 1)
+    with pytest.raises(ValueError):
+        lunar.lunar_to_solar(2024, 3, 1, True)
+
+def test_rejects_out_of_range(lunar):
+    with pytest.raises(ValueError):
+        lunar.lunar_to_solar(2023, 1, 30)
+    with pytest.raises(ValueError):
+        lunar.lunar_to_solar(2101, 1, 1)
+    with pytest.raises(ValueError):
+        lunar.solar_to_lunar(1899, 12, 31)
+    with pytest.raises(ValueError):
+        lunar.solar_to_lunar(2101, 2, 1)
+
+def test_batch_matches_scalar(lunar):
+    np = pytest.importorskip('numpy')
+    days = np.arange(days_from_civil(1900, 1, 1), days_from_civil(2100, 12, 31) + 1, 7)
+    solar = [civil_from_days(int(value)) for value in days]
+    years, months, month_days = (np.array(column) for column in zip(*solar))
+    lunar_years, lunar_months, lunar_days, leaps = lunar.solar_to_lunar_batch(years, months, month_days)
+    for i in range(0, len(solar), 97):
+        assert lunar.solar_to_lunar(*solar[i]) == {
+            'year': int(lunar_years[i]), 'month': int(lunar_months[i]), 'day': int(lunar_days[i]), 'is_leap': bool(leaps[i])
+        }
+    back = lunar.lunar_to_solar_batch(lunar_years, lunar_months, lunar_days, leaps)
+    assert [tuple(int(column[i]) for column in back) for i in range(len(solar))] == solar
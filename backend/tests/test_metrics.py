@@ -0,0 +1,29 @@
+# 공유 메트릭 디렉터리(prepare_metrics_dir) 테스트
+import os
+
+from logic import metrics
+
+def test_temporary_dir_is_removed_by_owner_only(monkeypatch):
+    # 빈 값은 설정하지 않은 것과 같음 (테스트가 끝나면 원래 값으로 돌아감)
+    monkeypatch.setenv('SAJU_METRICS_DIR', '')
+    directory = metrics.prepare_metrics_dir()
+    assert os.environ['SAJU_METRICS_DIR'] == directory
+    assert os.path.isdir(directory)
+
+    # fork된 자식 프로세스에서는 지우지 않음
+    monkeypatch.setattr(metrics, '_created_dir', (directory, os.getpid() + 1))
+    metrics.remove_metrics_dir()
+    assert os.path.isdir(directory)
+    monkeypatch.setattr(metrics, '_created_dir', (directory, os.getpid()))
+    metrics.remove_metrics_dir()
+    assert not os.path.exists(directory)
+
+def test_configured_dir_is_kept_and_cleared(monkeypatch, tmp_path):
+    monkeypatch.setenv('SAJU_METRICS_DIR', str(tmp_path))
+    (tmp_path / '123.db').write_bytes(b'old')
+    assert metrics.prepare_metrics_dir() == str(tmp_path)
+    assert os.listdir(tmp_path) == ['123.db']
+    assert metrics.prepare_metrics_dir(clear=True) == str(tmp_path)
+    assert os.listdir(tmp_path) == []
+    metrics.remove_metrics_dir()
+    assert os.path.isdir(tmp_path)
@@ -0,0 +1,70 @@
+# 배치 사주 계산(calculate_saju_pillars_batch)과 스칼라 경로 비교 테스트
+#
+# 배치 경로는 np.searchsorted, 스칼라 경로는 bisect로 절기 경계를 찾으므로 경계
+# 바로 앞/위/뒤 분에서 한 칸 어긋나기 쉽다. 1900~2100년의 모든 절기 시각 -1/0/+1분과
+# 몇 해의 매 시각을 비교한다.
+import datetime
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from logic.analyzer import calculate_pillars, calculate_saju_pillars_batch
+from logic.solar_terms import KST_OFFSET_SECONDS, TERMS_PER_YEAR, civil_from_days, get_solar_terms
+
+def _compare(rows):
+    years, months, days, hours, minutes = (np.array(column) for column in zip(*rows))
+    batch = calculate_saju_pillars_batch(years, months, days, hours, minutes)
+    mismatches = [
+        (row, tuple(batch[i].tolist()), tuple(calculate_pillars(*row)))
+        for i, row in enumerate(rows)
+        if tuple(batch[i].tolist()) != tuple(calculate_pillars(*row))
+    ]
+    assert mismatches == []
+
+def _term_minutes(offsets):
+    """1900~2100년 모든 절기 시각(KST)을 분 단위로 내린 시각에 offsets(분)를 더한 입력 목록"""
+    table = get_solar_terms()
+    rows = []
+    for year in range(table.start_year, table.end_year + 1):
+        for term in range(TERMS_PER_YEAR):
+            local_minute = (table.term_instant(year, term) + KST_OFFSET_SECONDS) // 60
+            for offset in offsets:
+                minutes = local_minute + offset
+                days, minute_of_day = divmod(minutes, 1440)
+                rows.append((*civil_from_days(days), minute_of_day // 60, minute_of_day % 60))
+    return [row for row in rows if 1900 <= row[0] <= 2100]
+
+def test_batch_matches_scalar_at_solar_term_boundaries():
+    rows = _term_minutes((-1, 0, 1))
+    assert len(rows) > 201 * TERMS_PER_YEAR * 3 - 10
+    _compare(rows)
+
+def test_month_changes_at_term_instant():
+    table = get_solar_terms()
+    for year in (1900, 1984, 2024, 2100):
+        for term in range(0, TERMS_PER_YEAR, 2):
+            local_minute = (table.term_instant(year, term) + KST_OFFSET_SECONDS) // 60
+            # 절기 시각이 속한 분의 바로 전 분(경계 전)과 다음 분(경계 후)
+            rows = []
+            for minutes in (local_minute - 1, local_minute + 1):
+                days, minute_of_day = divmod(minutes, 1440)
+                rows.append((*civil_from_days(days), minute_of_day // 60, minute_of_day % 60))
+            month_before = calculate_pillars(*rows[0]).month_ji
+            month_after = calculate_pillars(*rows[1]).month_ji
+            assert month_after == (term // 2 + 1) % 12, (year, term, rows)
+            assert month_before == (month_after - 1) % 12, (year, term, rows)
+
+def test_batch_matches_scalar_hourly():
+    rows = []
+    for year in (1900, 1950, 2000, 2024, 2100):
+        ordinal = datetime.date(year, 1, 1).toordinal()
+        while datetime.date.fromordinal(ordinal).year == year:
+            date = datetime.date.fromordinal(ordinal)
+            rows.extend((year, date.month, date.day, hour, 30) for hour in range(24))
+            ordinal += 1
+    _compare(rows)
+
+def test_batch_rejects_invalid_row():
+    with pytest.raises(ValueError):
+        calculate_saju_pillars_batch([2023], [2], [29], [0], [0])
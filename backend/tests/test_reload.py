@@ -0,0 +1,72 @@
+# 데이터 파일 다시 읽기(rebuild_engine, gunicorn HUP) 테스트
+import os
+
+import pytest
+
+from logic import lunar_calendar, solar_terms
+from logic.analyzer import calculate_pillars
+from logic.chart_index import get_chart_index
+from logic.saju_analyzer import get_engine, rebuild_engine
+
+@pytest.fixture
+def table_env():
+    """테이블 경로 환경 변수를 바꿔 볼 수 있게 하고, 끝나면 원래 테이블로 엔진을 다시 만든다"""
+    saved = dict(os.environ)
+    yield os.environ
+    os.environ.clear()
+    os.environ.update(saved)
+    rebuild_engine()
+
+def _display_year_month(pillars):
+    chart = pillars.to_dict()
+    return chart['year']['gan'] + chart['year']['ji'], chart['month']['gan'] + chart['month']['ji']
+
+def _late_ipchun_table(tmp_path):
+    """2024년 입춘(2월 4일 17:27)을 이틀 늦춘 절기 테이블 파일"""
+    table = solar_terms.get_solar_terms()
+    instants = list(table.instants)
+    instants[(2024 - table.start_year) * solar_terms.TERMS_PER_YEAR + 2] += 2 * 86400
+    path = tmp_path / 'solar_terms.bin'
+    solar_terms.write_table(str(path), table.start_year, instants)
+    return path
+
+def test_rebuild_reopens_solar_terms(table_env, tmp_path):
+    path = _late_ipchun_table(tmp_path)
+    birth = (2024, 2, 5, 12, 0)
+    assert _display_year_month(get_engine().calculator.calculate_pillars(*birth)) == ('갑진', '병인')
+
+    table_env['SAJU_SOLAR_TERMS_PATH'] = str(path)
+    engine = rebuild_engine()
+    assert get_engine() is engine
+    assert solar_terms.get_solar_terms().path == str(path)
+    assert _display_year_month(engine.calculator.calculate_pillars(*birth)) == ('계묘', '을축')
+    assert _display_year_month(calculate_pillars(*birth)) == ('계묘', '을축')
+
+def test_rebuild_reopens_lunar_calendar(table_env, tmp_path):
+    # 모든 음력 달의 시작일을 하루 늦춘 테이블
+    calendar = lunar_calendar.get_lunar_calendar()
+    months = [
+        (calendar.start_days[i] + 1, calendar.years[i], calendar.months[i], bool(calendar.leaps[i]))
+        for i in range(calendar.count)
+    ]
+    path = tmp_path / 'lunar_months.bin'
+    lunar_calendar.write_table(str(path), months)
+    assert calendar.lunar_to_solar(1990, 5, 15) == (1990, 6, 7)
+
+    table_env['SAJU_LUNAR_TABLE_PATH'] = str(path)
+    engine = rebuild_engine()
+    assert lunar_calendar.get_lunar_calendar().lunar_to_solar(1990, 5, 15) == (1990, 6, 8)
+    assert engine.calculator.lunar_calendar.lunar_to_solar(1990, 5, 15) == (1990, 6, 8)
+
+def test_rebuild_resets_chart_index(table_env, tmp_path):
+    path = _late_ipchun_table(tmp_path)
+    old_index = get_chart_index()
+
+    table_env['SAJU_SOLAR_TERMS_PATH'] = str(path)
+    engine = rebuild_engine()
+    # 새 테이블에서만 나오는 팔자 (2024-02-05가 아직 계묘년 을축월)
+    pillars = engine.calculator.calculate_pillars(2024, 2, 5, 12, 0)
+    assert not old_index.occurs(pillars, 2024)
+    index = get_chart_index()
+    assert index is not old_index
+    assert index.occurs(pillars, 2024)
@@ -0,0 +1,84 @@
+# /analysis 스트리밍 응답(?stream=ndjson | sse) 테스트
+import json
+
+import pytest
+
+import main
+from logic.saju_analyzer import SajuAnalyzer, get_engine
+from logic.worker_pool import PoolBusy
+from main import app
+
+BIRTH = {'year': 1990, 'month': 5, 'day': 15, 'hour': 10, 'minute': 30}
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+def test_unknown_stream_format_is_400(client):
+    response = client.post('/analysis?stream=bogus', json=BIRTH)
+    assert response.status_code == 400
+    message = response.get_json()['message']
+    assert 'ndjson' in message and 'sse' in message
+
+def test_ndjson_stream(client):
+    response = client.post('/analysis?stream=ndjson', json=BIRTH)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert events[0]['section'] == 'saju_pillars'
+    assert 'lunar_date' in events[0]['data']
+    assert events[-1]['section'] == 'done'
+    assert events[-1]['data']['chart_key']
+
+def test_sse_stream_with_sections(client):
+    response = client.post('/analysis?stream=sse&sections=sipsung_analysis', json=BIRTH)
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    names = [line[len('event: '):] for line in response.get_data(as_text=True).splitlines() if line.startswith('event: ')]
+    assert names == ['sipsung_analysis', 'done']
+
+def test_accept_header_selects_stream(client):
+    response = client.post('/analysis', json=BIRTH, headers={'Accept': 'application/x-ndjson'})
+    assert response.mimetype == 'application/x-ndjson'
+
+class FakePool:
+    """분석 프로세스 풀 대신 별도 엔진(워커 프로세스 역할)으로 실행하는 풀"""
+
+    def __init__(self, busy=False):
+        self.busy = busy
+        self.calls = []
+        self.worker_engine = SajuAnalyzer()
+
+    def call(self, method, *args, timings=None):
+        if self.busy:
+            raise PoolBusy("full")
+        self.calls.append(method)
+        return getattr(self.worker_engine, method)(*args)
+
+@pytest.fixture
+def in_process_forbidden(monkeypatch):
+    """요청 처리 프로세스의 엔진으로 섹션을 계산하면 실패"""
+    def fail(*args, **kwargs):
+        raise AssertionError("streamed cache miss computed in-process")
+    monkeypatch.setattr(get_engine(), 'iter_sections', fail)
+
+def test_stream_cache_miss_uses_pool(client, monkeypatch, in_process_forbidden):
+    pool = FakePool()
+    monkeypatch.setattr(main, 'get_analysis_pool', lambda: pool)
+    birth = {'year': 1977, 'month': 3, 'day': 3, 'hour': 3, 'minute': 3}
+    response = client.post('/analysis?stream=ndjson', json=birth)
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert pool.calls == ['analyze']
+    assert [event['section'] for event in events][0] == 'saju_pillars'
+    assert events[-1]['section'] == 'done' and events[-1]['data']['chart_key']
+    assert 'error' not in [event['section'] for event in events]
+
+    # 풀이 계산한 전체 결과는 요청 처리 프로세스의 캐시에도 남음
+    assert get_engine().is_cached(1977, 3, 3, 3, 3)
+
+def test_stream_busy_pool_is_503(client, monkeypatch, in_process_forbidden):
+    monkeypatch.setattr(main, 'get_analysis_pool', lambda: FakePool(busy=True))
+    response = client.post('/analysis?stream=sse', json={'year': 1977, 'month': 4, 'day': 4, 'hour': 4, 'minute': 4})
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,69 @@
+# 응답 직렬화 시간 측정 스크립트
+#
+# 무작위 차트들의 전체 분석 결과(/analysis 응답 본문)를 여러 방식으로 인코딩해
+# 건당 평균 시간과 본문 크기를 비교한다.
+#   - flask: 기존 jsonify와 같은 설정 (ensure_ascii, sort_keys)
+#   - json: 표준 json, UTF-8 그대로
+#   - fragment: logic/serializer.py의 조각 인코더 (orjson이 없을 때의 경로)
+#   - orjson: orjson이 설치되어 있을 때만
+#
+#   python tools/bench_serializer.py [--charts 200] [--repeat 20] [--seed 1]
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import serializer
+from logic.saju_analyzer import get_engine
+
+def build_payloads(count, seed):
+    """무작위 출생 정보 count개의 /analysis 응답 본문"""
+    from main import to_display_result
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(count):
+        result = get_engine().analyze(rng.randint(1900, 2100), rng.randint(1, 12), rng.randint(1, 28),
+                                      rng.randint(0, 23), rng.randint(0, 59))
+        payloads.append({"status": "success", "analysis_result": to_display_result(result)})
+    return payloads
+
+def measure(encode, payloads, repeat):
+    """건당 평균 인코딩 시간(마이크로초)과 평균 본문 크기(바이트)"""
+    size = sum(len(encode(payload)) for payload in payloads) / len(payloads)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            encode(payload)
+    elapsed = time.perf_counter() - started
+    return elapsed / (repeat * len(payloads)) * 1e6, size
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="응답 직렬화 시간 측정")
+    parser.add_argument('--charts', type=int, default=200, help="측정할 차트 수 (기본 200)")
+    parser.add_argument('--repeat', type=int, default=20, help="반복 횟수 (기본 20)")
+    parser.add_argument('--seed', type=int, default=1, help="난수 시드 (기본 1)")
+    args = parser.parse_args(argv)
+
+    payloads = build_payloads(args.charts, args.seed)
+    fragment_encoder = serializer.FragmentEncoder()
+    encoders = [
+        ('flask', lambda payload: json.dumps(payload, ensure_ascii=True, sort_keys=True).encode()),
+        ('json', lambda payload: json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode()),
+        ('fragment', fragment_encoder.encode),
+    ]
+    if serializer.orjson is not None:
+        encoders.append(('orjson', serializer.dumps))
+
+    print(f"차트 {args.charts}개 x {args.repeat}회, 기본 경로: {serializer.ENCODER_NAME}")
+    for name, encode in encoders:
+        per_call, size = measure(encode, payloads, args.repeat)
+        print(f"  {name:<9} {per_call:8.1f} us/건  {size:8.0f} 바이트")
+    print(f"  조각 캐시: {fragment_encoder.fragment_count()}개")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# 음력 테이블 생성 스크립트
+#
+# 한국 음력 규칙으로 음력 달 시작일 테이블(data/lunar_months.bin)을 만든다.
+#   - 합삭(新月)이 든 날(한국 표준시)이 그 달의 초하루
+#   - 동지가 든 달이 11월
+#   - 동지~다음 동지 사이에 달이 13개이면 중기(中氣)가 없는 첫 달이 윤달
+# 합삭 시각은 Meeus "Astronomical Algorithms" 49장, 중기 시각은
+# build_solar_terms.py의 태양 황경 계산을 그대로 사용한다.
+#
+#   python tools/build_lunar_calendar.py [--start 1900] [--end 2100] [--output PATH]
+import argparse
+import math
+import os
+import sys
+import time
+from bisect import bisect_right
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.lunar_calendar import DEFAULT_TABLE_PATH, FORMAT_VERSION, LunarCalendar, write_table
+from logic.solar_terms import KST_OFFSET_SECONDS, days_from_civil, civil_from_days
+from tools.build_solar_terms import UNIX_EPOCH_JD, delta_t_seconds, solar_term_utc_seconds
+
+# 합삭 보정항 (Meeus 49장): (계수, E의 차수, M 배수, M' 배수, F 배수)
+NEW_MOON_TERMS = (
+    (-0.40720, 0, 0, 1, 0), (0.17241, 1, 1, 0, 0), (0.01608, 0, 0, 2, 0),
+    (0.01039, 0, 0, 0, 2), (0.00739, 1, -1, 1, 0), (-0.00514, 1, 1, 1, 0),
+    (0.00208, 2, 2, 0, 0), (-0.00111, 0, 0, 1, -2), (-0.00057, 0, 0, 1, 2),
+    (0.00056, 1, 1, 2, 0), (-0.00042, 0, 0, 3, 0), (0.00042, 1, 1, 0, 2),
+    (0.00038, 1, 1, 0, -2), (-0.00024, 1, -1, 2, 0), (-0.00007, 0, 2, 1, 0),
+    (0.00004, 0, 0, 2, -2), (0.00004, 0, 3, 0, 0), (0.00003, 0, 1, 1, -2),
+    (0.00003, 0, 0, 2, 2), (-0.00003, 0, 1, 1, 2), (0.00003, 0, -1, 1, 2),
+    (-0.00002, 0, -1, 1, -2), (-0.00002, 0, 1, 3, 0), (0.00002, 0, 0, 4, 0),
+)
+# 행성 섭동 보정항: (계수, 상수, k 계수)
+PLANETARY_TERMS = (
+    (0.000325, 299.77, 0.107408), (0.000165, 251.88, 0.016321), (0.000164, 251.83, 26.651886),
+    (0.000126, 349.42, 36.412478), (0.000110, 84.66, 18.206239), (0.000062, 141.74, 53.303771),
+    (0.000060, 207.14, 2.453732), (0.000056, 154.84, 7.306860), (0.000047, 34.52, 27.261239),
+    (0.000042, 207.19, 0.121824), (0.000040, 291.34, 1.844379), (0.000037, 161.72, 24.198154),
+    (0.000035, 239.56, 25.513099), (0.000023, 331.55, 3.592518),
+)
+
+def new_moon_jde(k):
+    """k번째 합삭(2000년 1월 6일 합삭이 k=0)의 역학시 율리우스일"""
+    t = k / 1236.85
+    jde = (2451550.09766 + 29.530588861 * k + 0.00015437 * t ** 2
+           - 0.000000150 * t ** 3 + 0.00000000073 * t ** 4)
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+    sun = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3)
+    moon = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * t ** 2
+                        + 0.00001238 * t ** 3 - 0.000000058 * t ** 4)
+    latitude = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * t ** 2
+                            - 0.00000227 * t ** 3 + 0.000000011 * t ** 4)
+    node = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3)
+
+    for coefficient, e_power, m, m_moon, f in NEW_MOON_TERMS:
+        jde += coefficient * e ** e_power * math.sin(m * sun + m_moon * moon + f * latitude)
+    jde += -0.00017 * math.sin(node)
+    for index, (coefficient, constant, rate) in enumerate(PLANETARY_TERMS):
+        angle = constant + rate * k - (0.009173 * t ** 2 if index == 0 else 0)
+        jde += coefficient * math.sin(math.radians(angle))
+    return jde
+
+# 1912년 이전 역서(시헌력)는 동경 120도(UTC+8) 기준으로 날짜를 정함
+KST_1912_SECONDS = days_from_civil(1912, 1, 1) * 86400 - KST_OFFSET_SECONDS
+EARLY_OFFSET_SECONDS = 8 * 3600
+
+def kst_day(utc_seconds):
+    """UTC epoch 초가 속한 한국 표준시 날짜 (1970-01-01 기준 일수)"""
+    offset = KST_OFFSET_SECONDS if utc_seconds >= KST_1912_SECONDS else EARLY_OFFSET_SECONDS
+    return (utc_seconds + offset) // 86400
+
+def new_moon_day(k):
+    """k번째 합삭이 든 날 (한국 표준시)"""
+    jde = new_moon_jde(k)
+    year = 2000 + k / 12.3685
+    return kst_day(round((jde - UNIX_EPOCH_JD) * 86400.0 - delta_t_seconds(year)))
+
+def build_months(start_year, end_year):
+    """start_year-01-01 ~ end_year-12-31을 덮는 음력 달 목록과 범위 끝 항목"""
+    # 앞뒤로 한 해씩 여유를 두고 합삭일과 중기일을 계산
+    first_k = math.floor((start_year - 2 - 2000) * 12.3685)
+    last_k = math.ceil((end_year + 2 - 2000) * 12.3685)
+    starts = [new_moon_day(k) for k in range(first_k, last_k + 1)]
+    principal_days = sorted(
+        kst_day(solar_term_utc_seconds(year, term))
+        for year in range(start_year - 2, end_year + 2)
+        for term in range(1, 24, 2)
+    )
+
+    def has_principal_term(index):
+        position = bisect_right(principal_days, starts[index] - 1)
+        return position < len(principal_days) and principal_days[position] < starts[index + 1]
+
+    # 동지(term 23)가 든 달 = 11월
+    eleventh = {
+        year: bisect_right(starts, kst_day(solar_term_utc_seconds(year, 23))) - 1
+        for year in range(start_year - 2, end_year + 2)
+    }
+
+    months = []
+    for year in range(start_year - 1, end_year + 2):
+        begin, end = eleventh[year - 1], eleventh[year]
+        leap_index = None
+        if end - begin == 13:
+            leap_index = next(i for i in range(begin + 1, end) if not has_principal_term(i))
+        number = 11
+        for index in range(begin, end):
+            is_leap = index == leap_index
+            if index > begin and not is_leap:
+                number = number % 12 + 1
+            months.append((starts[index], year - 1 if number >= 11 else year, number, is_leap))
+
+    # 요청 범위와 겹치는 달만 남기고, 범위 끝을 나타내는 다음 달을 하나 덧붙임
+    first_day = days_from_civil(start_year, 1, 1)
+    last_day = days_from_civil(end_year, 12, 31)
+    first = bisect_right([m[0] for m in months], first_day) - 1
+    last = bisect_right([m[0] for m in months], last_day) - 1
+    return months[first:last + 2]
+
+# 공개된 음력 기준일: 설날(음력 1월 1일)과 윤달
+REFERENCE_NEW_YEARS = ((2023, (2023, 1, 22)), (2024, (2024, 2, 10)), (2025, (2025, 1, 29)))
+REFERENCE_LEAP_MONTHS = ((2020, 4), (2023, 2), (2025, 6))
+
+def verify(months):
+    """기준일 비교와 달 길이 점검, 문제 목록을 반환"""
+    problems = []
+    by_key = {(year, month, is_leap): start for start, year, month, is_leap in months}
+    for year, expected in REFERENCE_NEW_YEARS:
+        actual = civil_from_days(by_key[(year, 1, False)]) if (year, 1, False) in by_key else None
+        status = 'ok' if actual == expected else 'FAIL'
+        print(f"  {year}년 설날: 기준 {expected}, 계산 {actual} [{status}]")
+        if status != 'ok':
+            problems.append(f"{year}년 설날 {actual} != {expected}")
+    for year, month in REFERENCE_LEAP_MONTHS:
+        leaps = [m for (y, m, is_leap) in by_key if y == year and is_leap]
+        status = 'ok' if leaps == [month] else 'FAIL'
+        print(f"  {year}년 윤달: 기준 윤{month}월, 계산 {leaps} [{status}]")
+        if status != 'ok':
+            problems.append(f"{year}년 윤달 {leaps} != [{month}]")
+    for index in range(1, len(months)):
+        length = months[index][0] - months[index - 1][0]
+        if length not in (29, 30):
+            problems.append(f"{months[index - 1][1]}년 {months[index - 1][2]}월 길이 {length}일")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="음력 달 시작일 테이블 생성")
+    parser.add_argument('--start', type=int, default=1900, help="시작 연도 (양력, 기본 1900)")
+    parser.add_argument('--end', type=int, default=2100, help="끝 연도 (양력, 기본 2100)")
+    parser.add_argument('--output', default=DEFAULT_TABLE_PATH, help="출력 파일 경로")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    months = build_months(args.start, args.end)
+    elapsed = time.perf_counter() - started
+    print(f"{args.start}~{args.end}년 음력 {len(months) - 1}개월 계산: {elapsed:.2f}초")
+
+    problems = verify(months)
+    if problems:
+        print("검증 실패, 파일을 저장하지 않습니다:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+
+    write_table(args.output, months)
+    LunarCalendar(args.output)
+    print(f"{args.output} 저장 (형식 버전 {FORMAT_VERSION}, {os.path.getsize(args.output)} 바이트)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
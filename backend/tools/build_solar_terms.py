@@ -0,0 +1,248 @@
+# 절기 테이블 생성 스크립트
+#
+# 태양의 겉보기 황경(VSOP87 축약 급수 + 장동 + 광행차, Meeus "Astronomical
+# Algorithms" 25/32장)이 15도의 배수가 되는 시각을 뉴턴 반복으로 구해
+# data/solar_terms.bin 으로 저장한다. 서버는 이 파일을 읽기만 한다.
+# 연도별 계산은 서로 독립이므로 여러 프로세스에 나누어 수행하고, 저장 전에
+# 공개된 기준 시각과 비교해 오차가 허용 범위를 넘으면 파일을 쓰지 않는다.
+#
+#   python tools/build_solar_terms.py [--start 1899] [--end 2100] [--workers N] [--output PATH]
+import argparse
+import datetime
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.solar_terms import (
+    DEFAULT_TABLE_PATH, FORMAT_VERSION, TERM_LONGITUDES, TERM_NAMES, TERMS_PER_YEAR, write_table
+)
+
+# 지구 일심 황경 L의 VSOP87 축약 급수 (Meeus 표 32.A): (A, B, C) -> A * cos(B + C * tau)
+EARTH_L = (
+    (
+        (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+        (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+        (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+        (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+        (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+        (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+        (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+        (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+        (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+        (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+        (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+        (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+        (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+        (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+        (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+        (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+        (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+        (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+        (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+        (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+        (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+        (25, 3.16, 4690.48),
+    ),
+    (
+        (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+        (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+        (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+        (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+        (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+        (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+        (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+        (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+        (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+        (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+        (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+        (6, 4.67, 4690.48),
+    ),
+    (
+        (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+        (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+        (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+        (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+        (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+        (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+        (2, 4.38, 5223.69), (2, 3.75, 0.98),
+    ),
+    (
+        (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+        (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23),
+        (1, 5.97, 242.73),
+    ),
+    (
+        (114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15),
+    ),
+    (
+        (1, 3.14, 0),
+    ),
+)
+
+# 지구-태양 거리 R의 주요 항 (광행차 보정용)
+EARTH_R0 = ((100013989, 0, 0), (1670700, 3.0984635, 6283.07585), (13956, 3.05525, 12566.1517))
+
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+TROPICAL_YEAR = 365.2422
+
+def _series(terms, tau):
+    return sum(a * math.cos(b + c * tau) for a, b, c in terms)
+
+def apparent_solar_longitude(jde):
+    """역학시(TT) 율리우스일의 태양 겉보기 황경 (도)"""
+    tau = (jde - J2000) / 365250.0
+    earth_l = sum(_series(terms, tau) * tau ** power for power, terms in enumerate(EARTH_L)) / 1e8
+    radius = _series(EARTH_R0, tau) / 1e8
+
+    # 지심 황경 (FK5 보정 포함)
+    longitude = math.degrees(earth_l) + 180.0 - 0.09033 / 3600.0
+
+    # 장동 (주요 2항)과 광행차
+    t = tau * 10.0
+    omega = math.radians(125.04452 - 1934.136261 * t)
+    sun_mean = math.radians(280.4665 + 36000.7698 * t)
+    moon_mean = math.radians(218.3165 + 481267.8813 * t)
+    nutation = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * sun_mean)
+                - 0.23 * math.sin(2 * moon_mean) + 0.21 * math.sin(2 * omega))
+    aberration = -20.4898 / radius
+    return (longitude + (nutation + aberration) / 3600.0) % 360.0
+
+def delta_t_seconds(year):
+    """TT - UT 근사값 (Espenak & Meeus 다항식, 1600~2150년 구간별)"""
+    if year < 1600 or year >= 2150:
+        return -20 + 32 * ((year - 1820) / 100) ** 2
+    if year < 1700:
+        t = year - 1600
+        return 120 - 0.9808 * t - 0.01532 * t ** 2 + t ** 3 / 7129
+    if year < 1800:
+        t = year - 1700
+        return 8.83 + 0.1603 * t - 0.0059285 * t ** 2 + 0.00013336 * t ** 3 - t ** 4 / 1174000
+    if year < 1860:
+        t = year - 1800
+        return (13.72 - 0.332447 * t + 0.0068612 * t ** 2 + 0.0041116 * t ** 3 - 0.00037436 * t ** 4
+                + 0.0000121272 * t ** 5 - 0.0000001699 * t ** 6 + 0.000000000875 * t ** 7)
+    if year < 1900:
+        t = year - 1860
+        return (7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3
+                - 0.0004473624 * t ** 4 + t ** 5 / 233174)
+    if year < 1920:
+        t = year - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if year < 1941:
+        t = year - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if year < 1961:
+        t = year - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if year < 1986:
+        t = year - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if year < 2005:
+        t = year - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    return -20 + 32 * ((year - 1820) / 100) ** 2 - 0.5628 * (2150 - year)
+
+def solar_term_jde(year, term):
+    """year년 term번째 절기(0=소한)의 역학시 율리우스일"""
+    target = TERM_LONGITUDES[term]
+    # 소한(1월 초)을 기준으로 15도마다 약 15.2일씩 더한 값에서 시작
+    jde = J2000 + (year - 2000) * TROPICAL_YEAR + 5.0 + term * TROPICAL_YEAR / 24
+    for _ in range(50):
+        diff = (target - apparent_solar_longitude(jde) + 180.0) % 360.0 - 180.0
+        jde += diff * TROPICAL_YEAR / 360.0
+        if abs(diff) < 1e-9:
+            break
+    return jde
+
+def solar_term_utc_seconds(year, term):
+    """year년 term번째 절기의 UTC epoch 초"""
+    jde = solar_term_jde(year, term)
+    return round((jde - UNIX_EPOCH_JD) * 86400.0 - delta_t_seconds(year + term / TERMS_PER_YEAR))
+
+def year_instants(year):
+    """year년 24절기(소한~동지)의 UTC epoch 초 목록"""
+    return [solar_term_utc_seconds(year, term) for term in range(TERMS_PER_YEAR)]
+
+def build_instants(start_year, end_year, workers=None):
+    """start_year~end_year의 연도별 24절기 시각 (연도 단위로 병렬 계산)"""
+    years = range(start_year, end_year + 1)
+    if workers == 1:
+        per_year = [year_instants(year) for year in years]
+    else:
+        with Pool(workers) as pool:
+            per_year = pool.map(year_instants, years, chunksize=8)
+    return [instant for instants in per_year for instant in instants]
+
+# 공개된 기준 시각 (UTC, 분 단위): (연도, 절기 인덱스, 'YYYY-MM-DD HH:MM')
+REFERENCE_INSTANTS = (
+    (2000, 5, '2000-03-20 07:35'), (2000, 11, '2000-06-21 01:48'),
+    (2000, 17, '2000-09-22 17:28'), (2000, 23, '2000-12-21 13:37'),
+    (2024, 2, '2024-02-04 08:27'), (2024, 5, '2024-03-20 03:06'),
+    (2024, 11, '2024-06-20 20:51'), (2024, 17, '2024-09-22 12:44'),
+    (2024, 23, '2024-12-21 09:21'),
+)
+REFERENCE_TOLERANCE_SECONDS = 120
+
+def verify(start_year, instants):
+    """기준 시각 비교와 절기 간격 점검, 문제 목록을 반환"""
+    problems = []
+    for year, term, expected in REFERENCE_INSTANTS:
+        if not start_year <= year < start_year + len(instants) // TERMS_PER_YEAR:
+            continue
+        actual = instants[(year - start_year) * TERMS_PER_YEAR + term]
+        expected_seconds = int(
+            datetime.datetime.strptime(expected, '%Y-%m-%d %H:%M')
+            .replace(tzinfo=datetime.timezone.utc).timestamp()
+        )
+        error = actual - expected_seconds
+        status = 'ok' if abs(error) <= REFERENCE_TOLERANCE_SECONDS else 'FAIL'
+        print(f"  {year} {TERM_NAMES[term]}: 기준 {expected} UTC, 오차 {error:+d}초 [{status}]")
+        if status != 'ok':
+            problems.append(f"{year} {TERM_NAMES[term]} 오차 {error:+d}초")
+
+    # 이웃한 절기는 항상 14~16.5일 간격
+    for index in range(1, len(instants)):
+        gap_days = (instants[index] - instants[index - 1]) / 86400
+        if not 14.0 < gap_days < 16.5:
+            year, term = divmod(index, TERMS_PER_YEAR)
+            problems.append(f"{start_year + year} {TERM_NAMES[term]} 직전 절기와의 간격 {gap_days:.2f}일")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="24절기 시각 테이블 생성")
+    # 1900년 1월의 월주(대설/동지 이후)를 위해 기본 범위는 1899년부터
+    parser.add_argument('--start', type=int, default=1899, help="시작 연도 (기본 1899)")
+    parser.add_argument('--end', type=int, default=2100, help="끝 연도 (기본 2100)")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--output', default=DEFAULT_TABLE_PATH, help="출력 파일 경로")
+    args = parser.parse_args(argv)
+    if args.start > args.end:
+        parser.error("--start는 --end보다 클 수 없습니다.")
+
+    started = time.perf_counter()
+    instants = build_instants(args.start, args.end, args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"{args.start}~{args.end}년 {len(instants)}개 절기 계산: {elapsed:.2f}초 (workers={args.workers or os.cpu_count()})")
+
+    problems = verify(args.start, instants)
+    if problems:
+        print("검증 실패, 파일을 저장하지 않습니다:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+
+    write_table(args.output, args.start, instants)
+    print(f"{args.output} 저장 (형식 버전 {FORMAT_VERSION}, {os.path.getsize(args.output)} 바이트)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,68 @@
 // API 통신 모듈
 import { CONFIG } from './config.js';
 
+// 출생 정보 -> 차트 키 (localStorage)
+const CHART_KEY_STORAGE = 'sajuChartKeys';
+
 export class SajuAPI {
+    static requestBody(birthData) {
+        return JSON.stringify({
+            year: parseInt(birthData.year),
+            month: parseInt(birthData.month),
+            day: parseInt(birthData.day),
+            hour: parseInt(birthData.hour),
+            minute: parseInt(birthData.minute),
+            calendar: birthData.calendar || 'solar',
+            is_leap_month: !!birthData.isLeapMonth
+        });
+    }
+
+    // 분석 응답의 chart_key를 기억 (다음 조회는 GET /analysis/<차트 키>)
+    static rememberChartKey(birthData, chartKey) {
+        if (!chartKey) return;
+        try {
+            const keys = JSON.parse(localStorage.getItem(CHART_KEY_STORAGE) || '{}');
+            keys[SajuAPI.requestBody(birthData)] = chartKey;
+            localStorage.setItem(CHART_KEY_STORAGE, JSON.stringify(keys));
+        } catch {
+            // 저장소를 쓸 수 없으면 매번 POST로 분석
+        }
+    }
+
+    static knownChartKey(birthData) {
+        try {
+            return JSON.parse(localStorage.getItem(CHART_KEY_STORAGE) || '{}')[SajuAPI.requestBody(birthData)] || null;
+        } catch {
+            return null;
+        }
+    }
+
+    // 이전에 분석한 출생 정보면 차트 키 URL로 조회 (브라우저 캐시/ETag 재검증 사용)
+    // 키를 모르거나 만료되었으면 null
+    static async analyzeByChartKey(birthData) {
+        const chartKey = SajuAPI.knownChartKey(birthData);
+        if (!chartKey) return null;
+        try {
+            const response = await fetch(`${CONFIG.API_URL}/${chartKey}`);
+            if (!response.ok) return null;
+            const data = await response.json();
+            return data.status === 'success' ? data.analysis_result : null;
+        } catch {
+            return null;
+        }
+    }
+
     static async analyze(birthData) {
+        const cached = await SajuAPI.analyzeByChartKey(birthData);
+        if (cached) return cached;
+
         try {
             const response = await fetch(CONFIG.API_URL, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
                 },
-                body: JSON.stringify({
-                    year: parseInt(birthData.year),
-                    month: parseInt(birthData.month),
-                    day: parseInt(birthData.day),
-                    hour: parseInt(birthData.hour),
-                    minute: parseInt(birthData.minute)
-                })
+                body: SajuAPI.requestBody(birthData)
             });
 
             if (!response.ok) {
@@ -28,6 +75,7 @@ export class SajuAPI {
                 throw new Error(data.message || '분석 실패');
             }
 
+            SajuAPI.rememberChartKey(birthData, data.chart_key);
             return data.analysis_result || data.result;
             
         } catch (error) {
@@ -39,6 +87,65 @@ export class SajuAPI {
         }
     }
     
+    // 스트리밍 분석: 섹션이 도착할 때마다 onSection(key, result)을 호출하고 전체 결과를 반환
+    static async analyzeStream(birthData, onSection) {
+        try {
+            const response = await fetch(`${CONFIG.API_URL}?stream=ndjson`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/x-ndjson'
+                },
+                body: SajuAPI.requestBody(birthData)
+            });
+
+            if (!response.ok) {
+                const data = await response.json().catch(() => ({}));
+                throw new Error(data.message || `HTTP error! status: ${response.status}`);
+            }
+
+            const result = {};
+            const handleLine = (line) => {
+                if (!line.trim()) return;
+                const event = JSON.parse(line);
+                if (event.section === 'error') throw new Error(event.data || '분석 실패');
+                if (event.section === 'done') {
+                    if (event.data) SajuAPI.rememberChartKey(birthData, event.data.chart_key);
+                    return;
+                }
+                result[event.section] = event.data;
+                onSection(event.section, result);
+            };
+
+            // 스트림을 지원하지 않는 브라우저는 전체 본문을 한 번에 처리
+            if (!response.body || !response.body.getReader) {
+                (await response.text()).split('\n').forEach(handleLine);
+                return result;
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { done, value } = await reader.read();
+                buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.forEach(handleLine);
+                if (done) break;
+            }
+            handleLine(buffer);
+            return result;
+
+        } catch (error) {
+            console.error('API 호출 오류:', error);
+            throw {
+                message: '서버 연결 오류',
+                detail: error.message
+            };
+        }
+    }
+    
     static async checkHealth() {
         try {
             const response = await fetch(CONFIG.API_URL.replace('/analysis', '/health'));
@@ -9,6 +9,18 @@ import { HealthDisplay } from './health-display.js';
 import { DaeunDisplay } from './daeun-display.js';
 import { ComprehensiveDisplay } from './comprehensive-display.js';
 
+// 스트리밍 응답의 섹션 키 -> 그 섹션이 도착하면 그릴 수 있는 디스플레이
+const SECTION_DISPLAYS = {
+    sipsung_analysis: ['sipsung'],
+    sibiunseong_analysis: ['sibiunseong'],
+    career_luck_analysis: ['career'],
+    love_luck_analysis: ['love'],
+    wealth_luck_analysis: ['wealth'],
+    health_luck_analysis: ['health'],
+    daeun_analysis: ['daeun'],
+    comprehensive_report: ['ilju', 'comprehensive']
+};
+
 export class DisplayManager {
     constructor() {
         this.displays = {
@@ -31,6 +43,13 @@ export class DisplayManager {
         });
     }
     
+    displaySection(section, data) {
+        // 도착한 섹션에 해당하는 디스플레이만 표시
+        (SECTION_DISPLAYS[section] || []).forEach(name => {
+            this.displays[name].display(data);
+        });
+    }
+    
     clearAll() {
         // 모든 섹션 초기화
         Object.values(this.displays).forEach(display => {
@@ -41,7 +41,7 @@ export class FormValidator {
         }
         
         // 일 범위 검사
-        const maxDays = this.getDaysInMonth(year, month);
+        const maxDays = birthData.calendar === 'lunar' ? 30 : this.getDaysInMonth(year, month);
         if (day < 1 || day > maxDays) {
             return {
                 isValid: false,
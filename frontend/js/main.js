@@ -43,7 +43,9 @@ class SajuApp {
             month: Utils.getElement('month')?.value,
             day: Utils.getElement('day')?.value,
             hour: Utils.getElement('hour')?.value,
-            minute: Utils.getElement('minute')?.value
+            minute: Utils.getElement('minute')?.value,
+            calendar: Utils.getElement('calendar')?.value,
+            isLeapMonth: Utils.getElement('is-leap-month')?.checked
         };
         
         // 유효성 검사
@@ -61,12 +63,22 @@ class SajuApp {
         this.displayManager.clearAll();
         
         try {
-            // API 호출
-            const result = await SajuAPI.analyze(birthData);
-            
-            // 결과 표시
-            statusDiv.innerHTML = '';
-            this.displayManager.displayAll(result);
+            // 이전에 본 출생 정보면 차트 키 URL로 조회 (브라우저 캐시에서 바로 표시)
+            const cached = await SajuAPI.analyzeByChartKey(birthData);
+            if (cached) {
+                statusDiv.innerHTML = '';
+                this.displayManager.displayAll(cached);
+            } else {
+                // 스트리밍 API 호출 (섹션이 도착하는 대로 표시)
+                let firstSection = true;
+                await SajuAPI.analyzeStream(birthData, (section, result) => {
+                    if (firstSection) {
+                        statusDiv.innerHTML = '';
+                        firstSection = false;
+                    }
+                    this.displayManager.displaySection(section, result);
+                });
+            }
             
             // 첫 번째 섹션으로 스크롤
             setTimeout(() => {
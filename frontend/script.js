@@ -40,24 +40,104 @@ const { CONFIG, Utils, SajuAPI, FormValidator, BaseDisplay, DisplayManager } = (
         }
     };
 
-    // API 통신
+    // API 통신 (출생 정보 -> 차트 키는 localStorage에 기억)
+    const CHART_KEY_STORAGE = 'sajuChartKeys';
     const SajuAPI = class {
+        static requestBody(birthData) {
+            return JSON.stringify({
+                ...Object.fromEntries(['year', 'month', 'day', 'hour', 'minute'].map(k => [k, parseInt(birthData[k])])),
+                calendar: birthData.calendar || 'solar',
+                is_leap_month: !!birthData.isLeapMonth
+            });
+        }
+        static rememberChartKey(birthData, chartKey) {
+            if (!chartKey) return;
+            try {
+                const keys = JSON.parse(localStorage.getItem(CHART_KEY_STORAGE) || '{}');
+                keys[SajuAPI.requestBody(birthData)] = chartKey;
+                localStorage.setItem(CHART_KEY_STORAGE, JSON.stringify(keys));
+            } catch { /* 저장소를 쓸 수 없으면 매번 POST */ }
+        }
+        static knownChartKey(birthData) {
+            try { return JSON.parse(localStorage.getItem(CHART_KEY_STORAGE) || '{}')[SajuAPI.requestBody(birthData)] || null; }
+            catch { return null; }
+        }
+        // 이전에 분석한 출생 정보면 GET /analysis/<차트 키> (브라우저 캐시/ETag 재검증), 아니면 null
+        static async analyzeByChartKey(birthData) {
+            const chartKey = SajuAPI.knownChartKey(birthData);
+            if (!chartKey) return null;
+            try {
+                const res = await fetch(`${CONFIG.API_URL}/${chartKey}`);
+                if (!res.ok) return null;
+                const data = await res.json();
+                return data.status === 'success' ? data.analysis_result : null;
+            } catch { return null; }
+        }
         static async analyze(birthData) {
+            const cached = await SajuAPI.analyzeByChartKey(birthData);
+            if (cached) return cached;
             try {
                 const res = await fetch(CONFIG.API_URL, {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(Object.fromEntries(Object.entries(birthData).map(([k, v]) => [k, parseInt(v)])))
+                    body: SajuAPI.requestBody(birthData)
                 });
                 if (!res.ok) throw new Error(`HTTP error! status: ${res.status}`);
                 const data = await res.json();
                 if (data.status === 'error') throw new Error(data.message);
+                SajuAPI.rememberChartKey(birthData, data.chart_key);
                 return data.analysis_result || data.result;
             } catch (error) {
                 console.error('API 호출 오류:', error);
                 throw { message: '서버 연결 오류', detail: error.message };
             }
         }
+        // 스트리밍 분석 (NDJSON): 섹션이 도착할 때마다 onSection(key, result) 호출
+        static async analyzeStream(birthData, onSection) {
+            try {
+                const res = await fetch(`${CONFIG.API_URL}?stream=ndjson`, {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json', 'Accept': 'application/x-ndjson' },
+                    body: SajuAPI.requestBody(birthData)
+                });
+                if (!res.ok) {
+                    const data = await res.json().catch(() => ({}));
+                    throw new Error(data.message || `HTTP error! status: ${res.status}`);
+                }
+                const result = {};
+                const handleLine = line => {
+                    if (!line.trim()) return;
+                    const event = JSON.parse(line);
+                    if (event.section === 'error') throw new Error(event.data);
+                    if (event.section === 'done') {
+                        if (event.data) SajuAPI.rememberChartKey(birthData, event.data.chart_key);
+                        return;
+                    }
+                    result[event.section] = event.data;
+                    onSection(event.section, result);
+                };
+                if (!res.body || !res.body.getReader) {
+                    (await res.text()).split('\n').forEach(handleLine);
+                    return result;
+                }
+                const reader = res.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const { done, value } = await reader.read();
+                    buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+                    const lines = buffer.split('\n');
+                    buffer = lines.pop();
+                    lines.forEach(handleLine);
+                    if (done) break;
+                }
+                handleLine(buffer);
+                return result;
+            } catch (error) {
+                console.error('API 호출 오류:', error);
+                throw { message: '서버 연결 오류', detail: error.message };
+            }
+        }
     };
     
     // 폼 유효성 검사
@@ -70,7 +150,7 @@ const { CONFIG, Utils, SajuAPI, FormValidator, BaseDisplay, DisplayManager } = (
                 if (isNaN(val)) return { isValid: false, message: '올바른 숫자 형식으로 입력해주세요.'};
                 if (field === 'year' && (val < 1900 || val > new Date().getFullYear())) return { isValid: false, message: `연도는 1900년부터 ${new Date().getFullYear()}년 사이로 입력해주세요.` };
                 if (field === 'month' && (val < 1 || val > 12)) return { isValid: false, message: '월은 1부터 12 사이로 입력해주세요.'};
-                if (field === 'day' && (val < 1 || val > new Date(data.year, data.month, 0).getDate())) return { isValid: false, message: '유효하지 않은 날짜입니다.'};
+                if (field === 'day' && (val < 1 || val > (data.calendar === 'lunar' ? 30 : new Date(data.year, data.month, 0).getDate()))) return { isValid: false, message: '유효하지 않은 날짜입니다.'};
                 if (field === 'hour' && (val < 0 || val > 23)) return { isValid: false, message: '시간은 0부터 23 사이로 입력해주세요.'};
                 if (field === 'minute' && (val < 0 || val > 59)) return { isValid: false, message: '분은 0부터 59 사이로 입력해주세요.'};
             }
@@ -152,6 +232,11 @@ const { CONFIG, Utils, SajuAPI, FormValidator, BaseDisplay, DisplayManager } = (
             };
         }
         displayAll(data) { Object.values(this.displays).forEach(d => d.display(data)); }
+        // 스트리밍으로 도착한 섹션에 해당하는 디스플레이만 표시
+        displaySection(section, data) {
+            const names = { ilju_analysis: 'ilju', sipsung_analysis: 'sipsung', comprehensive_report: 'comprehensive' };
+            if (names[section]) this.displays[names[section]].display(data);
+        }
         clearAll() { Object.values(this.displays).forEach(d => d.clear()); }
     };
     
@@ -176,7 +261,9 @@ class SajuAppMain {
             month: Utils.getElement('month')?.value,
             day: Utils.getElement('day')?.value,
             hour: Utils.getElement('hour')?.value,
-            minute: Utils.getElement('minute')?.value
+            minute: Utils.getElement('minute')?.value,
+            calendar: Utils.getElement('calendar')?.value,
+            isLeapMonth: Utils.getElement('is-leap-month')?.checked
         };
         
         const validation = this.validator.validate(birthData);
@@ -191,8 +278,19 @@ class SajuAppMain {
         if(statusDiv) statusDiv.innerHTML = '';
 
         try {
-            const result = await SajuAPI.analyze(birthData);
-            this.displayManager.displayAll(result);
+            const cached = await SajuAPI.analyzeByChartKey(birthData);
+            if (cached) {
+                this.displayManager.displayAll(cached);
+            } else {
+                let firstSection = true;
+                await SajuAPI.analyzeStream(birthData, (section, result) => {
+                    if (firstSection) {
+                        Utils.showSkeleton(false);
+                        firstSection = false;
+                    }
+                    this.displayManager.displaySection(section, result);
+                });
+            }
             Utils.scrollToElement('ilju-analysis');
         } catch (error) {
             Utils.showError(statusDiv, error);